@@ -1 +1,57 @@
-# Algorithms subpackage (placeholder)
+"""Equation generators and solvers built on top of the input payloads."""
+
+from .condensable import (
+    AlgebraCandidate,
+    condensable_candidates_payload,
+    find_condensable_candidates,
+    iter_condensable_candidates,
+)
+from .condensed import CondensationEngine, CondensedPhase, InductionTables
+from .dimensions import Dimensions, fill_dimensions, quantum_dimensions
+from .drinfeld import (
+    DrinfeldCenter,
+    drinfeld_center,
+    drinfeld_center_payload,
+    write_drinfeld_center,
+)
+from .equations import EquationChunk, tally_equation_chunks
+from .fusion_ring import FusionRing
+from .groups import FiniteGroup
+from .hexagon import check_hexagon_payload, hexagon_equation_chunks
+from .pentagon import check_pentagon_payload, pentagon_equation_chunks
+from .ring_checks import check_fusion_payload, check_fusion_ring
+from .symbols import SymbolTable, f_symbol_table, r_symbol_table
+from .verlinde import check_verlinde, check_verlinde_payload, verlinde_fusion_ring
+
+__all__ = [
+    "AlgebraCandidate",
+    "CondensationEngine",
+    "CondensedPhase",
+    "Dimensions",
+    "DrinfeldCenter",
+    "EquationChunk",
+    "FiniteGroup",
+    "FusionRing",
+    "InductionTables",
+    "SymbolTable",
+    "check_fusion_payload",
+    "check_fusion_ring",
+    "check_hexagon_payload",
+    "check_pentagon_payload",
+    "check_verlinde",
+    "check_verlinde_payload",
+    "condensable_candidates_payload",
+    "drinfeld_center",
+    "drinfeld_center_payload",
+    "f_symbol_table",
+    "fill_dimensions",
+    "find_condensable_candidates",
+    "hexagon_equation_chunks",
+    "iter_condensable_candidates",
+    "pentagon_equation_chunks",
+    "quantum_dimensions",
+    "r_symbol_table",
+    "tally_equation_chunks",
+    "verlinde_fusion_ring",
+    "write_drinfeld_center",
+]
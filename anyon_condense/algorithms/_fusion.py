@@ -0,0 +1,169 @@
+"""Internal helpers shared by the equation engines: labels, admissibility, CSR."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .fusion_ring import FusionRing
+
+try:  # NumPy is required by the engines; imported lazily for a clean error
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    _np = None  # type: ignore[assignment]
+
+Rows = Dict[str, Any]
+
+
+def require_numpy(feature: str) -> None:
+    if _np is None:
+        raise ImportError(f"{feature} requires numpy")
+
+
+def split_key(key: str, arity: int) -> List[str]:
+    """Split ``"(a,b)"`` / ``"(a,b,c,d;e,f)"`` into its labels."""
+
+    if not (key.startswith("(") and key.endswith(")")):
+        raise ValueError(f"Malformed key {key!r}: expected '(...)'")
+    parts = [part.strip() for part in key[1:-1].replace(";", ",").split(",")]
+    if len(parts) != arity or not all(parts):
+        raise ValueError(f"Malformed key {key!r}: expected {arity} labels")
+    return parts
+
+
+def parse_scalar(value: Any, where: str) -> complex:
+    """Read a number (including ``complex``) or ``[re, im]`` pair as a complex value."""
+
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid value at {where}: {value!r}")
+    if isinstance(value, (int, float, complex)):
+        return complex(value)
+    if (
+        isinstance(value, (list, tuple))
+        and len(value) == 2
+        and all(
+            isinstance(part, (int, float)) and not isinstance(part, bool)
+            for part in value
+        )
+    ):
+        return complex(value[0], value[1])
+    raise ValueError(f"Invalid value at {where}: expected number or [re, im]")
+
+
+def format_scalar(value: complex) -> Any:
+    """JSON scalar: a float when real, else complex text such as ``"0.5-1j"``."""
+
+    value = complex(value.real + 0.0, value.imag + 0.0)  # drop negative zeros
+    if value.imag == 0.0:
+        return value.real
+    return repr(value).strip("()")
+
+
+class FusionTable:
+    """Multiplicity-free view of a :class:`~.fusion_ring.FusionRing` for joins.
+
+    The admissible triples ``X, Y, Z`` (``c`` occurs in ``a ⊗ b``) are sorted
+    so that all ``(b, c)`` for a given ``a`` (``by_first``) and all ``c`` for a
+    given pair ``(a, b)`` (``by_pair``, the ring's CSR ``indptr``) are
+    contiguous. Nothing of size ``rank**3`` is built: :meth:`admissible`
+    binary-searches the sorted triples.
+    """
+
+    def __init__(self, ring: "FusionRing") -> None:
+        if not ring.multiplicity_free:
+            raise ValueError("only multiplicity-free fusion rules are supported")
+        self.ring = ring
+        self.labels = list(ring.labels)
+        self.index = ring.index
+        n = self.rank = ring.rank
+        a_idx, b_idx, c_idx, _ = ring.triples()
+        self.X = a_idx.astype(_np.int64)
+        self.Y = b_idx.astype(_np.int64)
+        self.Z = c_idx.astype(_np.int64)
+        self.by_pair = ring.indptr
+        self.by_first = ring.indptr[::n] if n else ring.indptr
+        self._keys = (self.X * n + self.Y) * n + self.Z  # ascending
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> "FusionTable":
+        from .fusion_ring import FusionRing
+
+        return cls(FusionRing.from_payload(payload))
+
+    def admissible(self, a: Any, b: Any, c: Any) -> Any:
+        """Whether ``c ∈ a ⊗ b``, elementwise for index arrays (or scalars)."""
+
+        n = self.rank
+        keys = (_np.asarray(a, dtype=_np.int64) * n + b) * n + c
+        if not self._keys.size:
+            return _np.zeros_like(keys, dtype=bool)
+        pos = _np.minimum(_np.searchsorted(self._keys, keys), self._keys.size - 1)
+        return self._keys[pos] == keys
+
+    def expand_first(self, rows: Rows, key: str, out: Tuple[str, str]) -> Rows:
+        """Join rows with every admissible ``(rows[key], y, z)``."""
+
+        rep, pos = _expand(self.by_first, rows[key])
+        joined = {name: col[rep] for name, col in rows.items()}
+        joined[out[0]] = self.Y[pos]
+        joined[out[1]] = self.Z[pos]
+        return joined
+
+    def expand_pair(self, rows: Rows, first: str, second: str, out: str) -> Rows:
+        """Join rows with every admissible ``z`` in ``rows[first] ⊗ rows[second]``."""
+
+        rep, pos = _expand(self.by_pair, rows[first] * self.rank + rows[second])
+        joined = {name: col[rep] for name, col in rows.items()}
+        joined[out] = self.Z[pos]
+        return joined
+
+    def expand_pair_indexed(self, rows: Rows, first: str, second: str) -> Any:
+        """Like :meth:`expand_pair` but return ``(row_index, z)`` arrays only."""
+
+        rep, pos = _expand(self.by_pair, rows[first] * self.rank + rows[second])
+        return rep, self.Z[pos]
+
+
+def _expand(offsets: Any, keys: Any) -> Tuple[Any, Any]:
+    starts = offsets[keys]
+    counts = offsets[keys + 1] - starts
+    total = int(counts.sum())
+    rep = _np.repeat(_np.arange(keys.size), counts)
+    base = _np.repeat(starts - (_np.cumsum(counts) - counts), counts)
+    return rep, base + _np.arange(total)
+
+
+def filter_rows(rows: Rows, mask: Any) -> Rows:
+    return {name: col[mask] for name, col in rows.items()}
+
+
+def row_count(rows: Rows) -> int:
+    return int(next(iter(rows.values())).size) if rows else 0
+
+
+def staged_chunks(rows: Rows, stages: Sequence[Any], chunk_size: int) -> Iterator[Rows]:
+    """Apply join *stages* depth-first, slicing to ``chunk_size`` rows between them.
+
+    Only one slice per stage is alive at a time, so peak memory is bounded by
+    ``chunk_size`` times the largest branching factor of a single stage.
+    """
+
+    if not stages:
+        if row_count(rows):
+            yield rows
+        return
+    step = max(1, chunk_size)
+    stage, rest = stages[0], stages[1:]
+    for start in range(0, row_count(rows), step):
+        part = {name: col[start : start + step] for name, col in rows.items()}
+        expanded = stage(part)
+        if row_count(expanded):
+            yield from staged_chunks(expanded, rest, chunk_size)
+
+
+def segment_sum(index: Any, values: Any, size: int) -> Any:
+    """Complex ``bincount``: sum *values* per row *index*."""
+
+    real = _np.bincount(index, weights=values.real, minlength=size)
+    imag = _np.bincount(index, weights=values.imag, minlength=size)
+    return real + 1j * imag
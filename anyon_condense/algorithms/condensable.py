@@ -0,0 +1,294 @@
+"""Candidate search for condensable (connected commutative separable) algebras.
+
+A candidate is ``A = ⊕ n_a a`` with ``n_1 = 1``. Necessary conditions used
+for pruning, cheapest first:
+
+* ``n_a > 0`` only for bosons (``θ_a = 1``), ``n_a <= d_a`` and ``n_a = n_{a*}``;
+* ``dim A = Σ n_a d_a <= D`` (the condensed phase has ``D^2 / dim(A)^2 >= 1``);
+* for summands ``a, b`` of ``A`` some channel of ``a ⊗ b`` lies in ``A``
+  (multiplication is non-zero on every ``a ⊗ b``), checked as soon as all
+  channels are decided;
+* at the leaves: ``dim A`` divides ``D^2`` when all dimensions are integers,
+  and ``A`` is a summand of ``A ⊗ A`` (``m`` splits for separable ``A``).
+
+Survivors are *candidates*; whether an algebra structure exists is decided
+later. The search tree is split by prefixes of the first choices and the
+shards can run in a process pool; candidates are yielded as they are found
+(per shard when parallel).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from ._fusion import _np, parse_scalar, require_numpy
+from .dimensions import quantum_dimensions
+from .fusion_ring import FusionRing
+
+__all__ = [
+    "AlgebraCandidate",
+    "condensable_candidates_payload",
+    "find_condensable_candidates",
+    "iter_condensable_candidates",
+]
+
+
+@dataclass(frozen=True)
+class AlgebraCandidate:
+    """``multiplicities[a] = n_a`` in ring label order."""
+
+    multiplicities: Tuple[int, ...]
+    dim: float
+    lagrangian: bool
+
+    def as_dict(self, labels: Sequence[str]) -> Dict[str, int]:
+        return {label: n for label, n in zip(labels, self.multiplicities) if n}
+
+
+@dataclass(frozen=True)
+class _SearchSpace:
+    ring: FusionRing
+    orbits: Tuple[Tuple[int, ...], ...]  # dual orbits of candidate bosons
+    weights: Tuple[float, ...]  # dim contribution of one copy of each orbit
+    bounds: Tuple[int, ...]  # max multiplicity per orbit
+    decided_at: Tuple[int, ...]  # label -> orbit position deciding it (-1: fixed)
+    channels: Tuple[Tuple[Tuple[int, ...], ...], ...]  # [a][b] -> channels
+    qdim: Tuple[float, ...]
+    max_dim: float
+    global_dim: float
+    integral: bool
+    tol: float
+
+
+def _parse_twist(value: Any, where: str) -> complex:
+    if isinstance(value, str):
+        try:
+            return complex(value.replace(" ", ""))
+        except ValueError:
+            raise ValueError(f"Invalid twist at {where}: {value!r}") from None
+    return parse_scalar(value, where)
+
+
+def _build_space(
+    ring: FusionRing,
+    twists: Sequence[complex],
+    qdim: Sequence[float],
+    global_dim: float,
+    tol: float,
+) -> _SearchSpace:
+    if ring.unit is None:
+        raise ValueError("Condensable algebra search needs a fusion ring with a unit")
+    n = ring.rank
+    seen: set[int] = set()
+    orbits: List[Tuple[int, ...]] = []
+    for a in range(n):
+        if a == ring.unit or a in seen:
+            continue
+        orbit = tuple(sorted({a, int(ring.dual[a])}))
+        seen.update(orbit)
+        bosonic = all(abs(twists[b] - 1) <= tol for b in orbit)
+        if bosonic and math.floor(qdim[a] + tol) >= 1:
+            orbits.append(orbit)
+    # Heavy orbits first: the dimension bound prunes them earliest.
+    orbits.sort(key=lambda orbit: (-qdim[orbit[0]] * len(orbit), orbit))
+
+    decided_at = [-1] * n
+    for position, orbit in enumerate(orbits):
+        for a in orbit:
+            decided_at[a] = position
+    a_idx, b_idx, c_idx, _ = ring.triples()
+    table: List[List[List[int]]] = [[[] for _ in range(n)] for _ in range(n)]
+    for a, b, c in zip(a_idx.tolist(), b_idx.tolist(), c_idx.tolist()):
+        table[a][b].append(c)
+    integral = (
+        all(abs(d - round(d)) <= tol for d in qdim)
+        and abs(global_dim - round(global_dim)) <= tol
+    )
+    return _SearchSpace(
+        ring=ring,
+        orbits=tuple(orbits),
+        weights=tuple(qdim[o[0]] * len(o) for o in orbits),
+        bounds=tuple(int(math.floor(qdim[o[0]] + tol)) for o in orbits),
+        decided_at=tuple(decided_at),
+        channels=tuple(tuple(tuple(row) for row in rows) for rows in table),
+        qdim=tuple(float(d) for d in qdim),
+        max_dim=math.sqrt(global_dim) + tol,
+        global_dim=float(global_dim),
+        integral=integral,
+        tol=tol,
+    )
+
+
+def _closure_ok(
+    space: _SearchSpace, mult: List[int], added: Sequence[int], depth: int
+) -> bool:
+    """Every pair (new summand, summand) must have a channel that may lie in A."""
+
+    support = [a for a, m in enumerate(mult) if m]
+    for a in added:
+        for b in support:
+            for x, y in ((a, b), (b, a)):
+                ok = False
+                for c in space.channels[x][y]:
+                    # c is still undecided, or decided and present in A
+                    if mult[c] or space.decided_at[c] >= depth:
+                        ok = True
+                        break
+                if not ok:
+                    return False
+    return True
+
+
+def _leaf(
+    space: _SearchSpace, mult: List[int], dim: float
+) -> Optional[AlgebraCandidate]:
+    tol = space.tol
+    if space.integral:
+        ratio = space.global_dim / dim
+        if abs(ratio - round(ratio)) > tol * max(1.0, ratio):
+            return None
+    vector = _np.asarray(mult, dtype=_np.int64)
+    square = space.ring.fuse(vector, vector)
+    if _np.any(square < vector):
+        return None
+    lagrangian = abs(dim * dim - space.global_dim) <= tol * max(1.0, space.global_dim)
+    return AlgebraCandidate(tuple(mult), dim, lagrangian)
+
+
+def _search(
+    space: _SearchSpace, prefix: Tuple[int, ...], include_trivial: bool
+) -> Iterator[AlgebraCandidate]:
+    """Depth-first search below a fixed assignment of the first orbits."""
+
+    mult = [0] * space.ring.rank
+    mult[space.ring.unit] = 1  # type: ignore[index]
+    dim = 1.0
+    for position, count in enumerate(prefix):
+        dim += count * space.weights[position]
+        for a in space.orbits[position]:
+            mult[a] = count
+    if dim > space.max_dim:
+        return
+    if not _closure_ok(space, mult, [a for a, m in enumerate(mult) if m], len(prefix)):
+        return
+
+    def descend(position: int, dim: float) -> Iterator[AlgebraCandidate]:
+        if position == len(space.orbits):
+            if dim > 1.0 or include_trivial:
+                found = _leaf(space, mult, dim)
+                if found is not None:
+                    yield found
+            return
+        orbit = space.orbits[position]
+        weight = space.weights[position]
+        for count in range(space.bounds[position] + 1):
+            new_dim = dim + count * weight
+            if new_dim > space.max_dim:
+                break
+            for a in orbit:
+                mult[a] = count
+            # Adding copies only needs the new pairs checked; leaving the orbit
+            # out may close off pairs among the summands chosen so far.
+            checked = orbit if count else [a for a, m in enumerate(mult) if m]
+            if _closure_ok(space, mult, checked, position + 1):
+                yield from descend(position + 1, new_dim)
+        for a in orbit:
+            mult[a] = 0
+
+    yield from descend(len(prefix), dim)
+
+
+def _prefixes(space: _SearchSpace, target: int) -> List[Tuple[int, ...]]:
+    prefixes: List[Tuple[int, ...]] = [()]
+    depth = 0
+    while len(prefixes) < target and depth < len(space.orbits):
+        prefixes = [
+            prefix + (count,)
+            for prefix in prefixes
+            for count in range(space.bounds[depth] + 1)
+        ]
+        depth += 1
+    return prefixes
+
+
+def _search_shard(
+    space: _SearchSpace, prefix: Tuple[int, ...], include_trivial: bool
+) -> List[AlgebraCandidate]:
+    return list(_search(space, prefix, include_trivial))
+
+
+def iter_condensable_candidates(
+    ring: FusionRing,
+    twists: Sequence[Any],
+    *,
+    qdim: Optional[Sequence[float]] = None,
+    global_dim: Optional[float] = None,
+    tol: float = 1e-9,
+    include_trivial: bool = False,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[AlgebraCandidate]:
+    """Yield candidate algebras; *twists* are given in ring label order.
+
+    ``qdim``/``global_dim`` default to :func:`quantum_dimensions`. With
+    ``parallel=True`` the prefix shards run in a process pool and candidates
+    arrive shard by shard in completion order; otherwise in search order.
+    """
+
+    require_numpy("iter_condensable_candidates")
+    if len(twists) != ring.rank:
+        raise ValueError(f"Expected {ring.rank} twists, got {len(twists)}")
+    if qdim is None or global_dim is None:
+        dims = quantum_dimensions(ring)
+        qdim = dims.qdim.tolist() if qdim is None else qdim
+        global_dim = dims.global_dim if global_dim is None else global_dim
+    theta = [_parse_twist(t, f"twist[{i}]") for i, t in enumerate(twists)]
+    space = _build_space(ring, theta, list(qdim), float(global_dim), tol)
+
+    workers = max_workers or os.cpu_count() or 1
+    if not parallel or workers < 2:
+        yield from _search(space, (), include_trivial)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_search_shard, space, prefix, include_trivial)
+            for prefix in _prefixes(space, 8 * workers)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def find_condensable_candidates(
+    ring: FusionRing, twists: Sequence[Any], **kwargs: Any
+) -> List[AlgebraCandidate]:
+    """All candidates, sorted by dimension then multiplicities (deterministic)."""
+
+    found = list(iter_condensable_candidates(ring, twists, **kwargs))
+    return sorted(found, key=lambda cand: (cand.dim, cand.multiplicities))
+
+
+def condensable_candidates_payload(
+    output: Mapping[str, Any], fusion_input: Mapping[str, Any], **kwargs: Any
+) -> Iterator[Dict[str, int]]:
+    """Stream candidates for an ``ac-umtc`` output (twist/qdim/global_dim).
+
+    ``output["objects"]`` orders the twists and dimensions; candidates are
+    yielded as ``{label: n_a}`` dicts.
+    """
+
+    ring = FusionRing.from_payload(fusion_input)
+    objects = list(output.get("objects") or ring.labels)
+    if sorted(objects) != sorted(ring.labels):
+        raise ValueError("output objects do not match the fusion ring labels")
+    twists = [output["twist"][label] for label in ring.labels]
+    if "qdim" in output and "global_dim" in output:
+        kwargs.setdefault(
+            "qdim", [float(output["qdim"][label]) for label in ring.labels]
+        )
+        kwargs.setdefault("global_dim", float(output["global_dim"]))
+    for candidate in iter_condensable_candidates(ring, twists, **kwargs):
+        yield candidate.as_dict(ring.labels)
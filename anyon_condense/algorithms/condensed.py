@@ -0,0 +1,500 @@
+"""Condensed phase ``C_A^loc`` of local modules over a condensable algebra ``A``.
+
+Free modules ``F(a) = A ⊗ a`` have ``dim Hom_A(F(a), F(b)) = Σ_c n_c N_{cb}^a``
+(``A = ⊕ n_c c``). Writing ``F(a) = Σ_t W[a, t] M_t`` over simple modules
+``M_t`` turns this Gram matrix into ``W W^T``; by reciprocity column ``t`` of
+``W`` is the restriction of ``M_t`` to the parent. ``W`` is found once by an
+integer factorization of the Gram matrix (column by column, with
+backtracking). A module is local when its restriction has a single twist.
+
+With ``L`` the local columns of ``W``, the condensed data follow from block
+products: ``L^T S = S_A L^T`` gives ``S_A = L^T S L (L^T L)^+``, ``T_A`` is
+the common twist and ``d_t = d(restriction) / dim A``. When several local
+modules restrict to the same parent object (splitting) the relation only
+fixes ``S_A`` averaged over the copies; such phases are flagged in
+:attr:`CondensedPhase.split` and carry that averaged ``S`` and no fusion ring.
+
+The tables are cached per parent payload and algebra under their
+``content_address``; every query after the first reuses the factorization.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from anyon_condense.core.consistency.numcheck import as_complex_array
+from anyon_condense.core.hashing import content_address
+
+from ._fusion import _np, format_scalar, require_numpy
+from .condensable import AlgebraCandidate, _parse_twist
+from .fusion_ring import FusionRing
+from .verlinde import verlinde_fusion_ring
+
+__all__ = [
+    "CondensedPhase",
+    "CondensationEngine",
+    "InductionTables",
+    "clear_induction_cache",
+    "factor_gram",
+    "induction_cache_info",
+]
+
+DEFAULT_CACHE_SIZE = 64
+
+# Search nodes allowed per Gram factorization before giving up.
+NODE_LIMIT = 1_000_000
+
+Algebra = Union[Mapping[str, int], Sequence[int], AlgebraCandidate]
+
+
+@dataclass(frozen=True)
+class InductionTables:
+    """Free-module decomposition for one ``(parent, A)`` pair.
+
+    ``induction[a, t]`` is the multiplicity of module ``t`` in ``F(a)``;
+    :attr:`restriction` is its transpose. ``module_twist[t]`` is the common
+    twist of a local module (``nan`` for non-local ones).
+    """
+
+    key: Tuple[str, str]
+    labels: Tuple[str, ...]
+    algebra: Tuple[int, ...]
+    gram: Any
+    induction: Any
+    local: Any
+    module_twist: Any
+    module_dim: Any
+
+    @property
+    def restriction(self) -> Any:
+        return self.induction.T
+
+    @property
+    def modules(self) -> int:
+        return int(self.induction.shape[1])
+
+    def induce(self, label: str) -> Dict[int, int]:
+        """``F(label)`` as ``{module: multiplicity}``."""
+
+        row = self.induction[self.labels.index(label)]
+        return {int(t): int(row[t]) for t in _np.flatnonzero(row)}
+
+    def restrict(self, module: int) -> Dict[str, int]:
+        """Restriction of module *module* as ``{parent label: multiplicity}``."""
+
+        column = self.induction[:, module]
+        return {self.labels[a]: int(column[a]) for a in _np.flatnonzero(column)}
+
+
+@dataclass(frozen=True)
+class CondensedPhase:
+    """Modular data of ``C_A^loc``; ``restriction[t, a]`` lists parent content.
+
+    ``split`` groups local modules with equal restrictions; when non-empty,
+    ``S`` is only the copy-averaged part and ``ring`` is ``None``.
+    """
+
+    labels: Tuple[str, ...]
+    qdim: Any
+    global_dim: float
+    twist: Any
+    S: Any
+    restriction: Any
+    ring: Optional[FusionRing]
+    split: Tuple[Tuple[int, ...], ...] = ()
+
+    @property
+    def T(self) -> Any:
+        return _np.diag(self.twist)
+
+
+class _TableCache:
+    """Small LRU of :class:`InductionTables`, shared by all engines."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Tuple[str, str], InductionTables] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[InductionTables]:
+        with self._lock:
+            tables = self._data.get(key)
+            if tables is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return tables
+
+    def put(self, tables: InductionTables) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[tables.key] = tables
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+_CACHE = _TableCache()
+
+
+def induction_cache_info() -> Dict[str, int]:
+    """Hit/miss counters of the process-wide induction-table cache."""
+
+    return {
+        "hits": _CACHE.hits,
+        "misses": _CACHE.misses,
+        "maxsize": _CACHE.maxsize,
+        "currsize": len(_CACHE._data),
+    }
+
+
+def clear_induction_cache() -> None:
+    """Drop all cached induction tables (useful for tests)."""
+
+    _CACHE.clear()
+
+
+def _dot_solutions(
+    rows: List[List[int]], targets: List[int], budget: int, tick: Callable[[], None]
+) -> Iterator[List[int]]:
+    """Non-negative ``x`` over existing modules with ``x · rows[b] = targets[b]``.
+
+    ``rows[t][b]`` is the multiplicity of module ``t`` in ``F(b)`` for the
+    columns already placed; ``Σ x_t^2 <= budget``. Solutions are produced
+    lazily and every search node calls *tick*.
+    """
+
+    x: List[int] = []
+    remaining = list(targets)
+
+    def descend(t: int, budget: int) -> Iterator[List[int]]:
+        tick()
+        if t == len(rows):
+            if not any(remaining):
+                yield list(x)
+            return
+        row = rows[t]
+        bound = math.isqrt(budget)
+        for b, w in enumerate(row):
+            if w:
+                bound = min(bound, remaining[b] // w)
+        for value in range(bound, -1, -1):
+            x.append(value)
+            for b, w in enumerate(row):
+                remaining[b] -= value * w
+            yield from descend(t + 1, budget - value * value)
+            for b, w in enumerate(row):
+                remaining[b] += value * w
+            x.pop()
+
+    yield from descend(0, budget)
+
+
+def _square_partitions(
+    total: int, tick: Callable[[], None], largest: Optional[int] = None
+) -> Iterator[List[int]]:
+    """Non-increasing positive ``y`` with ``Σ y_i^2 = total`` (lazily)."""
+
+    tick()
+    if total == 0:
+        yield []
+        return
+    top = math.isqrt(total) if largest is None else min(largest, math.isqrt(total))
+    for y in range(top, 0, -1):
+        for rest in _square_partitions(total - y * y, tick, y):
+            yield [y] + rest
+
+
+def factor_gram(
+    gram: Any, order: Sequence[int], *, node_limit: int = NODE_LIMIT
+) -> Any:
+    """Non-negative integer ``W`` with ``W W^T = gram`` (rows in input order).
+
+    Columns of ``W`` (simple modules) are introduced the first time a row in
+    *order* needs them; duplicated rows (``G_aa = G_bb = G_ab``) are copied.
+    Raises ``ValueError`` when no factorization exists or the search exceeds
+    ``node_limit`` nodes (row placements and candidate enumeration alike).
+    """
+
+    n = gram.shape[0]
+    G = gram.tolist()
+    placed: List[List[int]] = []  # per placed row: multiplicities over modules
+    nodes = 0
+
+    def tick() -> None:
+        nonlocal nodes
+        nodes += 1
+        if nodes > node_limit:
+            raise ValueError("module decomposition search exceeded the node limit")
+
+    def place(pos: int, modules: int) -> bool:
+        tick()
+        if pos == n:
+            return True
+        a = order[pos]
+        for prev in range(pos):
+            b = order[prev]
+            if G[a][a] == G[b][b] == G[a][b]:  # equal free modules
+                placed.append(placed[prev])
+                if place(pos + 1, modules):
+                    return True
+                placed.pop()
+                return False
+        rows = [
+            [placed[p][t] if t < len(placed[p]) else 0 for p in range(pos)]
+            for t in range(modules)
+        ]
+        targets = [G[a][order[p]] for p in range(pos)]
+        for x in _dot_solutions(rows, targets, G[a][a], tick):
+            rest = G[a][a] - sum(v * v for v in x)
+            for y in _square_partitions(rest, tick):
+                placed.append(x + y)
+                if place(pos + 1, modules + len(y)):
+                    return True
+                placed.pop()
+        return False
+
+    if not place(0, 0):
+        raise ValueError("Gram matrix of free modules has no integer factorization")
+    modules = max(len(column) for column in placed)
+    W = _np.zeros((n, modules), dtype=_np.int64)
+    for pos, column in enumerate(placed):
+        W[order[pos], : len(column)] = column
+    return W
+
+
+class CondensationEngine:
+    """Condensation queries against one parent UMTC.
+
+    Built from an ``ac-umtc`` output (objects, qdim, global_dim, twist, S) and
+    the matching input payload (fusion rules). The parent's content address
+    is computed once here; induction tables for each algebra are computed on
+    first use and then served from the shared cache.
+    """
+
+    def __init__(
+        self,
+        output: Mapping[str, Any],
+        fusion_input: Mapping[str, Any],
+        *,
+        tol: float = 1e-8,
+    ) -> None:
+        require_numpy("CondensationEngine")
+        self.ring = FusionRing.from_payload(fusion_input)
+        if self.ring.unit is None:
+            raise ValueError("Condensation needs a fusion ring with a unit object")
+        labels = self.ring.labels
+        objects = list(output.get("objects") or labels)
+        if sorted(objects) != sorted(labels):
+            raise ValueError("output objects do not match the fusion ring labels")
+        order = [objects.index(label) for label in labels]
+        S = as_complex_array(output["S"], 2)
+        if S is None or S.shape != (len(labels), len(labels)):
+            raise ValueError("output S must be a rank x rank matrix")
+        self.S = S[_np.ix_(order, order)]
+        self.twist = _np.array(
+            [_parse_twist(output["twist"][x], f"twist[{x!r}]") for x in labels]
+        )
+        self.qdim = _np.array([float(output["qdim"][x]) for x in labels])
+        self.global_dim = float(output["global_dim"])
+        self.number_field = output.get("number_field")
+        self.tol = tol
+        self.parent_key = content_address(
+            {"output": dict(output), "input": dict(fusion_input)}, "condensation-parent"
+        )
+
+    # ---------------------------------------------------------------- tables
+    def _algebra_vector(self, algebra: Algebra) -> Tuple[int, ...]:
+        if isinstance(algebra, AlgebraCandidate):
+            vector = list(algebra.multiplicities)
+        elif isinstance(algebra, Mapping):
+            unknown = [x for x in algebra if x not in self.ring.index]
+            if unknown:
+                raise ValueError(f"Unknown label {unknown[0]!r} in algebra")
+            vector = [int(algebra.get(x, 0)) for x in self.ring.labels]
+        else:
+            vector = [int(n) for n in algebra]
+        if len(vector) != self.ring.rank or min(vector) < 0:
+            raise ValueError("algebra must give a non-negative multiplicity per object")
+        if vector[self.ring.unit] != 1:  # type: ignore[index]
+            raise ValueError("algebra must contain the unit object exactly once")
+        return tuple(vector)
+
+    def tables(self, algebra: Algebra) -> InductionTables:
+        """Induction/restriction tables for *algebra* (cached)."""
+
+        vector = self._algebra_vector(algebra)
+        named = {x: n for x, n in zip(self.ring.labels, vector) if n}
+        key = (self.parent_key, content_address(named, "algebra"))
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+        tables = self._build_tables(key, vector)
+        _CACHE.put(tables)
+        return tables
+
+    def _build_tables(
+        self, key: Tuple[str, str], vector: Tuple[int, ...]
+    ) -> InductionTables:
+        N = self.ring.N.astype(_np.int64)
+        # gram[a, b] = Σ_c n_c N_{cb}^a = dim Hom(a, A ⊗ b)
+        gram = _np.tensordot(_np.asarray(vector), N, axes=1).T
+        if not _np.array_equal(gram, gram.T):
+            raise ValueError("free-module Gram matrix is not symmetric")
+        unit = self.ring.unit
+        order = [unit] + [a for a in range(self.ring.rank) if a != unit]  # type: ignore[list-item]
+        W = factor_gram(gram, order)
+
+        dim_a = float(_np.asarray(vector) @ self.qdim)
+        present = W > 0
+        module_dim = (W.T @ self.qdim) / dim_a
+        module_twist = _np.full(W.shape[1], _np.nan, dtype=_np.complex128)
+        local = _np.zeros(W.shape[1], dtype=bool)
+        for t in range(W.shape[1]):
+            thetas = self.twist[present[:, t]]
+            if _np.all(_np.abs(thetas - thetas[0]) <= self.tol):
+                local[t] = True
+                module_twist[t] = thetas[0]
+        return InductionTables(
+            key=key,
+            labels=self.ring.labels,
+            algebra=vector,
+            gram=gram,
+            induction=W,
+            local=local,
+            module_twist=module_twist,
+            module_dim=module_dim,
+        )
+
+    # ------------------------------------------------------------- condensed
+    def condense(self, algebra: Algebra) -> CondensedPhase:
+        """Objects, dimensions, twists, S and fusion of ``C_A^loc``.
+
+        Raises ``ValueError`` when the result is not modular data (e.g. the
+        candidate is not actually an algebra).
+        """
+
+        tables = self.tables(algebra)
+        L = tables.induction[:, tables.local]  # (parent, local)
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for t, column in enumerate(L.T.tolist()):
+            groups.setdefault(tuple(column), []).append(t)
+        split = tuple(tuple(g) for g in groups.values() if len(g) > 1)
+
+        Lf = L.astype(_np.float64)
+        S = (Lf.T @ self.S @ Lf) @ _np.linalg.pinv(Lf.T @ Lf)
+        labels = self._module_labels(tables)
+        ring: Optional[FusionRing] = None
+        if not split:
+            try:
+                ring = verlinde_fusion_ring(S, labels, unit=0)
+            except ValueError as exc:
+                raise ValueError(
+                    f"algebra does not condense to a UMTC: {exc}"
+                ) from None
+        qdim = tables.module_dim[tables.local]
+        return CondensedPhase(
+            labels=labels,
+            qdim=qdim,
+            global_dim=float(qdim @ qdim),
+            twist=tables.module_twist[tables.local],
+            S=S,
+            restriction=tables.restriction[tables.local],
+            ring=ring,
+            split=split,
+        )
+
+    def _module_labels(self, tables: InductionTables) -> Tuple[str, ...]:
+        """Name each local module after the first parent object it contains."""
+
+        seen: Dict[str, int] = {}
+        labels: List[str] = []
+        for t in _np.flatnonzero(tables.local):
+            base = self.ring.labels[int(_np.flatnonzero(tables.induction[:, t])[0])]
+            count = seen.get(base, 0)
+            seen[base] = count + 1
+            labels.append(base if not count else f"{base}~{count}")
+        return tuple(labels)
+
+    def condensed_payloads(
+        self, algebra: Algebra
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """``(umtc output, umtc input)`` payloads of the condensed phase.
+
+        The input carries objects, duals and fusion rules (no F/R symbols);
+        the output is ready for :func:`anyon_condense.core.io.write_umtc_output`.
+        """
+
+        phase = self.condense(algebra)
+        if phase.ring is None:
+            raise ValueError(
+                "split local modules: S of the condensed phase is not fixed"
+            )
+        labels = list(phase.labels)
+        number_field = self.number_field or "cyclotomic(1)"
+        twist = [format_scalar(t) for t in phase.twist.tolist()]
+        T: List[List[Any]] = [[0.0] * len(labels) for _ in labels]
+        for i, t in enumerate(twist):
+            T[i][i] = t
+        tables = self.tables(algebra)
+        meta = {
+            "parent": self.parent_key,
+            "algebra": {x: n for x, n in zip(tables.labels, tables.algebra) if n},
+            "restriction": {
+                label: {tables.labels[a]: int(row[a]) for a in _np.flatnonzero(row)}
+                for label, row in zip(labels, phase.restriction)
+            },
+        }
+        output = {
+            "format": "ac-umtc",
+            "version": "0.1",
+            "encoding": "float",
+            "number_field": number_field,
+            "category_type": "umtc",
+            "_meta": meta,
+            "objects": labels,
+            "qdim": {x: float(d) for x, d in zip(labels, phase.qdim.tolist())},
+            "global_dim": phase.global_dim,
+            "twist": dict(zip(labels, twist)),
+            "S": [[format_scalar(x) for x in row] for row in phase.S.tolist()],
+            "T": T,
+            "checks": {},
+            "hashes": {},
+        }
+        fusion_input = {
+            "format": "ac-umtc",
+            "version": "0.1",
+            "encoding": "float",
+            "number_field": number_field,
+            "category_type": "umtc",
+            "_meta": meta,
+            "simple_objects": labels,
+            "dual": {x: labels[int(d)] for x, d in zip(labels, phase.ring.dual)},
+            "fusion_rules": phase.ring.fusion_rules(),
+            "F_symbols": None,
+            "R_symbols": None,
+        }
+        return output, fusion_input
@@ -0,0 +1,166 @@
+"""Quantum and global dimensions as Perron–Frobenius data of a fusion ring.
+
+The dimension vector ``d`` satisfies ``d_a d_b = Σ_c N_{ab}^c d_c``; summing
+over ``b`` shows it is the Perron–Frobenius eigenvector of
+``M = Σ_b N_b`` (``M[a, c] = Σ_b N_{ab}^c``) with eigenvalue ``Σ_b d_b``, and
+``d_a`` is then the PF eigenvalue of ``N_a``. The ``"power"`` engine iterates
+``x -> M x`` straight from the CSR tensor (``O(nnz)`` per step, ``O(rank)``
+extra memory); ``"eig"`` diagonalizes the dense ``M`` and is meant for small
+ranks or as a fallback.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ._fusion import _np, require_numpy
+from .fusion_ring import FusionRing
+
+__all__ = [
+    "ENGINES",
+    "EIG_MAX_RANK",
+    "Dimensions",
+    "fill_dimensions",
+    "quantum_dimensions",
+]
+
+ENGINES = ("auto", "power", "eig")
+
+# "auto" falls back to dense diagonalization up to this rank (~32 MiB for M).
+EIG_MAX_RANK = 2048
+
+# Residual below which a power iteration that stalls on rounding noise is kept.
+_STAGNATION_ACCEPT = 1e-10
+
+
+@dataclass(frozen=True)
+class Dimensions:
+    """``qdim[a]`` in ring label order and ``global_dim = Σ_a qdim[a]**2``."""
+
+    labels: Tuple[str, ...]
+    qdim: Any
+    global_dim: float
+    engine: str
+    iterations: int
+    residual: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return {label: float(d) for label, d in zip(self.labels, self.qdim)}
+
+
+def _row_owner(ring: FusionRing) -> Any:
+    rows = _np.repeat(_np.arange(ring.rank * ring.rank), _np.diff(ring.indptr))
+    return rows // ring.rank
+
+
+def _power(
+    ring: FusionRing, tol: float, max_iter: int
+) -> Tuple[Optional[Any], int, float]:
+    owner = _row_owner(ring)
+    weights = ring.data.astype(_np.float64)
+    n = ring.rank
+
+    def apply(x: Any) -> Any:
+        return _np.bincount(owner, weights=weights * x[ring.indices], minlength=n)
+
+    x = _np.full(n, 1.0 / _np.sqrt(n))
+    best, best_residual, best_step = None, _np.inf, 0
+    for step in range(1, max_iter + 1):
+        y = apply(x)
+        lam = float(x @ y)
+        norm = float(_np.linalg.norm(y))
+        if norm == 0.0:
+            break
+        residual = float(_np.linalg.norm(y - lam * x)) / lam
+        if residual < best_residual:
+            best, best_residual, best_step = x, residual, step
+        x = y / norm
+        # Stop at tol, or once rounding noise stops any further improvement.
+        if residual <= tol or (
+            best_residual <= _STAGNATION_ACCEPT and step - best_step >= 8
+        ):
+            break
+    else:
+        step = max_iter
+    if best_residual > _STAGNATION_ACCEPT:
+        return None, step, float(best_residual)
+    return best, step, float(best_residual)
+
+
+def _eig(ring: FusionRing) -> Tuple[Any, float]:
+    n = ring.rank
+    flat = _row_owner(ring) * n + ring.indices
+    M = _np.bincount(flat, weights=ring.data, minlength=n * n).reshape(n, n)
+    values, vectors = _np.linalg.eig(M)
+    k = int(_np.argmax(values.real))
+    x = _np.abs(vectors[:, k].real)
+    lam = float(values[k].real)
+    residual = float(_np.linalg.norm(M @ x - lam * x)) / max(lam, 1e-300)
+    return x, residual
+
+
+def quantum_dimensions(
+    ring: FusionRing,
+    *,
+    engine: str = "auto",
+    tol: float = 1e-15,
+    max_iter: int = 10_000,
+) -> Dimensions:
+    """Compute ``qdim`` (normalized to ``d_unit = 1``) and ``global_dim``.
+
+    ``engine="auto"`` runs power iteration and falls back to ``"eig"`` when it
+    has not converged after ``max_iter`` steps and ``rank <= EIG_MAX_RANK``.
+    Raises ``ValueError`` for rings without a unit or without convergence.
+    """
+
+    require_numpy("quantum_dimensions")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    if ring.unit is None:
+        raise ValueError("quantum_dimensions needs a fusion ring with a unit object")
+
+    x: Optional[Any]
+    iterations = 0
+    if engine == "eig":
+        x, residual = _eig(ring)
+        used = "eig"
+    else:
+        x, iterations, residual = _power(ring, tol, max_iter)
+        used = "power"
+        if x is None and engine == "auto" and ring.rank <= EIG_MAX_RANK:
+            x, residual = _eig(ring)
+            used = "eig"
+    if x is None:
+        raise ValueError(
+            f"Power iteration did not converge in {max_iter} steps "
+            f"(residual {residual:.3e})"
+        )
+
+    qdim = x / x[ring.unit]
+    qdim[ring.unit] = 1.0
+    return Dimensions(
+        labels=ring.labels,
+        qdim=qdim,
+        global_dim=float(qdim @ qdim),
+        engine=used,
+        iterations=iterations,
+        residual=residual,
+    )
+
+
+def fill_dimensions(
+    payload: Dict[str, Any], ring: FusionRing, **kwargs: Any
+) -> Dimensions:
+    """Set ``qdim``/``global_dim`` (and ``objects`` if absent) on an output payload.
+
+    Keyword arguments go to :func:`quantum_dimensions`. The payload is ready
+    for :func:`anyon_condense.core.io.write_umtc_output` once the remaining
+    fields are present.
+    """
+
+    dims = quantum_dimensions(ring, **kwargs)
+    payload.setdefault("objects", list(ring.labels))
+    payload["qdim"] = dims.as_dict()
+    payload["global_dim"] = dims.global_dim
+    return dims
@@ -0,0 +1,220 @@
+"""Modular data of the Drinfeld center ``Z(Vec_G)`` from group data.
+
+Simple objects are pairs ``(C, χ)`` of a conjugacy class ``C ∋ g_C`` and an
+irrep ``χ`` of the centralizer ``Z(g_C)``, with ``d = |C| χ(1)`` and
+``θ = χ(g_C) / χ(1)``. The S-matrix is the class-function formula
+
+    S_{(a,α),(b,β)} = 1/|G| Σ_{g ∈ C_a, h ∈ C_b, gh = hg}
+                      conj(α(x_g^-1 h x_g)) conj(β(x_h^-1 g x_h))
+
+with ``x_g g_C x_g^-1 = g``. Commuting pairs are binned once into a count
+matrix ``K`` indexed by (class, centralizer class) on both sides; ``S`` is then
+``conj(X) K conj(X)^T / |G|`` for the block-diagonal centralizer character
+table ``X``. Binning costs ``O(|G| k(G))`` and every step is bounded by
+``O(|G|^2)``. For abelian ``G`` every centralizer is ``G`` and ``S`` is an
+outer product of the character table with itself.
+"""
+
+from __future__ import annotations
+
+import pathlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from anyon_condense.core.io import write_umtc_output
+
+from ._fusion import _np, format_scalar, require_numpy
+from .groups import FiniteGroup, character_table
+
+__all__ = [
+    "DrinfeldCenter",
+    "drinfeld_center",
+    "drinfeld_center_payload",
+    "write_drinfeld_center",
+]
+
+
+@dataclass(frozen=True)
+class DrinfeldCenter:
+    """Modular data of ``Z(Vec_G)``; arrays follow :attr:`labels` order.
+
+    ``labels[i] = "C{a}.{j}"`` is class ``a`` of ``G`` (class 0 is the
+    identity) with the ``j``-th irrep of its centralizer (0 is trivial), so
+    ``"C0.0"`` is the vacuum.
+    """
+
+    labels: Tuple[str, ...]
+    qdim: Any
+    twist: Any
+    S: Any
+    global_dim: float
+    exponent: int
+    class_reps: Tuple[int, ...]
+    centralizer_orders: Tuple[int, ...]
+
+
+def _clean(values: Any, tol: float) -> Any:
+    values = _np.asarray(values, dtype=_np.complex128)
+    real = _np.where(_np.abs(values.real) <= tol, 0.0, values.real)
+    imag = _np.where(_np.abs(values.imag) <= tol, 0.0, values.imag)
+    return real + 1j * imag
+
+
+def _roots_of_unity(values: Any, exponent: int) -> Any:
+    """Snap *values* to the nearest ``exponent``-th roots of unity."""
+
+    steps = _np.rint(_np.angle(values) * exponent / (2 * _np.pi))
+    return _np.exp(2j * _np.pi * (steps % exponent) / exponent)
+
+
+def _abelian(group: FiniteGroup, tol: float) -> DrinfeldCenter:
+    n = group.order
+    class_of, reps, sizes = group.classes()
+    exponent = group.exponent
+    chars = character_table(group, _np.arange(n), class_of, reps, sizes)
+    chars = _roots_of_unity(chars, exponent)  # all characters are linear
+    # chars[i, c] = χ_i(reps[c]); anyon (c, i) sits at c * n + i.
+    S = _np.einsum("ib,ja->aibj", chars, chars).conj().reshape(n * n, n * n) / n
+    twist = chars.T.reshape(-1)  # θ_(c,i) = χ_i(reps[c])
+    return DrinfeldCenter(
+        labels=tuple(f"C{c}.{i}" for c in range(n) for i in range(n)),
+        qdim=_np.ones(n * n),
+        twist=_clean(twist, tol),
+        S=_clean(S, tol),
+        global_dim=float(n * n),
+        exponent=exponent,
+        class_reps=tuple(int(r) for r in reps),
+        centralizer_orders=(n,) * n,
+    )
+
+
+def drinfeld_center(group: FiniteGroup, *, tol: float = 1e-12) -> DrinfeldCenter:
+    """Compute objects, ``qdim``, twists and ``S`` of ``Z(Vec_G)``.
+
+    Entries within *tol* of zero (real and imaginary parts separately) are
+    snapped to zero. Raises ``ValueError`` if a centralizer's characters
+    cannot be separated numerically.
+    """
+
+    require_numpy("drinfeld_center")
+    if group.is_abelian:
+        return _abelian(group, tol)
+
+    n = group.order
+    table, inverse = group.table, group.inverse
+    class_of, reps, sizes = group.classes()
+    k = len(reps)
+
+    conjugator = _np.empty(n, dtype=_np.int64)  # x_g g_C x_g^-1 = g
+    local = _np.full((k, n), -1, dtype=_np.int64)  # centralizer class of u in Z(g_a)
+    blocks: List[Any] = []
+    offsets = [0]
+    for a, g in enumerate(reps):
+        images = table[table[:, g], inverse]  # h g h^-1 for every h
+        targets, first = _np.unique(images, return_index=True)
+        conjugator[targets] = first
+        members = group.centralizer(g)
+        z_class, z_reps, z_sizes = group.classes(members)
+        local[a] = z_class
+        blocks.append(character_table(group, members, z_class, z_reps, z_sizes))
+        offsets.append(offsets[-1] + len(z_reps))
+    m = offsets[-1]
+    row = local + _np.asarray(offsets[:-1])[:, None]  # (class, element) -> row of K
+
+    g_idx, h_idx = _np.nonzero(table == table.T)
+    x_g, x_h = conjugator[g_idx], conjugator[h_idx]
+    u = table[table[inverse[x_g], h_idx], x_g]  # x_g^-1 h x_g ∈ Z(g_a)
+    v = table[table[inverse[x_h], g_idx], x_h]  # x_h^-1 g x_h ∈ Z(g_b)
+    left = row[class_of[g_idx], u]
+    right = row[class_of[h_idx], v]
+    K = _np.bincount(left * m + right, minlength=m * m).reshape(m, m)
+
+    spans = [slice(offsets[a], offsets[a + 1]) for a in range(k)]
+    half = _np.empty((m, m), dtype=_np.complex128)
+    for span, chars in zip(spans, blocks):
+        half[span] = chars.conj() @ K[span]
+    S = _np.empty((m, m), dtype=_np.complex128)
+    for span, chars in zip(spans, blocks):
+        S[:, span] = half[:, span] @ chars.conj().T
+    S /= n
+
+    labels: List[str] = []
+    qdim = _np.empty(m)
+    twist = _np.empty(m, dtype=_np.complex128)
+    for a, (span, chars) in enumerate(zip(spans, blocks)):
+        degree = chars[:, 0].real
+        qdim[span] = sizes[a] * _np.rint(degree)
+        twist[span] = chars[:, local[a, reps[a]]] / degree
+        labels.extend(f"C{a}.{j}" for j in range(chars.shape[0]))
+    exponent = group.exponent
+    twist = _roots_of_unity(twist, exponent)  # g_a is central in Z(g_a)
+    return DrinfeldCenter(
+        labels=tuple(labels),
+        qdim=qdim,
+        twist=_clean(twist, tol),
+        S=_clean(S, tol),
+        global_dim=float(n * n),
+        exponent=exponent,
+        class_reps=tuple(int(r) for r in reps),
+        centralizer_orders=tuple(int(n // s) for s in sizes),
+    )
+
+
+def drinfeld_center_payload(
+    group: FiniteGroup,
+    *,
+    sources: Optional[Iterable[str]] = None,
+    tol: float = 1e-12,
+) -> Dict[str, Any]:
+    """Build an ``ac-umtc`` output payload for ``Z(Vec_G)`` (float encoding).
+
+    ``number_field`` is ``cyclotomic(exp G)``, which contains every S and T
+    entry. Provenance and hashes are filled in by
+    :func:`anyon_condense.core.io.write_umtc_output`.
+    """
+
+    center = drinfeld_center(group, tol=tol)
+    labels = list(center.labels)
+    twist = [format_scalar(t) for t in center.twist.tolist()]
+    m = len(labels)
+    T: List[List[Any]] = [[0.0] * m for _ in range(m)]
+    for i, t in enumerate(twist):
+        T[i][i] = t
+    payload: Dict[str, Any] = {
+        "format": "ac-umtc",
+        "version": "0.1",
+        "encoding": "float",
+        "number_field": f"cyclotomic({center.exponent})",
+        "category_type": "umtc",
+        "_meta": {
+            "generator": "drinfeld_center",
+            "group_order": group.order,
+            "class_reps": [group.labels[r] for r in center.class_reps],
+            "centralizer_orders": list(center.centralizer_orders),
+        },
+        "objects": labels,
+        "qdim": {label: float(d) for label, d in zip(labels, center.qdim.tolist())},
+        "global_dim": center.global_dim,
+        "twist": dict(zip(labels, twist)),
+        "S": [[format_scalar(x) for x in row] for row in center.S.tolist()],
+        "T": T,
+        "checks": {},
+        "hashes": {},
+    }
+    if sources is not None:
+        payload["_sources"] = list(sources)
+    return payload
+
+
+def write_drinfeld_center(
+    path: str | pathlib.Path,
+    group: FiniteGroup,
+    *,
+    parallel_hashes: bool = False,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Build the ``Z(Vec_G)`` payload and write it via ``write_umtc_output``."""
+
+    payload = drinfeld_center_payload(group, **kwargs)
+    write_umtc_output(path, payload, parallel_hashes=parallel_hashes)
+    return payload
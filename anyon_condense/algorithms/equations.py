@@ -0,0 +1,87 @@
+"""Streaming evaluation of generated consistency equations."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from anyon_condense.core.consistency.numcheck import EquationTally
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+__all__ = ["EquationChunk", "merge_tallies", "tally_equation_chunks"]
+
+# Labels of the worst equations, keyed by their global index in the tally.
+Named = Dict[int, List[str]]
+
+
+class EquationChunk(NamedTuple):
+    """A slice of equations: label-index tuples (one row each) and both sides."""
+
+    indices: Any
+    lhs: Any
+    rhs: Any
+
+
+def accumulate_chunks(
+    chunks: Iterable[EquationChunk],
+    policy: NumericPolicy,
+    labels: Sequence[str],
+    *,
+    worst: int = 10,
+) -> Tuple[EquationTally, Named]:
+    tally = EquationTally(policy, worst=worst)
+    named: Named = {}
+    for chunk in chunks:
+        offset = tally.total
+        tally.add(chunk.lhs, chunk.rhs)
+        current = tally.worst_indices
+        for index in current:
+            if index >= offset and index not in named:
+                named[index] = [labels[i] for i in chunk.indices[index - offset]]
+        named = {index: named[index] for index in current}
+    return tally, named
+
+
+def _finish(
+    tally: EquationTally, named: Named, columns: Sequence[str]
+) -> Dict[str, Any]:
+    result = tally.to_dict()
+    result["worst_equations"] = [
+        dict(zip(columns, named[index])) for index in result["worst_indices"]
+    ]
+    return result
+
+
+def tally_equation_chunks(
+    chunks: Iterable[EquationChunk],
+    policy: NumericPolicy,
+    labels: Sequence[str],
+    *,
+    columns: Sequence[str],
+    worst: int = 10,
+) -> Dict[str, Any]:
+    """Feed *chunks* into an :class:`EquationTally`, keeping labels of the worst.
+
+    Returns the tally dict plus ``worst_equations``: for each entry of
+    ``worst_indices``, a mapping ``column -> label`` identifying the equation.
+    """
+
+    tally, named = accumulate_chunks(chunks, policy, labels, worst=worst)
+    return _finish(tally, named, columns)
+
+
+def merge_tallies(
+    parts: Sequence[Tuple[EquationTally, Named]], columns: Sequence[str]
+) -> Dict[str, Any]:
+    """Combine per-shard ``accumulate_chunks`` results, in shard order."""
+
+    merged: EquationTally | None = None
+    named: Named = {}
+    for tally, part_named in parts:
+        if merged is None:
+            merged = EquationTally(tally.policy, worst=tally.worst)
+        offset = merged.total
+        merged.merge(tally)
+        named.update({offset + index: value for index, value in part_named.items()})
+    if merged is None:
+        raise ValueError("merge_tallies needs at least one part")
+    return _finish(merged, named, columns)
@@ -0,0 +1,190 @@
+"""Compiled fusion ring: integer labels, CSR fusion tensor, dual permutation."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ._fusion import _np, require_numpy, split_key
+
+__all__ = ["FusionRing"]
+
+
+class FusionRing:
+    """Fusion rules of a ``ac-mfusion`` / ``ac-umtc`` payload, parsed once.
+
+    Labels are interned to indices ``0..rank-1`` in ``simple_objects`` order.
+    ``N_{ab}^c`` is stored as a CSR tensor whose row ``a * rank + b`` lists the
+    ``c`` with non-zero multiplicity (``indptr``, ``indices``, ``data``, all
+    ``int32``/``int64``); the dense ``int32`` array :attr:`N` is built on first
+    use. ``dual`` is an index permutation and ``unit`` the index of the unit
+    object (``None`` when no single unit exists, e.g. multi-fusion input).
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        triples: Iterable[Tuple[int, int, int, int]],
+        dual: Sequence[int],
+    ) -> None:
+        require_numpy("FusionRing")
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self.index: Dict[str, int] = {label: i for i, label in enumerate(self.labels)}
+        n = self.rank = len(self.labels)
+
+        entries = sorted(triples)
+        rows = _np.array([(a * n + b) for a, b, _, _ in entries], dtype=_np.int64)
+        self.indices = _np.array([c for _, _, c, _ in entries], dtype=_np.int32)
+        self.data = _np.array([m for _, _, _, m in entries], dtype=_np.int32)
+        self.indptr = _np.searchsorted(rows, _np.arange(n * n + 1)).astype(_np.int64)
+        if _np.any(self.data <= 0):
+            raise ValueError("Fusion multiplicities must be positive")
+        if _np.any(_np.diff(rows * n + self.indices) == 0):
+            raise ValueError("Duplicate fusion channel")
+
+        self.dual = _np.asarray(dual, dtype=_np.int64)
+        if self.dual.shape != (n,) or sorted(self.dual.tolist()) != list(range(n)):
+            raise ValueError("dual must be a permutation of the simple objects")
+        self._dense: Optional[Any] = None
+        self.unit = self._find_unit()
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> "FusionRing":
+        """Build from ``simple_objects`` / ``dual`` / ``fusion_rules``."""
+
+        labels = list(payload["simple_objects"])
+        index = {label: i for i, label in enumerate(labels)}
+
+        def lookup(label: str, where: str) -> int:
+            try:
+                return index[label]
+            except KeyError:
+                raise ValueError(f"Unknown label {label!r} in {where}") from None
+
+        triples: List[Tuple[int, int, int, int]] = []
+        for key, products in payload["fusion_rules"].items():
+            a, b = (lookup(x, f"fusion_rules[{key!r}]") for x in split_key(key, 2))
+            for c, mult in products.items():
+                triples.append((a, b, lookup(c, f"fusion_rules[{key!r}]"), int(mult)))
+
+        raw_dual = payload.get("dual") or {}
+        missing = [label for label in labels if label not in raw_dual]
+        if missing:
+            raise ValueError(f"dual is missing {missing[0]!r}")
+        dual = [lookup(raw_dual[label], f"dual[{label!r}]") for label in labels]
+        return cls(labels, triples, dual)
+
+    @classmethod
+    def from_tensor(cls, labels: Sequence[str], N: Any) -> "FusionRing":
+        """Build from a dense ``N[a, b, c]``; duals are read off the unit channel."""
+
+        require_numpy("FusionRing")
+        N = _np.asarray(N)
+        n = len(labels)
+        if N.shape != (n, n, n):
+            raise ValueError(f"N must have shape {(n, n, n)}, got {N.shape}")
+        eye = _np.eye(n, dtype=N.dtype)
+        units = [
+            u
+            for u in range(n)
+            if _np.array_equal(N[u], eye) and _np.array_equal(N[:, u], eye)
+        ]
+        if len(units) != 1:
+            raise ValueError("N has no unique unit object")
+        to_unit = N[:, :, units[0]]
+        if not _np.array_equal(to_unit.sum(axis=1), _np.ones(n)):
+            raise ValueError("every object needs exactly one dual")
+        a_idx, b_idx, c_idx = _np.nonzero(N)
+        triples = zip(
+            a_idx.tolist(),
+            b_idx.tolist(),
+            c_idx.tolist(),
+            N[a_idx, b_idx, c_idx].tolist(),
+        )
+        return cls(labels, triples, _np.argmax(to_unit, axis=1).tolist())
+
+    def fusion_rules(self) -> Dict[str, Dict[str, int]]:
+        """``fusion_rules`` mapping in payload form (``"(a,b)" -> {c: N}``)."""
+
+        rules: Dict[str, Dict[str, int]] = {}
+        a_idx, b_idx, c_idx, mult = self.triples()
+        labels = self.labels
+        for a, b, c, m in zip(
+            a_idx.tolist(), b_idx.tolist(), c_idx.tolist(), mult.tolist()
+        ):
+            rules.setdefault(f"({labels[a]},{labels[b]})", {})[labels[c]] = m
+        return rules
+
+    # ----------------------------------------------------------------- access
+    @property
+    def N(self) -> Any:
+        """Dense ``int32`` tensor with ``N[a, b, c] = N_{ab}^c``."""
+
+        if self._dense is None:
+            n = self.rank
+            dense = _np.zeros(n * n * n, dtype=_np.int32)
+            rows = _np.repeat(_np.arange(n * n), _np.diff(self.indptr))
+            dense[rows * n + self.indices] = self.data
+            self._dense = dense.reshape(n, n, n)
+        return self._dense
+
+    @property
+    def nnz(self) -> int:
+        return int(self.data.size)
+
+    @property
+    def multiplicity_free(self) -> bool:
+        return bool(_np.all(self.data == 1))
+
+    def triples(self) -> Tuple[Any, Any, Any, Any]:
+        """COO arrays ``(a, b, c, mult)`` of all non-zero channels, sorted."""
+
+        rows = _np.repeat(_np.arange(self.rank * self.rank), _np.diff(self.indptr))
+        return rows // self.rank, rows % self.rank, self.indices, self.data
+
+    def channels(self, a: int, b: int) -> Dict[int, int]:
+        """``{c: N_{ab}^c}`` for one pair."""
+
+        row = a * self.rank + b
+        lo, hi = int(self.indptr[row]), int(self.indptr[row + 1])
+        return dict(zip(self.indices[lo:hi].tolist(), self.data[lo:hi].tolist()))
+
+    def fusion_matrix(self, a: int) -> Any:
+        """Left multiplication by ``a``: ``M[b, c] = N_{ab}^c``."""
+
+        return self.N[a]
+
+    # ------------------------------------------------------------ arithmetic
+    def fuse(self, x: Any, y: Any) -> Any:
+        """Product of two ring elements given as coefficient vectors."""
+
+        x = _np.asarray(x)
+        y = _np.asarray(y)
+        pair = _np.outer(x, y).ravel()
+        counts = _np.diff(self.indptr)
+        weights = _np.repeat(pair, counts) * self.data
+        if weights.dtype.kind in "iub":
+            out = _np.zeros(self.rank, dtype=weights.dtype)
+            _np.add.at(out, self.indices, weights)
+            return out
+        return _np.bincount(self.indices, weights=weights, minlength=self.rank)
+
+    def basis(self, a: int) -> Any:
+        vector = _np.zeros(self.rank, dtype=_np.int64)
+        vector[a] = 1
+        return vector
+
+    def _find_unit(self) -> Optional[int]:
+        n = self.rank
+        if not self.nnz:
+            return None
+        # u is the unit when every row (u, b) and (a, u) is the single channel b / a.
+        start = _np.minimum(self.indptr[:-1], self.nnz - 1).reshape(n, n)
+        target = _np.arange(n)
+        single = (_np.diff(self.indptr).reshape(n, n) == 1) & (self.data[start] == 1)
+        left = single & (self.indices[start] == target[None, :])
+        right = single & (self.indices[start] == target[:, None])
+        units = _np.flatnonzero(left.all(axis=1) & right.all(axis=0))
+        return int(units[0]) if units.size == 1 else None
+
+    def __repr__(self) -> str:
+        return f"FusionRing(rank={self.rank}, nnz={self.nnz})"
@@ -0,0 +1,190 @@
+"""Finite groups as multiplication tables, with classes and character tables."""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ._fusion import _np, require_numpy
+
+__all__ = ["FiniteGroup", "character_table"]
+
+
+class FiniteGroup:
+    """A finite group given by ``table[g, h] = index of g·h``.
+
+    Elements are ``0..order-1``; :attr:`identity` and :attr:`inverse` are
+    derived from the table, which is checked to be a Latin square with an
+    identity (associativity is the caller's responsibility).
+    """
+
+    def __init__(self, table: Any, labels: Optional[Sequence[str]] = None) -> None:
+        require_numpy("FiniteGroup")
+        self.table = _np.asarray(table, dtype=_np.int64)
+        n = self.order = self.table.shape[0]
+        if self.table.shape != (n, n) or n == 0:
+            raise ValueError("Group table must be a non-empty square matrix")
+        full = _np.arange(n)
+        if not all(
+            _np.array_equal(_np.sort(self.table[i]), full)
+            and _np.array_equal(_np.sort(self.table[:, i]), full)
+            for i in range(n)
+        ):
+            raise ValueError("Group table must be a Latin square on 0..order-1")
+        ids = _np.flatnonzero((self.table == full[None, :]).all(axis=1))
+        if ids.size != 1:
+            raise ValueError("Group table has no identity element")
+        self.identity = int(ids[0])
+        self.inverse = _np.argmax(self.table == self.identity, axis=1)
+        self.labels = tuple(labels) if labels is not None else tuple(map(str, full))
+
+    @classmethod
+    def from_permutations(cls, generators: Sequence[Sequence[int]]) -> "FiniteGroup":
+        """Close permutation *generators* (images of ``0..m-1``) into a group."""
+
+        gens = [tuple(int(x) for x in g) for g in generators]
+        if not gens:
+            raise ValueError("At least one generator is required")
+        degree = len(gens[0])
+        identity = tuple(range(degree))
+        elements: List[Tuple[int, ...]] = [identity]
+        index = {identity: 0}
+        frontier = [identity]
+        while frontier:
+            nxt = []
+            for p in frontier:
+                for g in gens:
+                    q = tuple(g[i] for i in p)
+                    if q not in index:
+                        index[q] = len(elements)
+                        elements.append(q)
+                        nxt.append(q)
+            frontier = nxt
+        perms = _np.array(elements, dtype=_np.int64)  # (n, degree)
+        n = len(elements)
+        # (p·q)(i) = p(q(i)): composed[p, q] = perms[p][perms[q]]
+        composed = perms[_np.arange(n)[:, None, None], perms[None, :, :]]
+        _, inverse = _np.unique(
+            _np.concatenate([perms, composed.reshape(n * n, degree)]),
+            axis=0,
+            return_inverse=True,
+        )
+        inverse = inverse.reshape(-1)
+        slot = _np.empty(n, dtype=_np.int64)
+        slot[inverse[:n]] = _np.arange(n)
+        table = slot[inverse[n:]].reshape(n, n)
+        return cls(table, labels=[" ".join(map(str, p)) for p in elements])
+
+    @classmethod
+    def cyclic(cls, n: int) -> "FiniteGroup":
+        full = _np.arange(n)
+        return cls((full[:, None] + full[None, :]) % n)
+
+    @property
+    def is_abelian(self) -> bool:
+        return bool(_np.array_equal(self.table, self.table.T))
+
+    def element_orders(self) -> Any:
+        orders = _np.ones(self.order, dtype=_np.int64)
+        power = _np.arange(self.order)
+        current = power.copy()
+        active = current != self.identity
+        while active.any():
+            current = _np.where(active, self.table[current, power], current)
+            orders += active
+            active = current != self.identity
+        return orders
+
+    @property
+    def exponent(self) -> int:
+        return int(_np.lcm.reduce(self.element_orders()))
+
+    def conjugation(self, of: Any, by: Any) -> Any:
+        """``result[h, x] = by[h] · of[x] · by[h]^-1``."""
+
+        left = self.table[_np.asarray(by)[:, None], _np.asarray(of)[None, :]]
+        return self.table[left, self.inverse[_np.asarray(by)][:, None]]
+
+    def classes(self, subgroup: Optional[Any] = None) -> Tuple[Any, List[int], Any]:
+        """Conjugacy classes of *subgroup* (default: the whole group).
+
+        Returns ``(class_of, reps, sizes)`` where ``class_of`` maps group
+        element -> class index (``-1`` outside the subgroup). The identity's
+        class is 0; the others follow in order of first appearance.
+        """
+
+        members = _np.arange(self.order) if subgroup is None else _np.asarray(subgroup)
+        conj = self.conjugation(members, members)  # [h, x]
+        class_of = _np.full(self.order, -1, dtype=_np.int64)
+        reps: List[int] = []
+        for column, x in enumerate(members.tolist()):
+            if class_of[x] < 0:
+                class_of[_np.unique(conj[:, column])] = len(reps)
+                reps.append(x)
+        ident = int(class_of[self.identity])
+        if ident != 0:  # move the identity class to the front
+            swap = {0: ident, ident: 0}
+            reps[0], reps[ident] = reps[ident], reps[0]
+            mapped = class_of.copy()
+            for src, dst in swap.items():
+                mapped[class_of == src] = dst
+            class_of = mapped
+        sizes = _np.bincount(class_of[class_of >= 0], minlength=len(reps))
+        return class_of, reps, sizes
+
+    def centralizer(self, g: int) -> Any:
+        return _np.flatnonzero(self.table[g] == self.table[:, g])
+
+
+def character_table(
+    group: FiniteGroup,
+    members: Any,
+    class_of: Any,
+    reps: Sequence[int],
+    sizes: Any,
+    *,
+    seed: int = 0,
+    attempts: int = 8,
+) -> Any:
+    """Irreducible characters of the subgroup *members* (Burnside's method).
+
+    The class-sum algebra is commutative with structure constants
+    ``c_ij^l = #{x ∈ C_i : x^-1 z_l ∈ C_j}``; its joint eigenvectors are the
+    central characters ``ω_χ(C) = |C| χ(g_C) / χ(1)``. They are read off a
+    random combination of the class matrices. Rows are irreps (trivial first,
+    then by degree), columns classes; values are complex.
+    """
+
+    k = len(reps)
+    order = int(len(members))
+    reps_arr = _np.asarray(reps)
+    mats = _np.zeros((k, k, k))
+    for i in range(k):
+        xs = _np.flatnonzero(class_of == i)
+        ys = group.table[group.inverse[xs][:, None], reps_arr[None, :]]
+        _np.add.at(
+            mats[i], (class_of[ys], _np.broadcast_to(_np.arange(k), ys.shape)), 1
+        )
+
+    rng = _np.random.default_rng(seed)
+    tol = 1e-8 * max(1, order)
+    for _ in range(attempts):
+        combo = _np.tensordot(rng.standard_normal(k), mats, axes=1)
+        values, vectors = _np.linalg.eig(combo)
+        gaps = _np.abs(values[:, None] - values[None, :]) + _np.eye(k) * 1e9
+        if gaps.min() < tol:
+            continue
+        omega = vectors / vectors[0]  # identity class -> ω = 1
+        degrees = _np.sqrt(order / (_np.abs(omega) ** 2 / sizes[:, None]).sum(axis=0))
+        degrees = _np.rint(degrees.real)
+        chars = omega.T * degrees[:, None] / sizes[None, :]
+        gram = (chars * sizes) @ chars.conj().T
+        if _np.allclose(gram, order * _np.eye(k), atol=1e-6 * order):
+            rows = sorted(
+                range(k),
+                key=lambda r: (
+                    degrees[r],
+                    [(-round(v.real, 6), -round(v.imag, 6)) for v in chars[r]],
+                ),
+            )
+            return chars[rows]
+    raise ValueError("Could not separate the irreducible characters numerically")
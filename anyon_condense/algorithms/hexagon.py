@@ -0,0 +1,200 @@
+"""Hexagon equations generated from R- and F-symbols and evaluated in chunks.
+
+With ``(F^{abc}_d)_{e,f}`` and ``R^{ab}_c`` as in :mod:`.symbols`, each basis
+pair ``e ∈ a⊗c, d ∈ e⊗b`` / ``g ∈ c⊗b, d ∈ a⊗g`` gives the two families
+
+    R^{ca}_e F^{acb}_d[e,g] R^{cb}_g = Σ_f F^{cab}_d[e,f] R^{cf}_d F^{abc}_d[f,g]
+    (R^{ac}_e)^-1 F^{acb}_d[e,g] (R^{bc}_g)^-1
+        = Σ_f F^{cab}_d[e,f] (R^{fc}_d)^-1 F^{abc}_d[f,g]
+
+called ``"R"`` and ``"R_inverse"`` below. Enumeration and chunking work as in
+:mod:`.pentagon`. For large ranks the start triples can be sharded across
+worker processes; each worker tallies its shard and the parent merges them.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from anyon_condense.core.consistency.numcheck import EquationTally
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+from ._fusion import (
+    FusionTable,
+    Rows,
+    _np,
+    filter_rows,
+    require_numpy,
+    segment_sum,
+    staged_chunks,
+)
+from .equations import EquationChunk, Named, accumulate_chunks, merge_tallies
+from .symbols import SymbolTable, f_symbol_table, r_symbol_table
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "HEXAGON_COLUMNS",
+    "HEXAGON_FAMILIES",
+    "PROCESS_POOL_MIN_RANK",
+    "check_hexagon_payload",
+    "hexagon_equation_chunks",
+]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Below this rank the whole check takes milliseconds; pool start-up dominates.
+PROCESS_POOL_MIN_RANK = 24
+
+HEXAGON_COLUMNS = ("a", "b", "c", "d", "e", "g")
+HEXAGON_FAMILIES = ("R", "R_inverse")
+
+
+def _hexagon_rows(fusion: FusionTable, start: Rows, chunk_size: int) -> Iterator[Rows]:
+    stages = [
+        lambda r: fusion.expand_first(r, "e", ("b", "d")),
+        lambda r: fusion.expand_pair(r, "c", "b", "g"),
+        lambda r: filter_rows(r, fusion.admissible(r["a"], r["g"], r["d"])),
+    ]
+    return staged_chunks(start, stages, chunk_size)
+
+
+def _start_rows(fusion: FusionTable, lo: int = 0, hi: Optional[int] = None) -> Rows:
+    return {"a": fusion.X[lo:hi], "c": fusion.Y[lo:hi], "e": fusion.Z[lo:hi]}
+
+
+def _evaluate(
+    fusion: FusionTable, F: SymbolTable, R: SymbolTable, family: str, r: Rows
+) -> EquationChunk:
+    a, b, c, d, e, g = (r[name] for name in HEXAGON_COLUMNS)
+    rep, f = fusion.expand_pair_indexed(r, "a", "b")
+    keep = fusion.admissible(f, c[rep], d[rep]) & fusion.admissible(c[rep], f, d[rep])
+    rep, f = rep[keep], f[keep]
+    a_, b_, c_, d_, e_, g_ = a[rep], b[rep], c[rep], d[rep], e[rep], g[rep]
+    middle = F.lookup(a, c, b, d, e, g)
+    outer = F.lookup(c_, a_, b_, d_, e_, f) * F.lookup(a_, b_, c_, d_, f, g_)
+    if family == "R":
+        lhs = R.lookup(c, a, e) * middle * R.lookup(c, b, g)
+        terms = outer * R.lookup(c_, f, d_)
+    else:
+        lhs = middle / (R.lookup(a, c, e) * R.lookup(b, c, g))
+        terms = outer / R.lookup(f, c_, d_)
+    rhs = segment_sum(rep, terms, a.size)
+    indices = _np.stack([r[name] for name in HEXAGON_COLUMNS], axis=1)
+    return EquationChunk(indices, lhs, rhs)
+
+
+def _check_family(family: str) -> None:
+    if family not in HEXAGON_FAMILIES:
+        raise ValueError(f"Unknown hexagon family {family!r}; use {HEXAGON_FAMILIES}")
+
+
+def hexagon_equation_chunks(
+    payload: Mapping[str, Any],
+    family: str = "R",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fusion: Optional[FusionTable] = None,
+    F: Optional[SymbolTable] = None,
+    R: Optional[SymbolTable] = None,
+) -> Iterator[EquationChunk]:
+    """Yield one hexagon family (``"R"`` or ``"R_inverse"``) chunk by chunk.
+
+    ``indices`` rows follow :data:`HEXAGON_COLUMNS`; ``lhs``/``rhs`` can be
+    passed straight to :func:`~anyon_condense.core.consistency.check_hexagon_arrays`.
+    """
+
+    require_numpy("hexagon_equation_chunks")
+    _check_family(family)
+    fusion = fusion or FusionTable.from_payload(payload)
+    F = F or f_symbol_table(payload, fusion)
+    R = R or r_symbol_table(payload, fusion)
+    for rows in _hexagon_rows(fusion, _start_rows(fusion), chunk_size):
+        yield _evaluate(fusion, F, R, family, rows)
+
+
+def _tally_shard(
+    fusion: FusionTable,
+    F: SymbolTable,
+    R: SymbolTable,
+    family: str,
+    bounds: Tuple[int, int],
+    policy: NumericPolicy,
+    chunk_size: int,
+    worst: int,
+) -> Tuple[EquationTally, Named]:
+    rows = _hexagon_rows(fusion, _start_rows(fusion, *bounds), chunk_size)
+    chunks = (_evaluate(fusion, F, R, family, r) for r in rows)
+    return accumulate_chunks(chunks, policy, fusion.labels, worst=worst)
+
+
+def check_hexagon_payload(
+    payload: Mapping[str, Any],
+    policy: NumericPolicy,
+    *,
+    worst: int = 10,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    process_threshold: int = PROCESS_POOL_MIN_RANK,
+) -> Dict[str, Any]:
+    """Generate and check both hexagon families of *payload*.
+
+    Returns the combined ``{status, failed, total, max_abs_err}`` and, under
+    ``families``, the per-family tally with ``worst_indices`` and
+    ``worst_equations``. With ``parallel=True`` and rank at least
+    ``process_threshold``, shards of the enumeration run in a process pool;
+    the result is identical to the serial one.
+    """
+
+    require_numpy("check_hexagon_payload")
+    fusion = FusionTable.from_payload(payload)
+    F = f_symbol_table(payload, fusion)
+    R = r_symbol_table(payload, fusion)
+
+    n_start = int(fusion.X.size)
+    workers = max_workers or os.cpu_count() or 1
+    use_pool = parallel and fusion.rank >= process_threshold and workers > 1
+    n_shards = min(n_start, 4 * workers) if use_pool else 1
+    edges = _np.linspace(0, n_start, n_shards + 1).astype(int).tolist()
+    shards = list(zip(edges[:-1], edges[1:]))
+
+    families: Dict[str, Any] = {}
+    if use_pool:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                family: [
+                    pool.submit(
+                        _tally_shard,
+                        fusion,
+                        F,
+                        R,
+                        family,
+                        bounds,
+                        policy,
+                        chunk_size,
+                        worst,
+                    )
+                    for bounds in shards
+                ]
+                for family in HEXAGON_FAMILIES
+            }
+            for family, parts in futures.items():
+                results = [future.result() for future in parts]
+                families[family] = merge_tallies(results, HEXAGON_COLUMNS)
+    else:
+        for family in HEXAGON_FAMILIES:
+            part = _tally_shard(
+                fusion, F, R, family, (0, n_start), policy, chunk_size, worst
+            )
+            families[family] = merge_tallies([part], HEXAGON_COLUMNS)
+
+    summaries: List[Dict[str, Any]] = list(families.values())
+    return {
+        "status": all(s["status"] for s in summaries),
+        "failed": sum(s["failed"] for s in summaries),
+        "total": sum(s["total"] for s in summaries),
+        "max_abs_err": max(s["max_abs_err"] for s in summaries),
+        "families": families,
+    }
@@ -0,0 +1,110 @@
+"""Pentagon equations generated from F-symbols and evaluated in chunks.
+
+With ``(F^{abc}_d)_{e,f}`` as in :func:`~.symbols.f_symbol_table`, every basis
+pair ``((ab)c)d -> e`` via ``f, g`` and ``a(b(cd)) -> e`` via ``l, k`` gives
+
+    F^{fcd}_e[g,l] F^{abl}_e[f,k] = Σ_h F^{abc}_g[f,h] F^{ahd}_e[g,k] F^{bcd}_k[h,l]
+
+Only admissible tuples are enumerated (vectorized joins over the fusion
+triples), and the sum over ``h`` is a segment sum, so no Python loop runs per
+equation. Memory is bounded by ``chunk_size`` rows per join stage.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+from ._fusion import (
+    FusionTable,
+    Rows,
+    _np,
+    filter_rows,
+    require_numpy,
+    segment_sum,
+    staged_chunks,
+)
+from .equations import EquationChunk, tally_equation_chunks
+from .symbols import SymbolTable, f_symbol_table
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "PENTAGON_COLUMNS",
+    "check_pentagon_payload",
+    "pentagon_equation_chunks",
+]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+PENTAGON_COLUMNS = ("a", "b", "c", "d", "e", "f", "g", "k", "l")
+
+
+def _pentagon_rows(fusion: FusionTable, chunk_size: int) -> Iterator[Rows]:
+    stages = [
+        lambda r: fusion.expand_first(r, "f", ("c", "g")),
+        lambda r: fusion.expand_first(r, "g", ("d", "e")),
+        lambda r: fusion.expand_pair(r, "c", "d", "l"),
+        lambda r: fusion.expand_pair(r, "b", "l", "k"),
+        lambda r: filter_rows(r, fusion.admissible(r["a"], r["k"], r["e"])),
+    ]
+    start = {"a": fusion.X, "b": fusion.Y, "f": fusion.Z}
+    return staged_chunks(start, stages, chunk_size)
+
+
+def _evaluate(fusion: FusionTable, F: SymbolTable, r: Rows) -> EquationChunk:
+    a, b, c, d, e = r["a"], r["b"], r["c"], r["d"], r["e"]
+    f, g, k, l_ = r["f"], r["g"], r["k"], r["l"]
+    lhs = F.lookup(f, c, d, e, g, l_) * F.lookup(a, b, l_, e, f, k)
+
+    rep, h = fusion.expand_pair_indexed(r, "b", "c")
+    keep = fusion.admissible(a[rep], h, g[rep]) & fusion.admissible(h, d[rep], k[rep])
+    rep, h = rep[keep], h[keep]
+    terms = (
+        F.lookup(a[rep], b[rep], c[rep], g[rep], f[rep], h)
+        * F.lookup(a[rep], h, d[rep], e[rep], g[rep], k[rep])
+        * F.lookup(b[rep], c[rep], d[rep], k[rep], h, l_[rep])
+    )
+    rhs = segment_sum(rep, terms, a.size)
+    indices = _np.stack([r[name] for name in PENTAGON_COLUMNS], axis=1)
+    return EquationChunk(indices, lhs, rhs)
+
+
+def pentagon_equation_chunks(
+    payload: Mapping[str, Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fusion: Optional[FusionTable] = None,
+    F: Optional[SymbolTable] = None,
+) -> Iterator[EquationChunk]:
+    """Yield pentagon equations of a ``ac-umtc`` payload chunk by chunk.
+
+    ``indices`` rows follow :data:`PENTAGON_COLUMNS`. Fusion rules must be
+    multiplicity-free; missing F-symbols of admissible tuples count as 0.
+    """
+
+    require_numpy("pentagon_equation_chunks")
+    fusion = fusion or FusionTable.from_payload(payload)
+    F = F or f_symbol_table(payload, fusion)
+    for rows in _pentagon_rows(fusion, chunk_size):
+        yield _evaluate(fusion, F, rows)
+
+
+def check_pentagon_payload(
+    payload: Mapping[str, Any],
+    policy: NumericPolicy,
+    *,
+    worst: int = 10,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Generate and check all pentagon equations of *payload*.
+
+    Same result shape as :func:`~anyon_condense.core.consistency.check_pentagon_arrays`
+    plus ``worst_equations`` (labels ``a..l`` of each worst failure).
+    """
+
+    fusion = FusionTable.from_payload(payload)
+    chunks = pentagon_equation_chunks(payload, chunk_size=chunk_size, fusion=fusion)
+    return tally_equation_chunks(
+        chunks, policy, fusion.labels, columns=PENTAGON_COLUMNS, worst=worst
+    )
@@ -0,0 +1,196 @@
+"""Structural checks of a fusion ring: unit, associativity, commutativity, duals.
+
+With ``L_a[x, y] = N_{ax}^y`` (left multiplication by ``a``), associativity
+``(a⊗b)⊗x = a⊗(b⊗x)`` reads ``L_b L_a = Σ_c N_{ab}^c L_c``. Both sides are
+computed for blocks of ``(a, b)`` as stacked matrix products in
+``O(block * rank^2)`` memory. Comparing every pair costs ``O(rank^5)``; for
+large ranks pairs are first screened with random integer probe vectors
+(Freivalds), which is ``O(rank^4)``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from anyon_condense.core.consistency.report import Report
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+from ._fusion import _np, require_numpy
+from .fusion_ring import FusionRing
+
+__all__ = [
+    "CHUNK_ELEMENTS",
+    "ENGINES",
+    "EXACT_MAX_RANK",
+    "check_fusion_payload",
+    "check_fusion_ring",
+]
+
+# Values of one (a, b-block, x, y) slab per side: 2**22 float64 -> 32 MiB.
+CHUNK_ELEMENTS = 1 << 22
+
+# float64 products are exact for integers below 2**53.
+_EXACT_FLOAT = float(2**53)
+
+ENGINES = ("auto", "exact", "probe")
+
+# "auto" compares every (a, b) pair exactly (O(rank^5)) up to this rank and
+# screens pairs with random probes (O(rank^4)) above it.
+EXACT_MAX_RANK = 64
+
+_PROBE_SEED = 0x5EED
+
+
+def _probe_candidates(L: Any, n: int, probes: int) -> Any:
+    """Boolean ``(a, b)`` mask of pairs whose probe residual is non-zero.
+
+    Integer probe vectors ``v`` give ``L_b L_a v`` and ``Σ_c N_ab^c L_c v`` in
+    ``O(rank^4 * probes)``; a non-associative pair survives all probes with
+    probability below ``2**(-20 * probes)``. Sums stay below ``2**53`` for the
+    ranks this module targets, so float64 BLAS products are exact.
+    """
+
+    rng = _np.random.default_rng(_PROBE_SEED)
+    V = rng.integers(0, 1 << 20, size=(n, probes)).astype(_np.float64)
+    U = (L.reshape(n * n, n) @ V).reshape(n, n, probes)  # U[c] = L_c V
+    stacked = L.reshape(n * n, n)  # rows (b, x)
+    U_flat = U.reshape(n, n * probes)
+    mask = _np.zeros((n, n), dtype=bool)
+    for a in range(n):
+        lhs = (stacked @ U[a]).reshape(n, n, probes)  # L_b (L_a V)
+        rhs = (L[a] @ U_flat).reshape(n, n, probes)  # Σ_c N_ab^c L_c V
+        mask[a] = _np.any(lhs != rhs, axis=(1, 2))
+    return mask
+
+
+def _associativity(
+    ring: FusionRing, chunk_elements: int, engine: str, probes: int
+) -> Dict[str, Any]:
+    n = ring.rank
+    N = ring.N
+    bound = float(N.max(initial=0)) ** 2 * n
+    dtype = _np.float64 if bound < _EXACT_FLOAT else _np.int64
+    L = N.astype(dtype)  # L[a] = left multiplication by a
+    flat = L.reshape(n, n * n)
+    block = max(1, min(n, chunk_elements // max(1, n * n)))
+
+    if engine == "auto":
+        engine = "exact" if n <= EXACT_MAX_RANK else "probe"
+    if engine == "probe":
+        candidates = _probe_candidates(L.astype(_np.float64), n, probes)
+    else:
+        candidates = _np.ones((n, n), dtype=bool)
+
+    violations = 0
+    max_err = 0
+    first: Optional[tuple] = None
+    for a in range(n):
+        bs = _np.flatnonzero(candidates[a])
+        for lo in range(0, bs.size, block):
+            sel = bs[lo : lo + block]
+            # (b, x, y): L_b L_a, as one (block * n, n) @ (n, n) product
+            lhs = (L[sel].reshape(-1, n) @ L[a]).reshape(sel.size, n, n)
+            rhs = (L[a, sel] @ flat).reshape(sel.size, n, n)  # Σ_c N_ab^c L_c
+            diff = _np.abs(lhs - rhs)
+            bad = _np.count_nonzero(diff)
+            if bad:
+                violations += bad
+                max_err = max(max_err, int(diff.max()))
+                if first is None:
+                    b, x, y = _np.unravel_index(int(_np.argmax(diff)), diff.shape)
+                    first = (a, int(sel[b]), int(x), int(y))
+    return {
+        "violations": violations,
+        "max_err": max_err,
+        "first": first,
+        "engine": engine,
+    }
+
+
+def _dual_violations(ring: FusionRing) -> Dict[str, Any]:
+    n = ring.rank
+    N = ring.N
+    dual = ring.dual
+    involution = int(_np.count_nonzero(dual[dual] != _np.arange(n)))
+    unit_pairs = 0
+    if ring.unit is not None:
+        expected = _np.zeros((n, n), dtype=N.dtype)
+        expected[_np.arange(n), dual] = 1
+        unit_pairs = int(_np.count_nonzero(N[:, :, ring.unit] != expected))
+    # (a⊗b)* = b*⊗a*  <=>  N_ab^c = N_{b* a*}^{c*}
+    twisted = N[_np.ix_(dual, dual, dual)].transpose(1, 0, 2)
+    anti = int(_np.count_nonzero(N != twisted))
+    return {"involution": involution, "unit_pairs": unit_pairs, "anti": anti}
+
+
+def check_fusion_ring(
+    ring: FusionRing,
+    policy: NumericPolicy,
+    *,
+    require_commutative: bool = False,
+    engine: str = "auto",
+    probes: int = 2,
+    chunk_elements: int = CHUNK_ELEMENTS,
+) -> Dict[str, Any]:
+    """Check unit, associativity, duals and (optionally) commutativity.
+
+    Returns a Report dict. Metrics count violated tensor entries:
+    ``assoc_violations`` / ``max_err_assoc`` for ``L_b L_a = Σ_c N_ab^c L_c``,
+    ``comm_violations`` for ``N_ab^c != N_ba^c`` (always reported, only fatal
+    with ``require_commutative``), ``dual_violations`` for a non-involutive
+    dual, ``N_ab^1 != δ_{b,a*}`` or ``N_ab^c != N_{b*a*}^{c*}``. All checks
+    are exact integer comparisons; *policy* is recorded in the snapshot.
+
+    ``engine="probe"`` first screens ``(a, b)`` pairs with ``probes`` random
+    integer vectors and compares only flagged pairs entry by entry; the notes
+    say so when this screening was used.
+    """
+
+    require_numpy("check_fusion_ring")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    assoc = _associativity(ring, chunk_elements, engine, probes)
+    comm = int(_np.count_nonzero(ring.N != ring.N.transpose(1, 0, 2)))
+    dual = _dual_violations(ring)
+    dual_total = dual["involution"] + dual["unit_pairs"] + dual["anti"]
+
+    problems: List[str] = []
+    if ring.unit is None:
+        problems.append("no unit object")
+    if assoc["violations"]:
+        a, b, x, y = (ring.labels[i] for i in assoc["first"])
+        problems.append(f"not associative, e.g. ({a}⊗{b})⊗{x} vs {a}⊗({b}⊗{x}) at {y}")
+    if require_commutative and comm:
+        problems.append("not commutative")
+    if dual["involution"]:
+        problems.append("dual is not an involution")
+    if dual["unit_pairs"]:
+        problems.append("N_ab^1 != delta(b, dual(a))")
+    if dual["anti"]:
+        problems.append("N_ab^c != N_{dual(b) dual(a)}^{dual(c)}")
+
+    return Report.from_policy(
+        status=not problems,
+        metrics={
+            "assoc_violations": assoc["violations"],
+            "max_err_assoc": assoc["max_err"],
+            "comm_violations": comm,
+            "dual_violations": dual_total,
+        },
+        policy=policy,
+        notes="; ".join(problems)
+        or (
+            "associativity screened with random probes"
+            if assoc["engine"] == "probe"
+            else None
+        ),
+    ).to_dict()
+
+
+def check_fusion_payload(
+    payload: Mapping[str, Any], policy: NumericPolicy, **kwargs: Any
+) -> Dict[str, Any]:
+    """:func:`check_fusion_ring` on a loaded input; ``umtc`` requires commutativity."""
+
+    kwargs.setdefault("require_commutative", payload.get("category_type") == "umtc")
+    return check_fusion_ring(FusionRing.from_payload(payload), policy, **kwargs)
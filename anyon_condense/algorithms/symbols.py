@@ -0,0 +1,147 @@
+"""Dense or sorted-sparse storage for F/R symbol values with vectorized lookup."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ._fusion import FusionTable, _np, parse_scalar, require_numpy, split_key
+
+__all__ = ["DENSE_LIMIT", "SymbolTable", "f_symbol_table", "r_symbol_table"]
+
+# Switch to the sorted-code representation above this many dense slots
+# (2**20 complex entries = 16 MiB).
+DENSE_LIMIT = 1 << 20
+
+
+class SymbolTable:
+    """Complex values indexed by ``arity`` label indices; absent entries are 0.
+
+    Small tables are stored as a dense ``rank**arity`` array. Larger ones keep
+    only the given entries as sorted integer codes and look up with
+    ``searchsorted``, so memory follows the number of admissible symbols.
+    """
+
+    def __init__(
+        self,
+        rank: int,
+        arity: int,
+        entries: Mapping[Tuple[int, ...], complex],
+        *,
+        dense_limit: int = DENSE_LIMIT,
+    ) -> None:
+        require_numpy("SymbolTable")
+        self.rank = rank
+        self.arity = arity
+        self.size = len(entries)
+        keys = _np.array(list(entries), dtype=_np.int64).reshape(-1, arity)
+        values = _np.array(list(entries.values()), dtype=_np.complex128)
+        codes = self._codes(tuple(keys.T)) if keys.size else _np.zeros(0, _np.int64)
+        self.dense: Optional[Any] = None
+        if rank**arity <= dense_limit:
+            self.dense = _np.zeros(rank**arity, dtype=_np.complex128)
+            self.dense[codes] = values
+        else:
+            order = _np.argsort(codes)
+            self._codes_sorted = codes[order]
+            self._values_sorted = values[order]
+
+    def _codes(self, indices: Tuple[Any, ...]) -> Any:
+        code = _np.zeros_like(_np.asarray(indices[0], dtype=_np.int64))
+        for column in indices:
+            code = code * self.rank + column
+        return code
+
+    def lookup(self, *indices: Any) -> Any:
+        """Vectorized ``table[i0, i1, ...]`` over equal-length index arrays."""
+
+        if len(indices) != self.arity:
+            raise ValueError(f"Expected {self.arity} index arrays")
+        codes = self._codes(indices)
+        if self.dense is not None:
+            return self.dense[codes]
+        if not self._codes_sorted.size:
+            return _np.zeros(codes.shape, dtype=_np.complex128)
+        pos = _np.searchsorted(self._codes_sorted, codes)
+        pos = _np.minimum(pos, self._codes_sorted.size - 1)
+        hit = self._codes_sorted[pos] == codes
+        return _np.where(hit, self._values_sorted[pos], 0.0 + 0.0j)
+
+    @classmethod
+    def from_field(
+        cls,
+        payload: Mapping[str, Any],
+        field: str,
+        fusion: FusionTable,
+        arity: int,
+        admissible: Callable[..., bool],
+        *,
+        dense_limit: int = DENSE_LIMIT,
+    ) -> "SymbolTable":
+        """Read ``payload[field]`` (object of ``"(labels)" -> number | [re, im]``)."""
+
+        raw = payload.get(field)
+        if not isinstance(raw, Mapping):
+            raise ValueError(f"{field} must be an object keyed by label tuples")
+        entries: Dict[Tuple[int, ...], complex] = {}
+        for key, value in raw.items():
+            labels = split_key(key, arity)
+            try:
+                idx = tuple(fusion.index[label] for label in labels)
+            except KeyError as exc:
+                raise ValueError(
+                    f"Unknown label {exc.args[0]!r} in {field}[{key!r}]"
+                ) from None
+            if not admissible(*idx):
+                raise ValueError(f"{field}[{key!r}] is not admissible")
+            entries[idx] = parse_scalar(value, f"{field}[{key!r}]")
+        return cls(fusion.rank, arity, entries, dense_limit=dense_limit)
+
+
+def f_symbol_table(
+    payload: Mapping[str, Any],
+    fusion: FusionTable,
+    *,
+    dense_limit: int = DENSE_LIMIT,
+) -> SymbolTable:
+    """Index ``F_symbols`` keyed ``"(a,b,c,d;e,f)"`` meaning ``(F^{abc}_d)_{e,f}``.
+
+    Admissible means ``e ∈ a⊗b``, ``d ∈ e⊗c``, ``f ∈ b⊗c`` and ``d ∈ a⊗f``.
+    """
+
+    ok = fusion.admissible
+
+    def admissible(a: int, b: int, c: int, d: int, e: int, f: int) -> bool:
+        return bool(ok(a, b, e) and ok(e, c, d) and ok(b, c, f) and ok(a, f, d))
+
+    return SymbolTable.from_field(
+        payload, "F_symbols", fusion, 6, admissible, dense_limit=dense_limit
+    )
+
+
+def r_symbol_table(
+    payload: Mapping[str, Any],
+    fusion: FusionTable,
+    *,
+    dense_limit: int = DENSE_LIMIT,
+) -> SymbolTable:
+    """Index ``R_symbols`` keyed ``"(a,b;c)"`` meaning ``R^{ab}_c``, ``c ∈ a⊗b``.
+
+    Every admissible triple must be present and non-zero, since the hexagon
+    equations also use ``1 / R``.
+    """
+
+    table = SymbolTable.from_field(
+        payload,
+        "R_symbols",
+        fusion,
+        3,
+        lambda a, b, c: bool(fusion.admissible(a, b, c)),
+        dense_limit=dense_limit,
+    )
+    values = table.lookup(fusion.X, fusion.Y, fusion.Z)
+    missing = _np.flatnonzero(values == 0)
+    if missing.size:
+        i = int(missing[0])
+        a, b, c = (fusion.labels[int(col[i])] for col in (fusion.X, fusion.Y, fusion.Z))
+        raise ValueError(f"R_symbols[({a},{b};{c})] is missing or zero")
+    return table
@@ -0,0 +1,141 @@
+"""Verlinde-formula cross-check of an S-matrix against fusion rules.
+
+``N_{ab}^c = Σ_x S_{ax} S_{bx} conj(S_{cx}) / S_{0x}`` is evaluated for every
+triple as matrix products over blocks of ``c`` (``rank**2 * block`` complex
+values alive at a time) and compared with the ring's multiplicities under the
+numeric policy.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from anyon_condense.core.consistency.numcheck import EquationTally, as_complex_array
+from anyon_condense.core.consistency.report import Report
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+from ._fusion import _np, require_numpy
+from .fusion_ring import FusionRing
+
+__all__ = [
+    "CHUNK_ELEMENTS",
+    "check_verlinde",
+    "check_verlinde_payload",
+    "verlinde_fusion_ring",
+]
+
+# Complex entries of one ``(a, b, c-block)`` slab: 2**22 -> 64 MiB.
+CHUNK_ELEMENTS = 1 << 22
+
+
+def _fail(policy: NumericPolicy, notes: str) -> Dict[str, Any]:
+    return Report.from_policy(
+        status=False, metrics={}, policy=policy, notes=notes
+    ).to_dict()
+
+
+def check_verlinde(
+    s: Any,
+    ring: FusionRing,
+    policy: NumericPolicy,
+    *,
+    objects: Optional[Sequence[str]] = None,
+    chunk_elements: int = CHUNK_ELEMENTS,
+    worst: int = 5,
+) -> Dict[str, Any]:
+    """Check the Verlinde formula for all ``(a, b, c)``; returns a Report dict.
+
+    *objects* gives the label order of the rows/columns of *s* (default: the
+    ring order). Metrics: ``max_err_verlinde`` (largest ``|Verlinde - N|``),
+    ``failed_triples`` and ``total_triples``; on failure the notes list the
+    worst triples.
+    """
+
+    require_numpy("check_verlinde")
+    n = ring.rank
+    matrix = as_complex_array(s, 2)
+    if matrix is None or matrix.shape != (n, n):
+        return _fail(policy, f"S must be a {n}x{n} matrix")
+    if objects is not None:
+        if sorted(objects) != sorted(ring.labels):
+            return _fail(policy, "S objects do not match the fusion ring labels")
+        order = [list(objects).index(label) for label in ring.labels]
+        matrix = matrix[_np.ix_(order, order)]
+    if ring.unit is None:
+        return _fail(policy, "Verlinde check needs a fusion ring with a unit object")
+    unit_row = matrix[ring.unit]
+    if not _np.all(_np.isfinite(matrix)) or _np.any(unit_row == 0):
+        return _fail(policy, "S must be finite with no zero in the unit row")
+
+    tally = EquationTally(policy, worst=worst)
+    a_idx, b_idx, c_idx, mult = ring.triples()
+    block = max(1, min(n, chunk_elements // max(1, n * n)))
+    for lo in range(0, n, block):
+        hi = min(n, lo + block)
+        weights = _np.conj(matrix[lo:hi]) / unit_row  # (c, x)
+        slab = (matrix[:, None, :] * weights[None, :, :]).reshape(-1, n)  # (b c, x)
+        verlinde = (matrix @ slab.T).reshape(n, n, hi - lo)  # (a, b, c)
+        expected = _np.zeros((n, n, hi - lo))
+        inside = (c_idx >= lo) & (c_idx < hi)
+        expected[a_idx[inside], b_idx[inside], c_idx[inside] - lo] = mult[inside]
+        # Order the flat index as (c, a, b) so tally indices decode globally.
+        tally.add(verlinde.transpose(2, 0, 1), expected.transpose(2, 0, 1))
+
+    result = tally.to_dict()
+    notes = None
+    if result["failed"]:
+        triples = []
+        for index in result["worst_indices"]:
+            c, rest = divmod(index, n * n)
+            a, b = divmod(rest, n)
+            triples.append(f"({ring.labels[a]},{ring.labels[b]};{ring.labels[c]})")
+        notes = f"Verlinde mismatch, worst (a,b;c): {', '.join(triples)}"
+    return Report.from_policy(
+        status=result["status"],
+        metrics={
+            "max_err_verlinde": result["max_abs_err"],
+            "failed_triples": result["failed"],
+            "total_triples": result["total"],
+        },
+        policy=policy,
+        notes=notes,
+    ).to_dict()
+
+
+def check_verlinde_payload(
+    output: Mapping[str, Any],
+    fusion_input: Mapping[str, Any],
+    policy: NumericPolicy,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Check ``output["S"]`` (ordered by ``output["objects"]``) against the input."""
+
+    ring = FusionRing.from_payload(fusion_input)
+    return check_verlinde(
+        output["S"], ring, policy, objects=output.get("objects"), **kwargs
+    )
+
+
+def verlinde_fusion_ring(
+    s: Any, labels: Sequence[str], *, unit: int = 0, tol: float = 1e-6
+) -> FusionRing:
+    """Fusion ring whose multiplicities are the Verlinde numbers of *s*.
+
+    Row/column ``unit`` of *s* belongs to the unit object. Raises
+    ``ValueError`` when a Verlinde number is further than *tol* from a
+    non-negative integer.
+    """
+
+    require_numpy("verlinde_fusion_ring")
+    matrix = as_complex_array(s, 2)
+    n = len(labels)
+    if matrix is None or matrix.shape != (n, n):
+        raise ValueError(f"S must be a {n}x{n} matrix")
+    weights = _np.conj(matrix) / matrix[unit]  # (c, x)
+    N = _np.empty((n, n, n))
+    for a in range(n):
+        N[a] = ((matrix * matrix[a]) @ weights.T).real  # (b, c)
+    counts = _np.rint(N)
+    if _np.abs(N - counts).max(initial=0.0) > tol or counts.min(initial=0) < 0:
+        raise ValueError("S does not give non-negative integer Verlinde numbers")
+    return FusionRing.from_tensor(labels, counts.astype(_np.int64))
@@ -8,6 +8,7 @@ import platform
 import sys
 from importlib import metadata
 
+from anyon_condense.core import jsoncodec
 from anyon_condense.core.exceptions import (
     CanonicalizationError,
     HashingError,
@@ -71,8 +72,8 @@ def _handle_num_dump(args: argparse.Namespace, policy) -> int:
         return 2
 
     try:
-        with open(args.input, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        with open(args.input, "rb") as handle:
+            payload = jsoncodec.loads(handle.read())
     except FileNotFoundError:
         print(f"[ac:num] File not found: {args.input}", file=sys.stderr)
         return 2
@@ -109,6 +110,44 @@ def _handle_num_dump(args: argparse.Namespace, policy) -> int:
     return 0
 
 
+def _handle_validate(args: argparse.Namespace) -> int:
+    from anyon_condense.core.batch import BatchSummary, collect_paths, validate_files
+
+    paths = collect_paths(args.target, args.pattern)
+    if not paths:
+        print(f"[ac:validate] No files matched: {args.target}", file=sys.stderr)
+        return 2
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    summary = BatchSummary()
+    try:
+        for result in validate_files(
+            paths,
+            schema=args.schema,
+            schema_dir=args.schema_dir,
+            readers=args.readers,
+            processes=args.jobs,
+            chunksize=args.chunksize,
+        ):
+            summary.add(result)
+            if args.failures_only and result.ok:
+                continue
+            out.write(jsoncodec.dumps(result.to_dict()).decode("utf-8") + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    stats = summary.to_dict()
+    print(
+        "[ac:validate] files={files} valid={valid} invalid={invalid} "
+        "secs={seconds:.3f} files/s={files_per_second} MB/s={mb_per_second}".format(
+            **stats
+        ),
+        file=sys.stderr,
+    )
+    return 0 if summary.invalid == 0 else 1
+
+
 def _handle_numeric_command(
     args: argparse.Namespace, num_parser: argparse.ArgumentParser
 ) -> int:
@@ -214,6 +253,40 @@ def main(argv: list[str] | None = None) -> int:
     )
     num_dump.set_defaults(dump=True)
 
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Batch-validate JSON documents against the v0 schemas",
+        description=(
+            "Validate a file, a directory (recursively) or a glob. Writes one JSON "
+            "result per file (JSON Lines) and a throughput summary to stderr."
+        ),
+    )
+    validate_parser.add_argument("target", help="File, directory or glob pattern")
+    validate_parser.add_argument(
+        "--pattern", default="*.json", help="File pattern inside a directory"
+    )
+    validate_parser.add_argument(
+        "--schema", help="Schema name (default: inferred from each file's 'format')"
+    )
+    validate_parser.add_argument("--schema-dir", help="Override the schema directory")
+    validate_parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Validation processes (default: CPU count; 0 validates in-process)",
+    )
+    validate_parser.add_argument(
+        "--readers", type=int, default=8, help="File reader threads"
+    )
+    validate_parser.add_argument(
+        "--chunksize", type=int, default=64, help="Files per worker task"
+    )
+    validate_parser.add_argument(
+        "--out", help="Write JSON Lines here instead of stdout"
+    )
+    validate_parser.add_argument(
+        "--failures-only", action="store_true", help="Only emit invalid files"
+    )
+
     args = parser.parse_args(argv)
 
     if args.version:
@@ -230,6 +303,9 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "num":
         return _handle_numeric_command(args, num_parser)
 
+    if args.command == "validate":
+        return _handle_validate(args)
+
     parser.print_help()
     return 0
 
@@ -1,17 +1,23 @@
 """Core helpers exposed for public use."""
 
 from .schema import (
+    SchemaRegistry,
     clear_caches,
+    get_registry,
     list_schemas,
     load_schema,
     resolve_schema_dir,
     validate,
+    warm_up,
 )
 
 __all__ = [
+    "SchemaRegistry",
     "clear_caches",
+    "get_registry",
     "list_schemas",
     "load_schema",
     "resolve_schema_dir",
     "validate",
+    "warm_up",
 ]
@@ -0,0 +1,224 @@
+"""Validate many JSON documents: threaded reads, process-pool validation.
+
+Files are read and parsed on a thread pool and handed, in chunks, to a pool
+of worker processes that warm the schema registry once and validate with the
+compiled validators of :mod:`.schema`. Results are yielded in input order as
+soon as their chunk finishes, so callers can stream them.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import pathlib
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import jsoncodec
+from .exceptions import SchemaError
+from .schema import validation_error, warm_up
+
+__all__ = [
+    "BatchSummary",
+    "ValidationResult",
+    "collect_paths",
+    "schema_for",
+    "validate_files",
+]
+
+# (path, size in bytes, parsed payload, read/parse error)
+_Read = Tuple[str, int, Any, Optional[str]]
+# (schema name, error) per payload
+_Outcome = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class ValidationResult:
+    """Outcome for one file; ``error`` is ``None`` when it is valid."""
+
+    path: str
+    schema: Optional[str]
+    ok: bool
+    error: Optional[str] = None
+    bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchSummary:
+    """Running totals over :class:`ValidationResult` objects."""
+
+    files: int = 0
+    valid: int = 0
+    invalid: int = 0
+    bytes: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    seconds: float = 0.0
+
+    def add(self, result: ValidationResult) -> None:
+        self.files += 1
+        self.bytes += result.bytes
+        if result.ok:
+            self.valid += 1
+        else:
+            self.invalid += 1
+        self.seconds = time.perf_counter() - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        seconds = self.seconds or 1e-9
+        return {
+            "files": self.files,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 6),
+            "files_per_second": round(self.files / seconds, 1),
+            "mb_per_second": round(self.bytes / seconds / 1e6, 3),
+        }
+
+
+def collect_paths(target: str | pathlib.Path, pattern: str = "*.json") -> List[str]:
+    """Files to validate: *target* itself, every *pattern* match below a
+    directory, or the matches of *target* as a (recursive) glob."""
+
+    path = pathlib.Path(target)
+    if path.is_dir():
+        return sorted(str(p) for p in path.rglob(pattern) if p.is_file())
+    if path.is_file():
+        return [str(path)]
+    return sorted(p for p in glob.glob(str(target), recursive=True))
+
+
+def schema_for(payload: Any) -> Optional[str]:
+    """Infer the v0 schema of *payload* from ``format`` and its fields."""
+
+    if not isinstance(payload, dict):
+        return None
+    fmt = payload.get("format")
+    if fmt == "ac-mfusion":
+        return "mfusion_input.schema.json"
+    if fmt == "ac-umtc":
+        if "simple_objects" in payload:
+            return "umtc_input.schema.json"
+        return "umtc_output.schema.json"
+    return None
+
+
+def _read(path: str) -> _Read:
+    try:
+        data = pathlib.Path(path).read_bytes()
+    except OSError as exc:
+        return path, 0, None, f"read_error: {exc.__class__.__name__}: {exc}"
+    try:
+        return path, len(data), jsoncodec.loads(data), None
+    except ValueError as exc:
+        return path, len(data), None, f"json_decode_error: {exc}"
+
+
+def _validate_chunk(
+    payloads: List[Any],
+    schema: Optional[str],
+    schema_dir: Optional[str],
+) -> List[_Outcome]:
+    outcomes: List[_Outcome] = []
+    for payload in payloads:
+        name = schema or schema_for(payload)
+        if name is None:
+            outcomes.append((None, "unknown_schema: no recognised 'format' field"))
+        else:
+            try:
+                outcomes.append((name, validation_error(payload, name, schema_dir)))
+            except SchemaError as exc:  # e.g. unknown schema name
+                outcomes.append((name, f"schema_error: {exc}"))
+    return outcomes
+
+
+def _init_worker(schema_dir: Optional[str]) -> None:
+    warm_up(schema_dir)
+
+
+def _read_ahead(pool: Executor, paths: Iterable[str], window: int) -> Iterator[_Read]:
+    pending: Deque[Future] = deque()
+    for path in paths:
+        pending.append(pool.submit(_read, path))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def validate_files(
+    paths: Iterable[str | pathlib.Path],
+    *,
+    schema: Optional[str] = None,
+    schema_dir: Optional[str | pathlib.Path] = None,
+    readers: int = 8,
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+) -> Iterator[ValidationResult]:
+    """Validate each file in *paths*, yielding results in input order.
+
+    *schema* forces one schema name; by default it is inferred per file with
+    :func:`schema_for`. ``processes=None`` uses one worker per CPU and
+    ``processes=0`` validates in the calling process (no pickling, useful for
+    small batches). Unreadable or unparsable files yield failed results
+    rather than raising.
+    """
+
+    directory = None if schema_dir is None else str(schema_dir)
+    window = max(chunksize, 1)
+    max_inflight = 2 * (processes or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=readers) as reader_pool:
+        workers: Optional[ProcessPoolExecutor] = None
+        if processes != 0:
+            workers = ProcessPoolExecutor(
+                max_workers=processes, initializer=_init_worker, initargs=(directory,)
+            )
+        else:
+            warm_up(directory)
+        try:
+            inflight: Deque[Tuple[List[_Read], Future]] = deque()
+
+            def submit(chunk: List[_Read]) -> None:
+                payloads = [read[2] for read in chunk if read[3] is None]
+                future: Future
+                if workers is None:
+                    future = Future()
+                    future.set_result(_validate_chunk(payloads, schema, directory))
+                else:
+                    future = workers.submit(
+                        _validate_chunk, payloads, schema, directory
+                    )
+                inflight.append((chunk, future))
+
+            def drain() -> Iterator[ValidationResult]:
+                chunk, future = inflight.popleft()
+                outcomes = iter(future.result())
+                for path, size, _, read_error in chunk:
+                    if read_error is not None:
+                        yield ValidationResult(path, schema, False, read_error, size)
+                        continue
+                    name, error = next(outcomes)
+                    yield ValidationResult(path, name, error is None, error, size)
+
+            chunk: List[_Read] = []
+            names = (str(path) for path in paths)
+            for read in _read_ahead(reader_pool, names, readers * 4):
+                chunk.append(read)
+                if len(chunk) >= window:
+                    submit(chunk)
+                    chunk = []
+                    while len(inflight) > max_inflight:
+                        yield from drain()
+            if chunk:
+                submit(chunk)
+            while inflight:
+                yield from drain()
+        finally:
+            if workers is not None:
+                workers.shutdown(cancel_futures=True)
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from anyon_condense.core.consistency.numcheck import (
+    approx_equal_mask,
     approx_equal_matrices,
+    as_complex_array,
     max_abs_diff,
 )
 from anyon_condense.scalars.numeric_policy import NumericPolicy
 
 from .report import Report
 
+try:  # NumPy is optional; the pure-Python loops below are the fallback
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    _np = None  # type: ignore[assignment]
+
 Number = Union[int, float, complex]
 
+ENGINES = ("auto", "numpy", "python")
+
 
 def _eye(n: int) -> List[List[complex]]:
     return [[1.0 + 0.0j if i == j else 0.0 + 0.0j for j in range(n)] for i in range(n)]
@@ -32,43 +41,200 @@ def _matmul(
     return result
 
 
-def _matpow(a: Sequence[Sequence[complex]], power: int) -> List[List[complex]]:
-    if power == 0:
-        return _eye(len(a))
-    acc: List[List[complex]] = _eye(len(a))
-    base: List[List[complex]] = [list(row) for row in a]
-    exp = power
-    while exp > 0:
-        if exp & 1:
-            acc = _matmul(acc, base)
-        base = _matmul(base, base)
-        exp >>= 1
-    return acc
+def _is_diagonal(m: Sequence[Sequence[complex]]) -> bool:
+    return all(
+        value == 0 for i, row in enumerate(m) for j, value in enumerate(row) if i != j
+    )
+
+
+def _times_diagonal(
+    a: Sequence[Sequence[complex]], diag: Sequence[complex]
+) -> List[List[complex]]:
+    """Return ``a @ diag(diag)``, i.e. scale column ``j`` by ``diag[j]``."""
+
+    return [[value * d for value, d in zip(row, diag)] for row in a]
+
+
+def _conj_transpose(a: Sequence[Sequence[complex]]) -> List[List[complex]]:
+    return [[row[i].conjugate() for row in a] for i in range(len(a[0]))]
+
+
+def _involution(
+    m: Sequence[Sequence[complex]], policy: NumericPolicy
+) -> Optional[List[int]]:
+    """``perm`` with ``m ≈ P`` for the involutive permutation ``P[i, perm[i]] = 1``."""
+
+    n = len(m)
+    perm = [max(range(n), key=lambda j: abs(row[j])) for row in m]
+    if any(perm[perm[i]] != i for i in range(n)):
+        return None
+    target = [[1.0 if j == perm[i] else 0.0 for j in range(n)] for i in range(n)]
+    return perm if approx_equal_matrices(m, target, policy) else None
+
+
+def _fourth_from_involution(
+    s_squared: Sequence[Sequence[complex]], perm: Sequence[int]
+) -> List[List[complex]]:
+    """``S^4`` from ``S^2 = P + E`` as ``I + PE + EP`` (the ``E^2`` term dropped)."""
+
+    n = len(perm)
+    err = [
+        [value - (1.0 if j == perm[i] else 0.0) for j, value in enumerate(row)]
+        for i, row in enumerate(s_squared)
+    ]
+    return [
+        [(1.0 if i == j else 0.0) + err[perm[i]][j] + err[i][perm[j]] for j in range(n)]
+        for i in range(n)
+    ]
+
+
+_NOT_UNITARY_NOTE = "S is not unitary; (ST)^3 and S^4 checks skipped."
+
+
+def _involution_numpy(m: Any, policy: NumericPolicy) -> Optional[Any]:
+    """NumPy version of :func:`_involution` (``perm`` as an index array)."""
+
+    perm = _np.abs(m).argmax(axis=1)
+    if not (perm[perm] == _np.arange(perm.size)).all():
+        return None
+    target = _np.eye(perm.size, dtype=m.dtype)[perm]
+    return perm if approx_equal_mask(m, target, policy).all() else None
+
+
+def _modular_metrics_numpy(
+    s_matrix: Sequence[Sequence[Number]],
+    t_matrix: Sequence[Sequence[Number]],
+    policy: NumericPolicy,
+    check_unitary: bool,
+) -> Optional[Tuple[bool, Dict[str, float], Optional[str]]]:
+    """BLAS-backed (ST)^3 = S^2 and S^4 = I checks; None if not applicable."""
+
+    s = as_complex_array(s_matrix, 2)
+    t = as_complex_array(t_matrix, 2)
+    if s is None or t is None or s.shape != t.shape or s.shape[0] != s.shape[1]:
+        return None
+    if s.shape[0] == 0 or not (_np.isfinite(s).all() and _np.isfinite(t).all()):
+        return None  # keep the scalar path's error/short-circuit semantics
+
+    identity = _np.eye(s.shape[0], dtype=_np.complex128)
+    metrics: Dict[str, float] = {}
+    if check_unitary:
+        s_s_dag = s @ s.conj().T
+        metrics["max_err_ssdag_i"] = float(_np.abs(s_s_dag - identity).max())
+        if not approx_equal_mask(s_s_dag, identity, policy).all():
+            return False, metrics, _NOT_UNITARY_NOTE
+
+    t_diag = _np.diagonal(t)
+    diagonal = _np.count_nonzero(t - _np.diag(t_diag)) == 0
+    s_squared = s @ s
+    perm = _involution_numpy(s_squared, policy)
+    if perm is not None:
+        err = s_squared - identity[perm]
+        s_fourth = identity + err[perm] + err[:, perm]
+    else:
+        s_fourth = s_squared @ s_squared
+    if diagonal and perm is not None and _np.count_nonzero(t_diag) == t_diag.size:
+        # (ST)^3 = S^2  <=>  STS = T^-1 S T^-1  (S invertible: S^2 ≈ P).
+        lhs = (s * t_diag[_np.newaxis, :]) @ s
+        rhs = s / _np.outer(t_diag, t_diag)
+    else:
+        st = s * t_diag[_np.newaxis, :] if diagonal else s @ t
+        lhs, rhs = (st @ st) @ st, s_squared
+    if not (_np.isfinite(lhs).all() and _np.isfinite(s_fourth).all()):
+        return None
+
+    ok = bool(
+        approx_equal_mask(lhs, rhs, policy).all()
+        and approx_equal_mask(s_fourth, identity, policy).all()
+    )
+    metrics["max_err_st3_s2"] = float(_np.abs(lhs - rhs).max())
+    metrics["max_err_s4_i"] = float(_np.abs(s_fourth - identity).max())
+    return ok, metrics, None
 
 
 def check_modular_relations(
     s_matrix: Sequence[Sequence[Number]],
     t_matrix: Sequence[Sequence[Number]],
     policy: NumericPolicy,
+    *,
+    engine: str = "auto",
+    check_unitary: bool = False,
 ) -> Dict[str, Any]:
-    """Check modular identities using approximate comparisons."""
+    """Check modular identities using approximate comparisons.
+
+    ``engine="numpy"`` computes the products with NumPy/BLAS and compares them
+    with vectorized tolerance checks; ``"python"`` uses the pure-Python triple
+    loops; ``"auto"`` (default) prefers NumPy when installed. Both engines
+    produce the same report (metrics agree up to floating-point rounding).
+
+    Two dense products suffice for modular data: ``S^2`` and ``S·T·S``.
+    ``S^4 = I`` is checked as "``S^2`` is close to an involutive permutation
+    ``P``": with ``S^2 = P + E``, ``S^4 - I = PE + EP + E^2`` is evaluated in
+    O(n^2) up to the second-order ``E^2``. Such an ``S`` is invertible, so
+    with diagonal invertible ``T`` the identity ``(ST)^3 = S^2`` is
+    equivalent to ``STS = T^-1 S T^-1``, whose right-hand side is a row and
+    column scaling. ``max_err_st3_s2`` / ``max_err_s4_i`` then report the
+    residuals of these equivalent forms. Otherwise (non-diagonal or singular
+    ``T``, ``S^2`` not a permutation) the products ``(ST)^3`` and
+    ``(S^2)^2`` are formed densely. With ``check_unitary=True`` the
+    ``S·S† = I`` check runs first (metric ``max_err_ssdag_i``); if it fails
+    the report returns early.
+    """
+
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if engine == "numpy" and _np is None:
+        raise ImportError("engine='numpy' requested but numpy is not installed")
+
+    if engine != "python" and _np is not None:
+        result = _modular_metrics_numpy(s_matrix, t_matrix, policy, check_unitary)
+        if result is not None:
+            ok, fast_metrics, notes = result
+            return Report.from_policy(
+                status=ok, metrics=fast_metrics, policy=policy, notes=notes
+            ).to_dict()
 
     s_complex = [[complex(entry) for entry in row] for row in s_matrix]
     t_complex = [[complex(entry) for entry in row] for row in t_matrix]
 
     identity = _eye(len(s_complex))
-    st = _matmul(s_complex, t_complex)
-    st_cubed = _matpow(st, 3)
-    s_squared = _matpow(s_complex, 2)
-    s_fourth = _matpow(s_complex, 4)
-
-    ok_st3_eq_s2 = approx_equal_matrices(st_cubed, s_squared, policy)
+    metrics: Dict[str, float] = {}
+    if check_unitary:
+        s_s_dag = _matmul(s_complex, _conj_transpose(s_complex))
+        metrics["max_err_ssdag_i"] = max_abs_diff(s_s_dag, identity)
+        if not approx_equal_matrices(s_s_dag, identity, policy):
+            return Report.from_policy(
+                status=False, metrics=metrics, policy=policy, notes=_NOT_UNITARY_NOTE
+            ).to_dict()
+
+    n = len(s_complex)
+    diagonal = _is_diagonal(t_complex)
+    t_diag = [t_complex[i][i] for i in range(n)]
+    s_squared = _matmul(s_complex, s_complex)
+    perm = _involution(s_squared, policy)
+    if perm is not None:
+        s_fourth = _fourth_from_involution(s_squared, perm)
+    else:
+        s_fourth = _matmul(s_squared, s_squared)
+    if diagonal and perm is not None and all(t_diag):
+        lhs = _matmul(_times_diagonal(s_complex, t_diag), s_complex)
+        rhs = [
+            [value / (t_diag[i] * t_diag[j]) for j, value in enumerate(row)]
+            for i, row in enumerate(s_complex)
+        ]
+    else:
+        st = (
+            _times_diagonal(s_complex, t_diag)
+            if diagonal
+            else _matmul(s_complex, t_complex)
+        )
+        lhs, rhs = _matmul(_matmul(st, st), st), s_squared
+
+    ok_st3_eq_s2 = approx_equal_matrices(lhs, rhs, policy)
     ok_s4_eq_i = approx_equal_matrices(s_fourth, identity, policy)
 
-    metrics = {
-        "max_err_st3_s2": max_abs_diff(st_cubed, s_squared),
-        "max_err_s4_i": max_abs_diff(s_fourth, identity),
-    }
+    metrics["max_err_st3_s2"] = max_abs_diff(lhs, rhs)
+    metrics["max_err_s4_i"] = max_abs_diff(s_fourth, identity)
 
     report = Report.from_policy(
         status=bool(ok_st3_eq_s2 and ok_s4_eq_i),
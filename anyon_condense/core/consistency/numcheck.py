@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+import heapq
+from typing import Any, Dict, List, Sequence, Tuple, Union
 
+from anyon_condense.core.exceptions import NumericFieldError
 from anyon_condense.scalars.numeric_policy import NumericPolicy, approx_equal
 
+try:  # NumPy is optional; the scalar helpers below are the reference path
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    _np = None  # type: ignore[assignment]
+
 Number = Union[int, float, complex]
 
 __all__ = [
     "approx_equal_number",
     "approx_equal_vectors",
     "approx_equal_matrices",
+    "approx_equal_mask",
+    "as_complex_array",
+    "check_equation_arrays",
+    "EquationTally",
+    "have_numpy",
     "max_abs_diff",
 ]
 
 
+def have_numpy() -> bool:
+    """Return True when the optional NumPy array helpers are usable."""
+
+    return _np is not None
+
+
 def approx_equal_number(a: Number, b: Number, policy: NumericPolicy) -> bool:
     """Return True when two scalars are approximately equal under the policy."""
 
@@ -61,3 +79,174 @@ def max_abs_diff(a: Sequence[Sequence[Number]], b: Sequence[Sequence[Number]]) -
             if diff > maximum:
                 maximum = diff
     return maximum
+
+
+def as_complex_array(values: Any, ndim: int) -> Any:
+    """Return *values* as a complex128 array of rank *ndim*, or None.
+
+    Falls back to element-wise ``complex()`` (which also parses strings such as
+    ``"0.5-1j"``, as the scalar path does). Returns None for ragged input, a
+    different rank or values that cannot be converted.
+    """
+
+    try:
+        array = _np.asarray(values, dtype=_np.complex128)
+    except (TypeError, ValueError):
+        try:
+            array = _np.asarray(
+                (
+                    [[complex(entry) for entry in row] for row in values]
+                    if ndim == 2
+                    else [complex(entry) for entry in values]
+                ),
+                dtype=_np.complex128,
+            )
+        except (TypeError, ValueError):
+            return None
+    if array.ndim != ndim:
+        return None
+    return array
+
+
+def _clip_small_array(x: Any, policy: NumericPolicy) -> Any:
+    if not _np.isfinite(x).all():
+        bad = x[~_np.isfinite(x)].flat[0]
+        raise NumericFieldError(f"Non-finite float: {float(bad)!r}")
+    if not policy.clip_small:
+        return x
+    threshold = 10.0 ** (-(policy.precision + 1))
+    return _np.where(_np.abs(x) < threshold, 0.0, x)
+
+
+def approx_equal_mask(a: Any, b: Any, policy: NumericPolicy) -> Any:
+    """Element-wise :func:`approx_equal_number` over two NumPy arrays.
+
+    Real and imaginary parts are compared separately under the policy, exactly
+    like the scalar path. Raises :class:`NumericFieldError` on non-finite input.
+    """
+
+    a = _np.asarray(a)
+    b = _np.asarray(b)
+    mask = _np.ones(_np.broadcast_shapes(a.shape, b.shape), dtype=bool)
+    parts = [(a.real, b.real)]
+    if _np.iscomplexobj(a) or _np.iscomplexobj(b):
+        parts.append((a.imag, b.imag))
+    for x, y in parts:
+        x = _clip_small_array(x.astype(_np.float64), policy)
+        y = _clip_small_array(y.astype(_np.float64), policy)
+        eps = _np.maximum(
+            policy.tol_abs, policy.tol_rel * _np.maximum(_np.abs(x), _np.abs(y))
+        )
+        mask &= _np.abs(x - y) <= eps
+    return mask
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class EquationTally:
+    """Accumulate policy-aware ``lhs ≈ rhs`` checks over array chunks.
+
+    Chunks are compared with :func:`approx_equal_mask`, so the verdict per
+    equation is the same as :func:`approx_equal_number`. Only counters, the
+    running maximum error and the ``worst`` largest failures are kept, so
+    memory does not grow with the number of equations.
+    """
+
+    def __init__(self, policy: NumericPolicy, *, worst: int = 10) -> None:
+        if _np is None:
+            raise ImportError("EquationTally requires numpy")
+        self.policy = policy
+        self.worst = max(0, worst)
+        self.total = 0
+        self.failed = 0
+        self.max_abs_err = 0.0
+        self._worst: List[Tuple[float, int]] = []  # min-heap of (err, index)
+
+    def add(self, lhs: Any, rhs: Any) -> None:
+        """Compare one chunk; indices continue from the previous chunks."""
+
+        a = _np.asarray(lhs).ravel()
+        b = _np.asarray(rhs).ravel()
+        if a.shape != b.shape:
+            raise ValueError(f"lhs/rhs size mismatch: {a.size} != {b.size}")
+        if a.size == 0:
+            return
+
+        ok = approx_equal_mask(a, b, self.policy)
+        err = _np.abs(a - b)
+        offset = self.total
+        self.total += int(a.size)
+        self.max_abs_err = max(self.max_abs_err, float(err.max()))
+
+        failing = _np.flatnonzero(~ok)
+        self.failed += int(failing.size)
+        if not self.worst or not failing.size:
+            return
+        if failing.size > self.worst:
+            top = _np.argpartition(err[failing], -self.worst)[-self.worst :]
+            failing = failing[top]
+        for index in failing.tolist():
+            item = (float(err[index]), offset + index)
+            if len(self._worst) < self.worst:
+                heapq.heappush(self._worst, item)
+            elif item > self._worst[0]:
+                heapq.heapreplace(self._worst, item)
+
+    def merge(self, other: "EquationTally") -> None:
+        """Append *other*'s equations after the ones seen so far."""
+
+        offset = self.total
+        self.total += other.total
+        self.failed += other.failed
+        self.max_abs_err = max(self.max_abs_err, other.max_abs_err)
+        for err, index in other._worst:
+            item = (err, offset + index)
+            if len(self._worst) < self.worst:
+                heapq.heappush(self._worst, item)
+            elif self.worst and item > self._worst[0]:
+                heapq.heapreplace(self._worst, item)
+
+    @property
+    def worst_indices(self) -> List[int]:
+        """Global indices of the largest failing errors seen so far, worst first."""
+
+        ranked = sorted(self._worst, key=lambda item: (-item[0], item[1]))
+        return [index for _, index in ranked]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.failed == 0,
+            "failed": self.failed,
+            "total": self.total,
+            "max_abs_err": self.max_abs_err,
+            "worst_indices": self.worst_indices,
+        }
+
+
+def check_equation_arrays(
+    lhs: Any,
+    rhs: Any,
+    policy: NumericPolicy,
+    *,
+    worst: int = 10,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Bulk ``lhs ≈ rhs`` over two arrays/buffers (flattened in C order).
+
+    Returns ``{status, failed, total}`` like the tuple-based checkers plus
+    ``max_abs_err`` and ``worst_indices`` (flat indices of the largest failing
+    errors, worst first).
+    """
+
+    if _np is None:
+        raise ImportError("check_equation_arrays requires numpy")
+    a = _np.asarray(lhs).ravel()
+    b = _np.asarray(rhs).ravel()
+    if a.shape != b.shape:
+        raise ValueError(f"lhs/rhs size mismatch: {a.size} != {b.size}")
+    tally = EquationTally(policy, worst=worst)
+    step = max(1, chunk_size)
+    for start in range(0, a.size, step):
+        tally.add(a[start : start + step], b[start : start + step])
+    return tally.to_dict()
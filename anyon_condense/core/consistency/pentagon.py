@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, Tuple, Union
 
-from anyon_condense.core.consistency.numcheck import approx_equal_number
+from anyon_condense.core.consistency.numcheck import (
+    DEFAULT_CHUNK_SIZE,
+    approx_equal_number,
+    check_equation_arrays,
+)
 from anyon_condense.scalars.numeric_policy import NumericPolicy
 
 Number = Union[int, float, complex]
@@ -18,3 +22,20 @@ def check_pentagon_equations(
         if not approx_equal_number(lhs, rhs, policy):
             failed += 1
     return {"status": failed == 0, "failed": failed, "total": total}
+
+
+def check_pentagon_arrays(
+    lhs: Any,
+    rhs: Any,
+    policy: NumericPolicy,
+    *,
+    worst: int = 10,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Array form of :func:`check_pentagon_equations` (requires NumPy).
+
+    *lhs* and *rhs* are complex arrays or buffers of equal size, compared in
+    chunks of ``chunk_size``. Adds ``max_abs_err`` and ``worst_indices``.
+    """
+
+    return check_equation_arrays(lhs, rhs, policy, worst=worst, chunk_size=chunk_size)
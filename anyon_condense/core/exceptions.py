@@ -35,3 +35,9 @@ class NumericFieldError(Exception):
     """Raised when numeric values violate finite-domain constraints."""
 
     pass
+
+
+class PipelineError(Exception):
+    """Raised for malformed pipeline graphs or failing pipeline stages."""
+
+    pass
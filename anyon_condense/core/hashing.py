@@ -3,33 +3,62 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Dict, Sequence, Union
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from anyon_condense.scalars.numeric_policy import NumericPolicy
 
 from .exceptions import CanonicalizationError, HashingError
+from .logging import get_logger
 from .numdump import normalize_payload_numbers
-from .utils import canonical_json_dump
+from .utils import canonical_json_stream
 
 Number = Union[int, float]
 MatrixElem = Union[Number, str]
 Matrix = Sequence[Sequence[MatrixElem]]
 
 _SHA_PREFIX = "sha256:"
+MERKLE_PREFIX = "merkle-sha256:"
+
+_MERKLE_DICT_TAG = b"ac-merkle/dict\x00"
+_MERKLE_LIST_TAG = b"ac-merkle/list\x00"
+
+# Fields with at least this many scalar elements go to the process pool in
+# parallel mode; smaller ones are not worth the pickling round-trip.
+PROCESS_POOL_MIN_ELEMENTS = 250_000
+
+logger = get_logger(__name__)
 
 
 def _sha256_bytes(data: bytes) -> str:
     return _SHA_PREFIX + hashlib.sha256(data).hexdigest()
 
 
+def _sha256_canonical(payload: Dict[str, Any]) -> str:
+    """Hash the canonical JSON of *payload*, streaming chunks into the digest.
+
+    Same digest as hashing ``canonical_json_dump(payload)`` but memory stays
+    bounded by the encoder chunk size instead of the payload size.
+    """
+
+    return _SHA_PREFIX + _canonical_sha256(payload).hexdigest()
+
+
+def _canonical_sha256(payload: Dict[str, Any]) -> "hashlib._Hash":
+    digest = hashlib.sha256()
+    canonical_json_stream(payload, digest)
+    return digest
+
+
 def hash_json_value(value: Any) -> str:
     """Return ``sha256:<hex>`` for any JSON-compatible ``value``."""
 
     try:
-        serialized = canonical_json_dump({"_": value})
+        return _sha256_canonical({"_": value})
     except CanonicalizationError as exc:
         raise HashingError(f"Canonicalization failed for value: {exc}") from exc
-    return _sha256_bytes(serialized.encode("utf-8"))
 
 
 def sha256_of_payload(payload: Dict[str, Any]) -> str:
@@ -38,10 +67,9 @@ def sha256_of_payload(payload: Dict[str, Any]) -> str:
     if not isinstance(payload, dict):
         raise HashingError("sha256_of_payload expects a dict at top level.")
     try:
-        serialized = canonical_json_dump(payload)
+        return _sha256_canonical(payload)
     except CanonicalizationError as exc:
         raise HashingError(f"Canonicalization failed: {exc}") from exc
-    return _sha256_bytes(serialized.encode("utf-8"))
 
 
 def hash_matrix(matrix: Matrix) -> str:
@@ -49,24 +77,22 @@ def hash_matrix(matrix: Matrix) -> str:
 
     if not isinstance(matrix, (list, tuple)):
         raise HashingError("Matrix must be a list/tuple of rows.")
-    normalized_rows: list[list[MatrixElem]] = []
+    rows: list[Sequence[MatrixElem]] = []
     for row in matrix:
         if not isinstance(row, (list, tuple)):
             raise HashingError("Each matrix row must be a list/tuple.")
-        normalized_row: list[MatrixElem] = []
         for value in row:
             if not isinstance(value, (int, float, str)):
                 raise HashingError(
                     f"Unsupported matrix element type: {type(value).__name__}"
                 )
-            normalized_row.append(value)
-        normalized_rows.append(normalized_row)
+        # Rows are streamed as-is; only tuple rows need a (shallow) list view.
+        rows.append(row if isinstance(row, list) else list(row))
 
     try:
-        serialized = canonical_json_dump({"matrix": normalized_rows})
+        return _sha256_canonical({"matrix": rows})
     except CanonicalizationError as exc:
         raise HashingError(f"Matrix canonicalization failed: {exc}") from exc
-    return _sha256_bytes(serialized.encode("utf-8"))
 
 
 def content_address(obj: Any, kind: str) -> str:
@@ -91,16 +117,53 @@ def content_address(obj: Any, kind: str) -> str:
         )
 
     try:
-        serialized = canonical_json_dump(wrapper)
+        digest = _sha256_canonical(wrapper)
     except CanonicalizationError as exc:
         raise HashingError(
             f"Canonicalization failed in content_address: {exc}"
         ) from exc
-    return f"{safe_kind}:{_sha256_bytes(serialized.encode('utf-8'))}"
+    return f"{safe_kind}:{digest}"
+
 
+def _element_count(value: Any) -> int:
+    """Rough size of a field: number of matrix cells, items or 1 for scalars."""
 
-def attach_hashes_inplace(payload: dict, fields: Sequence[str] | None = None) -> dict:
-    """Ensure ``payload['hashes']`` contains hashes for key substructures."""
+    if isinstance(value, list):
+        if value and all(isinstance(row, list) for row in value):
+            return sum(len(row) for row in value)
+        return len(value)
+    if isinstance(value, dict):
+        return len(value)
+    return 1
+
+
+def _timed_hash(value: Any) -> Tuple[str, float]:
+    start = time.perf_counter()
+    digest = hash_json_value(value)
+    return digest, time.perf_counter() - start
+
+
+def attach_hashes_inplace(
+    payload: dict,
+    fields: Sequence[str] | None = None,
+    *,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    process_threshold: int = PROCESS_POOL_MIN_ELEMENTS,
+    timings: Optional[Dict[str, float]] = None,
+    tree: Optional["MerkleTree"] = None,
+) -> dict:
+    """Ensure ``payload['hashes']`` contains hashes for key substructures.
+
+    With ``parallel=True`` the missing fields are hashed concurrently: fields
+    with at least ``process_threshold`` elements (typically ``S``/``T``) on a
+    process pool, the rest on a thread pool. Digests and their order in
+    ``hashes`` are the same as in serial mode. If ``timings`` is given it
+    receives the hashing time in seconds of every field hashed by this call.
+
+    When a :class:`MerkleTree` over *payload* is given, field hashes are read
+    from its cached node digests (``merkle-sha256:`` scheme) instead.
+    """
 
     keys = (
         list(fields)
@@ -120,14 +183,233 @@ def attach_hashes_inplace(payload: dict, fields: Sequence[str] | None = None) ->
         hashes = {}
         payload["hashes"] = hashes
 
-    for key in keys:
-        if key not in payload or key in hashes:
-            continue
-        hashes[key] = hash_json_value(payload[key])
+    pending = [
+        key for key in dict.fromkeys(keys) if key in payload and key not in hashes
+    ]
+    if tree is not None:
+        if tree.payload is not payload:
+            raise HashingError("MerkleTree was built for a different payload.")
+        for key in pending:
+            start = time.perf_counter()
+            digest = tree.digest((key,))
+            _record_hash(hashes, key, digest, time.perf_counter() - start, timings)
+        tree.invalidate(("hashes",))
+        return hashes
+
+    if not parallel or len(pending) < 2:
+        for key in pending:
+            digest, seconds = _timed_hash(payload[key])
+            _record_hash(hashes, key, digest, seconds, timings)
+        return hashes
+
+    large = {
+        key for key in pending if _element_count(payload[key]) >= process_threshold
+    }
+    with ExitStack() as stack:
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        processes = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+            if large
+            else None
+        )
+        futures: Dict[str, Future[Tuple[str, float]]] = {}
+        for key in pending:
+            pool = processes if key in large and processes is not None else threads
+            futures[key] = pool.submit(_timed_hash, payload[key])
+        for key in pending:
+            digest, seconds = futures[key].result()
+            _record_hash(hashes, key, digest, seconds, timings)
 
     return hashes
 
 
+def _record_hash(
+    hashes: dict,
+    key: str,
+    digest: str,
+    seconds: float,
+    timings: Optional[Dict[str, float]],
+) -> None:
+    hashes[key] = digest
+    if timings is not None:
+        timings[key] = seconds
+    logger.debug("hash_field key=%s seconds=%.6f", key, seconds)
+
+
+PathKey = Union[str, int]
+
+
+class _MerkleNode:
+    __slots__ = ("value", "children", "digest")
+
+    def __init__(
+        self,
+        value: Any,
+        children: Union[Dict[str, "_MerkleNode"], List["_MerkleNode"], None],
+    ) -> None:
+        self.value = value
+        self.children = children
+        self.digest: Optional[bytes] = None
+
+
+def _merkle_build(value: Any) -> _MerkleNode:
+    """Build the (digest-less) node skeleton mirroring *value*."""
+
+    if isinstance(value, dict):
+        children: Dict[str, _MerkleNode] = {}
+        for key, child in value.items():
+            if not isinstance(key, str):
+                raise HashingError(f"Non-string key in merkle payload: {key!r}")
+            children[key] = _merkle_build(child)
+        return _MerkleNode(value, children)
+    if isinstance(value, list) and any(
+        isinstance(item, (dict, list)) for item in value
+    ):
+        return _MerkleNode(value, [_merkle_build(item) for item in value])
+    # Scalars and flat scalar arrays (e.g. matrix rows) are hashed as one leaf.
+    return _MerkleNode(value, None)
+
+
+class MerkleTree:
+    """Merkle-style content hash of a JSON payload with cached node digests.
+
+    Dicts and lists of containers are inner nodes whose digest is computed from
+    their children's digests (dict children in sorted key order); scalars and
+    flat scalar arrays are leaves hashed as ``hash_json_value`` would. Digests
+    use the separate ``merkle-sha256:`` scheme and never equal the flat
+    ``sha256:`` ones. After changing one subtree through :meth:`set` (or after
+    an in-place edit followed by :meth:`invalidate`) only the nodes on the path
+    to the root are re-hashed.
+    """
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        if not isinstance(payload, dict):
+            raise HashingError("MerkleTree expects a dict at top level.")
+        self._payload = payload
+        self._root = _merkle_build(payload)
+        self.nodes_hashed = 0
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self._payload
+
+    def root(self) -> str:
+        """Return ``merkle-sha256:<hex>`` of the whole payload."""
+
+        return self.digest(())
+
+    def digest(self, path: Sequence[PathKey] = ()) -> str:
+        """Return the digest of the subtree at *path* (keys / list indices)."""
+
+        node = self._root
+        for part in path:
+            if node.children is None:
+                raise HashingError(f"Merkle path {list(path)!r} ends inside a leaf.")
+            try:
+                node = node.children[part]  # type: ignore[index]
+            except (KeyError, IndexError, TypeError) as exc:
+                raise HashingError(f"Merkle path not found: {list(path)!r}") from exc
+        return MERKLE_PREFIX + self._node_digest(node).hex()
+
+    def set(self, path: Sequence[PathKey], value: Any) -> str:
+        """Assign ``payload[path] = value``, re-hash the path and return the root."""
+
+        if not path:
+            raise HashingError("MerkleTree.set needs a non-empty path.")
+        container = self._payload
+        for part in path[:-1]:
+            container = container[part]  # type: ignore[index]
+        container[path[-1]] = value  # type: ignore[index]
+        self.invalidate(path)
+        return self.root()
+
+    def invalidate(self, path: Sequence[PathKey]) -> None:
+        """Mark the subtree at *path* as changed after an in-place edit.
+
+        Adding or removing a dict key is handled by invalidating the new or
+        removed key's path. For lists that grew, shrank or were reordered,
+        invalidate the list itself.
+        """
+
+        trail: List[_MerkleNode] = [self._root]
+        values: List[Any] = [self._payload]
+        for part in path:
+            node = trail[-1]
+            if node.children is None:
+                break  # the path points inside a flat array leaf
+            try:
+                child = node.children[part]  # type: ignore[index]
+                child_value = values[-1][part]
+            except (KeyError, IndexError, TypeError):
+                # Dict key added or removed: resync this branch's children only.
+                self._resync(node, values[-1])
+                for ancestor in trail:
+                    ancestor.digest = None
+                return
+            trail.append(child)
+            values.append(child_value)
+
+        replacement = _merkle_build(values[-1])
+        depth = len(trail) - 1
+        if depth == 0:
+            self._root = replacement
+        else:
+            trail[-2].children[path[depth - 1]] = replacement  # type: ignore[index]
+        for ancestor in trail[:-1]:
+            ancestor.digest = None
+
+    @staticmethod
+    def _resync(node: _MerkleNode, value: Any) -> None:
+        old = node.children
+        if isinstance(value, dict) and isinstance(old, dict):
+            node.children = {
+                key: old[key] if key in old else _merkle_build(child)
+                for key, child in value.items()
+            }
+        else:
+            node.children = _merkle_build(value).children
+        node.value = value
+        node.digest = None
+
+    def _node_digest(self, node: _MerkleNode) -> bytes:
+        if node.digest is not None:
+            return node.digest
+
+        children = node.children
+        if children is None:
+            try:
+                digest = _canonical_sha256({"_": node.value}).digest()
+            except CanonicalizationError as exc:
+                raise HashingError(
+                    f"Canonicalization failed in merkle leaf: {exc}"
+                ) from exc
+        elif isinstance(children, dict):
+            hasher = hashlib.sha256(_MERKLE_DICT_TAG)
+            hasher.update(len(children).to_bytes(8, "big"))
+            for key in sorted(children):
+                encoded = key.encode("utf-8")
+                hasher.update(len(encoded).to_bytes(8, "big"))
+                hasher.update(encoded)
+                hasher.update(self._node_digest(children[key]))
+            digest = hasher.digest()
+        else:
+            hasher = hashlib.sha256(_MERKLE_LIST_TAG)
+            hasher.update(len(children).to_bytes(8, "big"))
+            for child in children:
+                hasher.update(self._node_digest(child))
+            digest = hasher.digest()
+
+        node.digest = digest
+        self.nodes_hashed += 1
+        return digest
+
+
+def merkle_root_of_payload(payload: Dict[str, Any]) -> str:
+    """Return ``merkle-sha256:<hex>`` for a JSON-compatible dict payload."""
+
+    return MerkleTree(payload).root()
+
+
 def sha256_of_payload_normalized(payload: Any, policy: NumericPolicy) -> str:
     """Normalize numeric fields with ``policy`` before hashing payload."""
 
@@ -142,4 +424,7 @@ __all__ = [
     "content_address",
     "hash_json_value",
     "attach_hashes_inplace",
+    "MerkleTree",
+    "MERKLE_PREFIX",
+    "merkle_root_of_payload",
 ]
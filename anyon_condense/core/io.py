@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import json
 import pathlib
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from . import jsoncodec
 from .exceptions import DataIOError, SchemaError, ValidationError
-from .hashing import attach_hashes_inplace
+from .hashing import attach_hashes_inplace, content_address
 from .logging import get_logger
 from .provenance import ensure_provenance_inplace
-from .schema import validate
+from .schema import get_registry, validate
+from .store import ArtifactStore
 
 JsonDict = Dict[str, Any]
 
 logger = get_logger(__name__)
 
+# Inputs of ``ensure_provenance_inplace``; never served from the store.
+_STAMP_KEYS = ("provenance", "_sources")
+
 
 def _to_path(path_like: str | pathlib.Path) -> pathlib.Path:
     """Normalize *path_like* to an absolute :class:`pathlib.Path`."""
@@ -23,19 +27,19 @@ def _to_path(path_like: str | pathlib.Path) -> pathlib.Path:
     return pathlib.Path(path_like).expanduser().resolve()
 
 
-def _read_json(path: pathlib.Path) -> JsonDict:
-    """Read UTF-8 JSON file into a dict, raising :class:`DataIOError` on failure."""
-
+def _read_bytes(path: pathlib.Path) -> bytes:
     try:
-        text = path.read_text(encoding="utf-8")
+        return path.read_bytes()
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("[ACIO01] read_error path=%s exc=%s", path, exc.__class__.__name__)
         raise DataIOError(
             f"[ACIO01] read_error path={path} exc={exc.__class__.__name__}"
         ) from exc
 
+
+def _parse_json(data: bytes, path: pathlib.Path) -> JsonDict:
     try:
-        payload = json.loads(text)
+        payload = jsoncodec.loads(data)
     except Exception as exc:  # pragma: no cover - defensive
         logger.error(
             "[ACIO02] json_decode_error path=%s exc=%s", path, exc.__class__.__name__
@@ -51,14 +55,18 @@ def _read_json(path: pathlib.Path) -> JsonDict:
     return payload
 
 
-def _write_json(path: pathlib.Path, payload: JsonDict) -> None:
+def _read_json(path: pathlib.Path) -> JsonDict:
+    """Read UTF-8 JSON file into a dict, raising :class:`DataIOError` on failure."""
+
+    return _parse_json(_read_bytes(path), path)
+
+
+def _write_json(path: pathlib.Path, payload: JsonDict, *, indent: bool = True) -> None:
     """Serialise *payload* to JSON, raising :class:`DataIOError` on failure."""
 
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
-            handle.write("\n")
+        path.write_bytes(jsoncodec.dumps(payload, indent=indent) + b"\n")
     except Exception as exc:  # pragma: no cover - defensive
         logger.error(
             "[ACIO04] write_error path=%s exc=%s", path, exc.__class__.__name__
@@ -68,11 +76,13 @@ def _write_json(path: pathlib.Path, payload: JsonDict) -> None:
         ) from exc
 
 
-def _validate_or_raise(payload: JsonDict, schema_name: str) -> None:
+def _validate_or_raise(
+    payload: JsonDict, schema_name: str, *, incremental: bool = False
+) -> None:
     """Run ``validate`` and normalise :class:`SchemaError` into ``ValidationError``."""
 
     try:
-        validate(payload, schema_name)
+        validate(payload, schema_name, incremental=incremental)
     except SchemaError as exc:
         logger.error(
             "[ACVAL01] schema_validation_error schema=%s msg=%s", schema_name, exc
@@ -80,42 +90,109 @@ def _validate_or_raise(payload: JsonDict, schema_name: str) -> None:
         raise ValidationError(f"[ACVAL01] {exc}") from exc
 
 
-def load_mfusion_input(path: str | pathlib.Path) -> JsonDict:
-    """Load and validate an ``ac-mfusion`` input document."""
-
-    resolved = _to_path(path)
-    logger.debug("load_mfusion_input path=%s", resolved)
-    payload = _read_json(resolved)
-    _validate_or_raise(payload, "mfusion_input.schema.json")
-    logger.debug("load_mfusion_input.ok path=%s", resolved)
-    return payload
-
+def _input_address(data: bytes, schema_name: str, kind: str) -> str:
+    # A stored input was validated against one schema version: the address
+    # covers the file bytes and the schema, so editing it forces a miss.
+    schema = get_registry().digest(schema_name)
+    return content_address(
+        {"data": content_address(data, kind), "schema": schema}, kind
+    )
 
-def load_umtc_input(path: str | pathlib.Path) -> JsonDict:
-    """Load and validate an ``ac-umtc`` input document."""
 
+def _load_validated(
+    path: str | pathlib.Path,
+    schema_name: str,
+    kind: str,
+    store: Optional[ArtifactStore],
+) -> JsonDict:
     resolved = _to_path(path)
-    logger.debug("load_umtc_input path=%s", resolved)
-    payload = _read_json(resolved)
-    _validate_or_raise(payload, "umtc_input.schema.json")
-    logger.debug("load_umtc_input.ok path=%s", resolved)
+    logger.debug("load_%s path=%s", kind, resolved)
+    data = _read_bytes(resolved)
+    address = _input_address(data, schema_name, kind) if store is not None else None
+    if store is not None and address is not None:
+        cached = store.get(address, None)
+        if cached is not None:
+            logger.debug("load_%s.cached path=%s address=%s", kind, resolved, address)
+            return cached
+    payload = _parse_json(data, resolved)
+    _validate_or_raise(payload, schema_name)
+    if store is not None:
+        store.put(payload, kind, address=address)
+    logger.debug("load_%s.ok path=%s", kind, resolved)
     return payload
 
 
-def write_umtc_output(path: str | pathlib.Path, payload: JsonDict) -> None:
-    """Validate and write an ``ac-umtc`` output document to JSON file."""
-
-    ensure_provenance_inplace(payload)
-    try:
-        attach_hashes_inplace(payload)
-    except Exception as exc:  # pragma: no cover - defensive funnel to DataIOError
-        logger.error("[ACHASH01] hash_error msg=%s exc=%s", exc, exc.__class__.__name__)
-        raise DataIOError(f"[ACHASH01] hash_error: {exc}") from exc
-
-    logger.debug("write_umtc_output path=%s", path)
-    _validate_or_raise(payload, "umtc_output.schema.json")
+def load_mfusion_input(
+    path: str | pathlib.Path, *, store: Optional[ArtifactStore] = None
+) -> JsonDict:
+    """Load and validate an ``ac-mfusion`` input document.
+
+    With an :class:`ArtifactStore`, the validated payload is stored under the
+    content address of the file bytes and the schema, and later loads of
+    identical bytes skip parsing and validation until the schema changes.
+    """
+
+    return _load_validated(path, "mfusion_input.schema.json", "mfusion_input", store)
+
+
+def load_umtc_input(
+    path: str | pathlib.Path, *, store: Optional[ArtifactStore] = None
+) -> JsonDict:
+    """Load and validate an ``ac-umtc`` input document (``store``: see above)."""
+
+    return _load_validated(path, "umtc_input.schema.json", "umtc_input", store)
+
+
+def write_umtc_output(
+    path: str | pathlib.Path,
+    payload: JsonDict,
+    *,
+    parallel_hashes: bool = False,
+    store: Optional[ArtifactStore] = None,
+    indent: bool = True,
+) -> None:
+    """Validate and write an ``ac-umtc`` output document to JSON file.
+
+    ``parallel_hashes`` hashes the output fields concurrently (see
+    :func:`attach_hashes_inplace`); useful when ``S``/``T`` are large.
+
+    With an :class:`ArtifactStore`, the finished document minus its
+    provenance (hashes attached, validated) is stored under the content
+    address of the incoming payload. Writing the same payload again reuses
+    it, skipping hashing and validation, and stamps fresh provenance from the
+    incoming ``provenance``/``_sources``; *payload* is updated in place
+    either way.
+    ``indent=False`` writes compact JSON (smaller, same content).
+    """
+
+    source = content_address(payload, "umtc_output") if store is not None else None
+    cached = store.get(source, None) if store is not None and source else None
+    if cached is not None:
+        logger.debug("write_umtc_output.cached path=%s address=%s", path, source)
+        stamp = {key: payload[key] for key in _STAMP_KEYS if key in payload}
+        payload.clear()
+        payload.update(cached)
+        payload.update(stamp)
+        ensure_provenance_inplace(payload)
+    else:
+        ensure_provenance_inplace(payload)
+        try:
+            attach_hashes_inplace(payload, parallel=parallel_hashes)
+        except Exception as exc:  # pragma: no cover - defensive funnel to DataIOError
+            logger.error(
+                "[ACHASH01] hash_error msg=%s exc=%s", exc, exc.__class__.__name__
+            )
+            raise DataIOError(f"[ACHASH01] hash_error: {exc}") from exc
+
+        logger.debug("write_umtc_output path=%s", path)
+        # Checkpoints of one output usually differ only in checks/hashes/
+        # provenance; unchanged subtrees are not validated again.
+        _validate_or_raise(payload, "umtc_output.schema.json", incremental=True)
+        if store is not None:
+            body = {key: val for key, val in payload.items() if key != "provenance"}
+            store.put(body, "umtc_output", address=source)
     resolved = _to_path(path)
-    _write_json(resolved, payload)
+    _write_json(resolved, payload, indent=indent)
     logger.debug("write_umtc_output.ok path=%s", resolved)
 
 
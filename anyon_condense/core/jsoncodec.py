@@ -0,0 +1,206 @@
+"""Pluggable JSON codec: orjson or msgspec when installed, stdlib otherwise.
+
+All codecs read ``bytes`` directly (UTF-8, no intermediate ``str``) and
+write ``bytes``. Results are semantically identical across codecs: whenever
+a fast codec refuses a document (non-string keys, ``NaN``/``Infinity``
+literals, lone surrogates) or could treat it differently (integer literals
+of 19+ digits, which orjson reads as floats; non-finite floats, which orjson
+and msgspec write as ``null``), the stdlib codec handles that document
+instead, including its error messages.
+
+The codec is picked once: ``AC_JSON_BACKEND`` (``orjson``, ``msgspec`` or
+``stdlib``) if set, else the first importable of orjson and msgspec.
+Canonical dumps used for hashing (:mod:`.utils`) deliberately stay on the
+stdlib encoder so digests never depend on the installed codec.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec as _msgspec  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    _msgspec = None
+
+__all__ = [
+    "JsonCodec",
+    "available_codecs",
+    "dumps",
+    "get_codec",
+    "loads",
+    "set_codec",
+]
+
+
+# Integers beyond 64 bits need at least 19 digits; documents with such digit
+# runs (rare: long ints, or very long decimals) are decoded by the stdlib.
+# Mapping every digit to "0" and searching for a run is a C-speed scan.
+_DIGITS = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+_LONG_RUN = b"0" * 19
+
+
+def _has_long_digit_run(data: bytes | str) -> bool:
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return _LONG_RUN in bytes(data).translate(_DIGITS)
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    else:
+        text = json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+        )
+    return text.encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if type(item) is float:
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+class JsonCodec:
+    """``loads``/``dumps`` pair with stdlib fallback (see module docstring)."""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Optional[Callable[[bytes | str], Any]] = None,
+        dumps: Optional[Callable[[Any, bool, bool], bytes]] = None,
+        *,
+        exact_ints: bool = True,
+    ) -> None:
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+        self._exact_ints = exact_ints
+
+    def loads(self, data: bytes | str) -> Any:
+        if self._loads is not None and (
+            self._exact_ints or not _has_long_digit_run(data)
+        ):
+            try:
+                return self._loads(data)
+            except (ValueError, TypeError):
+                pass  # let the stdlib decide (and phrase the error)
+        return _stdlib_loads(data)
+
+    def dumps(
+        self, obj: Any, *, indent: bool = False, sort_keys: bool = False
+    ) -> bytes:
+        """Encode *obj* as UTF-8 JSON (2-space indent when *indent*)."""
+
+        if self._dumps is not None:
+            try:
+                data = self._dumps(obj, indent, sort_keys)
+            except (TypeError, ValueError, OverflowError):
+                pass
+            else:
+                # Fast codecs write non-finite floats as null; the stdlib
+                # writes NaN/Infinity. Only documents containing null can be
+                # affected, so only those are checked.
+                if b"null" not in data or not _has_non_finite(obj):
+                    return data
+        return _stdlib_dumps(obj, indent, sort_keys)
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _orjson_codec() -> JsonCodec:
+    assert _orjson is not None
+
+    def dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+        option = 0
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(obj, option=option)
+
+    return JsonCodec("orjson", _orjson.loads, dumps, exact_ints=False)
+
+
+def _msgspec_codec() -> JsonCodec:
+    assert _msgspec is not None
+    decoder = _msgspec.json.Decoder()
+    encoder = _msgspec.json.Encoder()
+    sorted_encoder = _msgspec.json.Encoder(order="sorted")
+
+    def dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+        data = (sorted_encoder if sort_keys else encoder).encode(obj)
+        return _msgspec.json.format(data, indent=2) if indent else data
+
+    return JsonCodec("msgspec", decoder.decode, dumps)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {"stdlib": lambda: JsonCodec("stdlib")}
+if _msgspec is not None:  # pragma: no cover - depends on environment
+    _FACTORIES["msgspec"] = _msgspec_codec
+if _orjson is not None:
+    _FACTORIES["orjson"] = _orjson_codec
+
+_PREFERENCE = ("orjson", "msgspec", "stdlib")
+_CODEC: Optional[JsonCodec] = None
+
+
+def available_codecs() -> List[str]:
+    """Names of the codecs usable in this environment, fastest first."""
+
+    return [name for name in _PREFERENCE if name in _FACTORIES]
+
+
+def set_codec(name: Optional[str] = None) -> JsonCodec:
+    """Select the codec by *name* (``None``: environment / best available)."""
+
+    global _CODEC
+    name = name or os.environ.get("AC_JSON_BACKEND") or available_codecs()[0]
+    if name not in _FACTORIES:
+        raise ValueError(
+            f"JSON backend {name!r} is not available (have: {available_codecs()})"
+        )
+    _CODEC = _FACTORIES[name]()
+    return _CODEC
+
+
+def get_codec() -> JsonCodec:
+    """The active codec (chosen on first use)."""
+
+    return _CODEC if _CODEC is not None else set_codec()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from UTF-8 ``bytes`` (or ``str``) with the active codec."""
+
+    return get_codec().loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode *obj* to UTF-8 JSON ``bytes`` with the active codec."""
+
+    return get_codec().dumps(obj, indent=indent, sort_keys=sort_keys)
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import math
 from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal, localcontext
-from typing import Any, Sequence, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 from anyon_condense.core.exceptions import NumericFieldError
 from anyon_condense.core.utils import canonical_json_dump
 from anyon_condense.scalars.float_backend import normalize_float
 from anyon_condense.scalars.numeric_policy import NumericPolicy, clip_small
+from anyon_condense.scalars.quant_cache import QUANT_CACHE
+
+try:  # NumPy is optional; the Decimal path below is the reference implementation
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    _np = None  # type: ignore[assignment]
 
 Number = Union[int, float]
 
@@ -19,10 +25,31 @@ ROUNDING_MAP = {
 MIDRANGE_LOW = 1e-4
 MIDRANGE_HIGH = 1e6
 
+ENGINES = ("auto", "numpy", "decimal")
+# Below this many float leaves the NumPy round-trip costs more than it saves.
+BATCH_MIN_FLOATS = 64
+
+# Powers of ten that are exact binary64 values; products/quotients with them are
+# correctly rounded, which is what keeps the batch path bit-identical.
+_MAX_EXACT_POW10 = 22
+# Margin (in units of the last kept digit) around a rounding tie. Covers the
+# ``precision + 6`` digit intermediate rounding of the scientific Decimal path.
+_TIE_GUARD = 1e-6
+# floor(log10(x)) is only trusted when log10(x) is this far from an integer.
+_LOG10_GUARD = 1e-9
+
 
 def _quantize_float(x: float, policy: NumericPolicy) -> float:
-    """Apply clipping and rounding defined by the numeric policy to a float."""
+    """Apply clipping and rounding defined by the numeric policy to a float.
+
+    Results are memoized in the shared :data:`QUANT_CACHE`, since payloads
+    repeat a handful of values (0, ±1, 1/sqrt(2), roots of unity) everywhere.
+    """
+
+    return QUANT_CACHE.lookup("quantize", x, policy, _quantize_float_decimal)
+
 
+def _quantize_float_decimal(x: float, policy: NumericPolicy) -> float:
     x = normalize_float(x)
     x = clip_small(x, policy)
     if x == 0.0:
@@ -79,6 +106,91 @@ def _quantize_float(x: float, policy: NumericPolicy) -> float:
     return normalize_float(xf)
 
 
+# Exact powers of ten for which math.log10 returns the exact integer exponent.
+_TRUSTED_POW10 = [
+    10.0**j for j in range(_MAX_EXACT_POW10 + 1) if math.log10(10.0**j) == j
+]
+
+
+def _quantize_batch_numpy(
+    values: Sequence[float], policy: NumericPolicy
+) -> List[float]:
+    """Vectorized :func:`_quantize_float` over ``values`` (bit-identical results).
+
+    Every element is quantized as ``n * 10**-k`` with an exact power of ten, so
+    the final float division/multiplication is correctly rounded exactly like
+    ``float(Decimal)``. Elements whose rounding could depend on float error
+    (near ties, ambiguous ``log10`` floors, out-of-range exponents, non-finite
+    values) are routed through the scalar Decimal path instead.
+    """
+
+    arr = _np.asarray(values, dtype=_np.float64)
+    finite = _np.isfinite(arr)
+    abs_x = _np.abs(_np.where(finite, arr, 0.0))
+    if policy.clip_small:
+        threshold = 10.0 ** (-(policy.precision + 1))
+        abs_x = _np.where(abs_x < threshold, 0.0, abs_x)
+    nonzero = abs_x > 0.0
+    safe = finite.copy()
+
+    precision = policy.precision
+    if policy.fmt == "fixed":
+        k = _np.full(arr.shape, precision, dtype=_np.int64)
+        direct = _np.ones(arr.shape, dtype=bool)
+    else:
+        log = _np.log10(_np.where(nonzero, abs_x, 1.0))
+        exponent = _np.floor(log)
+        pow10 = _np.isin(abs_x, _TRUSTED_POW10)
+        exponent = _np.where(pow10, _np.round(log), exponent)
+        safe &= ~nonzero | pow10 | (_np.abs(log - _np.round(log)) > _LOG10_GUARD)
+        exponent = exponent.astype(_np.int64)
+        sci_k = precision - 1 - exponent
+        if policy.fmt == "scientific":
+            k = sci_k
+            direct = _np.zeros(arr.shape, dtype=bool)
+        else:
+            direct = (abs_x >= MIDRANGE_LOW) & (abs_x < MIDRANGE_HIGH)
+            k = _np.where(direct, _np.maximum(0, sci_k), sci_k)
+
+    safe &= _np.abs(k) <= _MAX_EXACT_POW10
+    k = _np.clip(k, -_MAX_EXACT_POW10, _MAX_EXACT_POW10)
+    powers = _np.array([10.0**j for j in range(_MAX_EXACT_POW10 + 1)])
+    p = powers[_np.abs(k)]
+    # Huge magnitudes overflow to inf here; they are marked unsafe and
+    # quantized by the Decimal path, so the warnings are noise.
+    with _np.errstate(over="ignore", invalid="ignore"):
+        scaled = _np.where(k >= 0, abs_x * p, abs_x / p)
+
+        safe &= scaled < 2.0**52
+        n = _np.floor(scaled)
+        frac = scaled - n
+        safe &= _np.abs(frac - 0.5) > _TIE_GUARD + scaled * 2.0**-50
+        n = _np.where(frac > 0.5, n + 1.0, n)
+        # Quantizing x directly (fixed / auto midrange) fails in Decimal when the
+        # coefficient is wider than the context precision; keep that error.
+        safe &= ~direct | (n < 10.0 ** min(precision + 6, 300))
+
+        y = _np.where(k >= 0, n / p, n * p)
+        y = _np.where(arr < 0.0, -y, y)
+        y = _np.where(nonzero, y, 0.0) + 0.0
+
+    out: List[float] = y.tolist()
+    for index in _np.flatnonzero(~safe).tolist():
+        out[index] = _quantize_float(values[index], policy)
+    return out
+
+
+def _collect_floats(obj: Any, out: List[float]) -> None:
+    if isinstance(obj, float):
+        out.append(obj)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _collect_floats(value, out)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _collect_floats(value, out)
+
+
 def _is_flat_numeric_array(seq: Sequence[Any]) -> bool:
     if not isinstance(seq, (list, tuple)):
         return False
@@ -89,9 +201,15 @@ def _is_flat_numeric_array(seq: Sequence[Any]) -> bool:
 
 
 def _normalize_any(
-    obj: Any, policy: NumericPolicy, *, inside_array: bool = False
+    obj: Any,
+    policy: NumericPolicy,
+    *,
+    inside_array: bool = False,
+    quantize: Optional[Callable[[float], float]] = None,
 ) -> Any:
     if isinstance(obj, float):
+        if quantize is not None:
+            return quantize(obj)
         return _quantize_float(obj, policy)
 
     if isinstance(obj, (int, str, bool)) or obj is None:
@@ -100,11 +218,16 @@ def _normalize_any(
     if isinstance(obj, dict):
         result: dict[Any, Any] = {}
         for key, value in obj.items():
-            result[key] = _normalize_any(value, policy, inside_array=False)
+            result[key] = _normalize_any(
+                value, policy, inside_array=False, quantize=quantize
+            )
         return result
 
     if isinstance(obj, (list, tuple)):
-        normalized = [_normalize_any(value, policy, inside_array=True) for value in obj]
+        normalized = [
+            _normalize_any(value, policy, inside_array=True, quantize=quantize)
+            for value in obj
+        ]
         if (
             policy.array_reorder
             and not inside_array
@@ -116,10 +239,36 @@ def _normalize_any(
     return obj
 
 
-def normalize_payload_numbers(payload: Any, policy: NumericPolicy) -> Any:
-    """Deep-copy-like numeric normalization respecting the given policy."""
+def normalize_payload_numbers(
+    payload: Any, policy: NumericPolicy, *, engine: str = "auto"
+) -> Any:
+    """Deep-copy-like numeric normalization respecting the given policy.
+
+    ``engine`` selects how float leaves are quantized: ``"decimal"`` quantizes
+    one value at a time, ``"numpy"`` gathers all floats into one array and
+    quantizes them in bulk, ``"auto"`` uses NumPy when it is installed and the
+    payload is large enough to benefit. All engines give identical results.
+    """
+
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if engine == "numpy" and _np is None:
+        raise ImportError("engine='numpy' requested but numpy is not installed")
+    if engine == "decimal" or _np is None:
+        return _normalize_any(payload, policy, inside_array=False)
+
+    leaves: List[float] = []
+    _collect_floats(payload, leaves)
+    if engine == "auto" and len(leaves) < BATCH_MIN_FLOATS:
+        return _normalize_any(payload, policy, inside_array=False)
 
-    return _normalize_any(payload, policy, inside_array=False)
+    quantized = iter(_quantize_batch_numpy(leaves, policy))
+    return _normalize_any(
+        payload,
+        policy,
+        inside_array=False,
+        quantize=lambda _value: next(quantized),
+    )
 
 
 def normalized_canonical_dump(payload: Any, policy: NumericPolicy) -> str:
@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import pathlib
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NoReturn, Optional
 
 from jsonschema import Draft202012Validator
 from jsonschema import exceptions as js_ex
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT202012
 
+from . import jsoncodec
 from .exceptions import SchemaError
 from .logging import get_logger
-
-# Internal caches keyed by fully-resolved schema directory + filename.
-_SCHEMA_CACHE: Dict[str, dict[str, Any]] = {}
-_VALIDATOR_CACHE: Dict[str, Draft202012Validator] = {}
+from .schema_fast import Predicate, Resolver, compile_schema
+
+# Process-wide registries keyed by the ``schema_dir`` argument and the
+# ``AC_SCHEMA_DIR`` value they were resolved under.
+_REGISTRIES: Dict[tuple[Any, Optional[str]], "SchemaRegistry"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+# Incremental mode: (schema key, property, sha256 of the value) of subtrees
+# already validated, bounded LRU.
+_SUBTREE_LIMIT = 4096
+_SUBTREE_CACHE: "OrderedDict[tuple[str, str, str], None]" = OrderedDict()
+_SUBTREE_LOCK = threading.Lock()
+_SPLITTABLE = frozenset(
+    {
+        "$id",
+        "$schema",
+        "$comment",
+        "title",
+        "description",
+        "type",
+        "required",
+        "properties",
+        "patternProperties",
+        "additionalProperties",
+    }
+)
 
 logger = get_logger(__name__)
 
@@ -51,14 +79,17 @@ def resolve_schema_dir(override: Optional[str | pathlib.Path] = None) -> pathlib
     return path
 
 
+def _check_name(name: str) -> None:
+    if not name.endswith(".schema.json"):
+        raise SchemaError("Schema name must end with '.schema.json'!")
+
+
 def _schema_path_by_name(
     name: str, schema_dir: Optional[str | pathlib.Path] = None
 ) -> pathlib.Path:
     """Return the path to *name* inside *schema_dir* (or resolved default)."""
 
-    if not name.endswith(".schema.json"):
-        raise SchemaError("Schema name must end with '.schema.json'!")
-
+    _check_name(name)
     base = resolve_schema_dir(schema_dir)
     path = (base / name).resolve()
     if not path.is_file():
@@ -67,16 +98,218 @@ def _schema_path_by_name(
     return path
 
 
-def _cache_key(name: str, schema_dir: Optional[str | pathlib.Path]) -> str:
-    directory = resolve_schema_dir(schema_dir)
-    return f"{directory}::{name}"
+class _Fragments:
+    """Per-schema pieces used by incremental validation.
+
+    ``shell`` is the root schema with every ``properties`` entry replaced by
+    ``true``, so it checks the top-level keys only; ``parts`` holds the fast
+    predicate and ``jsonschema`` validator of each property's subschema.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        validator: Draft202012Validator,
+        resolve: Resolver,
+    ) -> None:
+        shell = dict(schema, properties={name: True for name in schema["properties"]})
+        self.shell = Draft202012Validator(shell)
+        self.shell_fast = compile_schema(shell)
+        self.parts: Dict[str, tuple[Optional[Predicate], Draft202012Validator]] = {
+            name: (compile_schema(sub, schema, resolve), validator.evolve(schema=sub))
+            for name, sub in schema["properties"].items()
+        }
+
+
+class SchemaRegistry:
+    """Schemas of one directory with their compiled validators.
+
+    The directory is resolved once; each schema file is read and checked for
+    existence once, then served from memory together with its ``jsonschema``
+    validator, fast-path predicate (:mod:`.schema_fast`) and incremental
+    fragments. Schemas are also indexed by ``$id``, and ``$ref`` to another
+    document (``"other.schema.json#/..."`` or a full ``$id``) resolves to the
+    file of that name in the same directory. :meth:`warm_up` front-loads all
+    of this so batch validation never touches the filesystem.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._schemas: Dict[str, dict[str, Any]] = {}
+        self._paths: Dict[str, pathlib.Path] = {}
+        self._ids: Dict[str, str] = {}
+        self._digests: Dict[str, str] = {}
+        self._validators: Dict[str, Draft202012Validator] = {}
+        self._fast: Dict[str, Optional[Predicate]] = {}
+        self._fragments: Dict[str, Optional[_Fragments]] = {}
+        self._resources = Registry(retrieve=self._retrieve)  # type: ignore[call-arg]
+
+    # ---------------------------------------------------------- documents
+    def names(self) -> list[str]:
+        return sorted(
+            f.name for f in self.directory.glob("*.schema.json") if f.is_file()
+        )
+
+    def schema(self, name: str) -> dict[str, Any]:
+        """Parsed schema *name* (read from disk on first use)."""
+
+        found = self._schemas.get(name)
+        if found is not None:
+            return found
+        _check_name(name)
+        with self._lock:
+            if name in self._schemas:
+                return self._schemas[name]
+            path = (self.directory / name).resolve()
+            if not path.is_file():
+                logger.error("[ACIO01] read_error (schema_file_missing) path=%s", path)
+                raise SchemaError(f"Schema file not found: {path}")
+            try:
+                data = path.read_bytes()
+                payload = json.loads(data.decode("utf-8"))
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error(
+                    "[ACIO01] read_error name=%s exc=%s", name, exc.__class__.__name__
+                )
+                raise SchemaError(f"Failed to read schema '{name}': {exc}") from exc
+
+            if not isinstance(payload, dict) or "$schema" not in payload:
+                raise SchemaError(f"Invalid schema (missing $schema): {path}")
+
+            self._paths[name] = path
+            self._digests[name] = hashlib.sha256(data).hexdigest()
+            if isinstance(payload.get("$id"), str):
+                self._ids[payload["$id"].partition("#")[0]] = name
+            self._schemas[name] = payload
+            return payload
+
+    def path(self, name: str) -> pathlib.Path:
+        if name not in self._paths:
+            self.schema(name)
+        return self._paths[name]
+
+    def digest(self, name: str) -> str:
+        """SHA-256 of the schema file *name* as read (identifies its version)."""
+
+        if name not in self._digests:
+            self.schema(name)
+        return self._digests[name]
+
+    def by_id(self, schema_id: str) -> dict[str, Any]:
+        """Schema whose ``$id`` is *schema_id*, else the file named like its
+        last path segment."""
+
+        uri = schema_id.partition("#")[0]
+        name = self._ids.get(uri)
+        if name is None:
+            name = uri.rstrip("/").rsplit("/", 1)[-1]
+        return self.schema(name)
+
+    def _retrieve(self, uri: str) -> Resource:
+        return Resource.from_contents(
+            self.by_id(uri), default_specification=DRAFT202012
+        )
+
+    # --------------------------------------------------------- validators
+    def validator(self, name: str) -> Draft202012Validator:
+        """Cached Draft 2020-12 validator for *name*."""
+
+        found = self._validators.get(name)
+        if found is not None:
+            return found
+        with self._lock:
+            if name not in self._validators:
+                schema = self.schema(name)
+                try:
+                    validator = Draft202012Validator(schema, registry=self._resources)
+                except Exception as exc:  # pragma: no cover - defensive
+                    raise SchemaError(
+                        f"Failed to build validator for '{name}': {exc}"
+                    ) from exc
+                self._validators[name] = validator
+            return self._validators[name]
+
+    def fast(self, name: str) -> Optional[Predicate]:
+        """Compiled predicate for *name* (``None`` if not compilable)."""
+
+        try:
+            return self._fast[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._fast:
+                self._fast[name] = compile_schema(self.schema(name), resolve=self.by_id)
+            return self._fast[name]
+
+    def fragments(self, name: str) -> Optional[_Fragments]:
+        try:
+            return self._fragments[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._fragments:
+                schema = self.schema(name)
+                fragments = None
+                # Only roots whose keywords all act on the top-level object can
+                # be split into a shell plus independent property subtrees.
+                if (
+                    isinstance(schema.get("properties"), dict)
+                    and set(schema) <= _SPLITTABLE
+                ):
+                    fragments = _Fragments(schema, self.validator(name), self.by_id)
+                self._fragments[name] = fragments
+            return self._fragments[name]
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> list[str]:
+        """Load and compile *names* (default: every schema in the directory)."""
+
+        names = self.names() if names is None else list(names)
+        for name in names:
+            self.validator(name)
+            self.fast(name)
+            self.fragments(name)
+        logger.debug(
+            "schema_registry.warm_up dir=%s count=%d", self.directory, len(names)
+        )
+        return names
+
+
+def get_registry(schema_dir: Optional[str | pathlib.Path] = None) -> SchemaRegistry:
+    """Process-wide :class:`SchemaRegistry` for *schema_dir*.
+
+    The directory is resolved (and checked) only the first time a given
+    ``schema_dir`` / ``AC_SCHEMA_DIR`` combination is seen.
+    """
+
+    key = (schema_dir, os.environ.get("AC_SCHEMA_DIR"))
+    registry = _REGISTRIES.get(key)
+    if registry is None:
+        directory = resolve_schema_dir(schema_dir)
+        with _REGISTRY_LOCK:
+            registry = _REGISTRIES.get(key)
+            if registry is None:
+                registry = next(
+                    (r for r in _REGISTRIES.values() if r.directory == directory),
+                    None,
+                ) or SchemaRegistry(directory)
+                _REGISTRIES[key] = registry
+    return registry
+
+
+def warm_up(
+    schema_dir: Optional[str | pathlib.Path] = None,
+    names: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """Precompile validators for *names* (default: all schemas) in *schema_dir*."""
+
+    return get_registry(schema_dir).warm_up(names)
 
 
 def list_schemas(schema_dir: Optional[str | pathlib.Path] = None) -> list[str]:
     """Return a sorted list of available schema filenames."""
 
-    directory = resolve_schema_dir(schema_dir)
-    return sorted(f.name for f in directory.glob("*.schema.json") if f.is_file())
+    return get_registry(schema_dir).names()
 
 
 def load_schema(
@@ -84,22 +317,7 @@ def load_schema(
 ) -> dict[str, Any]:
     """Load a JSON schema and cache the parsed result."""
 
-    key = _cache_key(name, schema_dir)
-    if key in _SCHEMA_CACHE:
-        return _SCHEMA_CACHE[key]
-
-    path = _schema_path_by_name(name, schema_dir)
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.error("[ACIO01] read_error name=%s exc=%s", name, exc.__class__.__name__)
-        raise SchemaError(f"Failed to read schema '{name}': {exc}") from exc
-
-    if not isinstance(payload, dict) or "$schema" not in payload:
-        raise SchemaError(f"Invalid schema (missing $schema): {path}")
-
-    _SCHEMA_CACHE[key] = payload
-    return payload
+    return get_registry(schema_dir).schema(name)
 
 
 def _get_validator(
@@ -107,48 +325,209 @@ def _get_validator(
 ) -> Draft202012Validator:
     """Return a cached Draft202012 validator for *name*."""
 
-    key = _cache_key(name, schema_dir)
-    if key in _VALIDATOR_CACHE:
-        return _VALIDATOR_CACHE[key]
+    return get_registry(schema_dir).validator(name)
 
-    schema = load_schema(name, schema_dir)
-    try:
-        validator = Draft202012Validator(schema)
-    except Exception as exc:  # pragma: no cover - defensive
-        raise SchemaError(f"Failed to build validator for '{name}': {exc}") from exc
 
-    _VALIDATOR_CACHE[key] = validator
-    return validator
+def _get_fast_validator(
+    name: str, schema_dir: Optional[str | pathlib.Path] = None
+) -> Optional[Predicate]:
+    """Return the compiled predicate for *name* (``None`` if not compilable)."""
 
+    return get_registry(schema_dir).fast(name)
 
-def validate(
-    payload: dict[str, Any],
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Only dict/list/str/int/float/bool/None, with str keys (exact types).
+
+    Canonical JSON erases the distinctions jsonschema draws elsewhere (a
+    tuple dumps like a list, ``{1: x}`` like ``{"1": x}``), so only subtrees
+    made of plain JSON types may share a fingerprint.
+    """
+
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            if not all(type(key) is str for key in item):
+                return False
+            stack.extend(item.values())
+        elif kind is list:
+            stack.extend(item)
+        elif kind not in _PLAIN_SCALARS:
+            return False
+    return True
+
+
+def _subtree_fingerprint(value: Any) -> Optional[str]:
+    """sha256 of the canonical JSON of *value*; ``None`` (never cached) when
+    *value* is not plain JSON or cannot be encoded."""
+
+    if not _is_plain_json(value):
+        return None
+    try:
+        data = jsoncodec.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(data).hexdigest()
+
+
+def _error_message(
+    exc: js_ex.ValidationError,
     schema_name: str,
-    schema_dir: Optional[str | pathlib.Path] = None,
+    schema_dir: Optional[str | pathlib.Path],
+    prefix: tuple[Any, ...] = (),
+) -> tuple[str, str]:
+    location = " → ".join(str(part) for part in (*prefix, *exc.path)) or "(root)"
+    schema_path = get_registry(schema_dir).path(schema_name)
+    msg = (
+        f"Schema validation error in '{schema_name}' at {location} "
+        f"(schema={schema_path}): {exc.message}"
+    )
+    return msg, location
+
+
+def _raise_validation_error(
+    exc: js_ex.ValidationError,
+    schema_name: str,
+    schema_dir: Optional[str | pathlib.Path],
+    prefix: tuple[Any, ...] = (),
+) -> NoReturn:
+    msg, location = _error_message(exc, schema_name, schema_dir, prefix)
+    logger.error(
+        "[ACVAL01] schema_validation_error schema=%s loc=%s msg=%s",
+        schema_name,
+        location,
+        exc.message,
+    )
+    raise SchemaError(msg) from exc
+
+
+def _check(
+    payload: Any,
+    fast: Optional[Predicate],
+    validator: Draft202012Validator,
+    schema_name: str,
+    schema_dir: Optional[str | pathlib.Path],
+    prefix: tuple[Any, ...] = (),
 ) -> None:
-    """Validate *payload* against *schema_name*."""
-
-    validator = _get_validator(schema_name, schema_dir)
+    if fast is not None and fast(payload):
+        return
     try:
         validator.validate(payload)
     except js_ex.ValidationError as exc:
-        location = " → ".join(str(part) for part in exc.path) or "(root)"
-        schema_path = _schema_path_by_name(schema_name, schema_dir)
-        msg = (
-            f"Schema validation error in '{schema_name}' at {location} "
-            f"(schema={schema_path}): {exc.message}"
-        )
-        logger.error(
-            "[ACVAL01] schema_validation_error schema=%s loc=%s msg=%s",
+        _raise_validation_error(exc, schema_name, schema_dir, prefix)
+
+
+def _validate_incremental(
+    payload: dict[str, Any],
+    schema_name: str,
+    schema_dir: Optional[str | pathlib.Path],
+    fragments: _Fragments,
+    fast: bool,
+    key: str,
+) -> None:
+    _check(
+        payload,
+        fragments.shell_fast if fast else None,
+        fragments.shell,
+        schema_name,
+        schema_dir,
+    )
+    for name, value in payload.items():
+        if name not in fragments.parts:
+            continue  # allowed by the shell's pattern/additional properties
+        digest = _subtree_fingerprint(value)
+        entry = (key, name, digest or "")
+        with _SUBTREE_LOCK:
+            if digest is not None and entry in _SUBTREE_CACHE:
+                _SUBTREE_CACHE.move_to_end(entry)
+                continue
+        part_fast, part_validator = fragments.parts[name]
+        _check(
+            value,
+            part_fast if fast else None,
+            part_validator,
             schema_name,
-            location,
-            exc.message,
+            schema_dir,
+            (name,),
         )
-        raise SchemaError(msg) from exc
+        if digest is not None:
+            with _SUBTREE_LOCK:
+                _SUBTREE_CACHE[entry] = None
+                while len(_SUBTREE_CACHE) > _SUBTREE_LIMIT:
+                    _SUBTREE_CACHE.popitem(last=False)
+
+
+def validate(
+    payload: dict[str, Any],
+    schema_name: str,
+    schema_dir: Optional[str | pathlib.Path] = None,
+    *,
+    fast: bool = True,
+    incremental: bool = False,
+) -> None:
+    """Validate *payload* against *schema_name*.
+
+    With ``fast=True`` (default) a predicate compiled from the schema accepts
+    valid payloads without running ``jsonschema``; payloads it rejects are
+    re-checked by ``jsonschema``, which decides and reports the error.
+    ``fast=False`` always uses ``jsonschema``.
+
+    ``incremental=True`` checks the top-level keys every time but validates
+    each top-level value only if its content hash has not been validated
+    against the same schema property before, so re-validating a document in
+    which only ``checks`` or ``hashes`` changed costs little more than
+    hashing it.
+    """
+
+    registry = get_registry(schema_dir)
+    if incremental and isinstance(payload, dict):
+        fragments = registry.fragments(schema_name)
+        if fragments is not None:
+            key = f"{registry.directory}::{schema_name}"
+            _validate_incremental(
+                payload, schema_name, schema_dir, fragments, fast, key
+            )
+            return
+
+    if fast:
+        check = registry.fast(schema_name)
+        if check is not None and check(payload):
+            return
+    _check(payload, None, registry.validator(schema_name), schema_name, schema_dir)
+
+
+def validation_error(
+    payload: Any,
+    schema_name: str,
+    schema_dir: Optional[str | pathlib.Path] = None,
+    *,
+    fast: bool = True,
+) -> Optional[str]:
+    """Return the message :func:`validate` would raise, or ``None`` if valid.
+
+    Nothing is logged; meant for batch runs that report failures themselves.
+    """
+
+    registry = get_registry(schema_dir)
+    if fast:
+        check = registry.fast(schema_name)
+        if check is not None and check(payload):
+            return None
+    exc = js_ex.best_match(registry.validator(schema_name).iter_errors(payload))
+    if exc is None:
+        return None
+    return _error_message(exc, schema_name, schema_dir)[0]
 
 
 def clear_caches() -> None:
-    """Clear cached schema payloads and validators (useful for tests)."""
+    """Drop all schema registries and validation caches (useful for tests)."""
 
-    _SCHEMA_CACHE.clear()
-    _VALIDATOR_CACHE.clear()
+    with _REGISTRY_LOCK:
+        _REGISTRIES.clear()
+    with _SUBTREE_LOCK:
+        _SUBTREE_CACHE.clear()
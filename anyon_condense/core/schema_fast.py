@@ -0,0 +1,273 @@
+"""Compile JSON schemas into plain-Python predicates.
+
+:func:`compile_schema` turns the subset of Draft 2020-12 used by the bundled
+v0 schemas into nested closures returning ``True``/``False``. The predicates
+are conservative: ``True`` means the instance is valid, while ``False`` only
+means "not proven valid" — :func:`~anyon_condense.core.schema.validate` then
+reruns ``jsonschema`` to decide and to produce the error message. Schemas
+using any keyword outside the supported subset compile to ``None``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Set
+from urllib.parse import urljoin
+
+__all__ = ["Predicate", "Resolver", "compile_schema"]
+
+Predicate = Callable[[Any], bool]
+Resolver = Callable[[str], Dict[str, Any]]
+
+# Keywords that never affect validity (formats are annotations unless a
+# format checker is configured, which ``core.schema`` does not do).
+_ANNOTATIONS = frozenset(
+    {"$id", "$schema", "$comment", "title", "description", "format", "examples"}
+)
+
+_TYPES: Dict[str, Predicate] = {
+    "object": lambda x: type(x) is dict,
+    "array": lambda x: type(x) is list,
+    "string": lambda x: type(x) is str,
+    "number": lambda x: type(x) is int or type(x) is float,
+    "integer": lambda x: type(x) is int,  # integral floats go to jsonschema
+    "null": lambda x: x is None,
+    "boolean": lambda x: type(x) is bool,
+}
+
+# Keywords whose predicates decide validity exactly (no "not proven" False)
+# for every type other than "integer"; see ``_kw_oneOf``.
+_EXACT = frozenset(
+    {"type", "const", "enum", "minLength", "pattern", "minimum", "minItems"}
+)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _key_matcher(pattern: str) -> Predicate:
+    regex = re.compile(pattern)
+    if pattern == "^.+$":  # the catch-all used for label-keyed maps
+        return lambda key: (bool(key) and "\n" not in key) or bool(regex.search(key))
+    return lambda key: regex.search(key) is not None
+
+
+class _Compiler:
+    def __init__(
+        self,
+        root: Dict[str, Any],
+        resolve: Optional[Resolver] = None,
+        refs: Optional[Dict[str, Predicate]] = None,
+    ) -> None:
+        self.root = root
+        self.resolve = resolve
+        self.base = str(root.get("$id", "")).partition("#")[0]
+        self.refs: Dict[str, Predicate] = {} if refs is None else refs
+
+    def ref(self, ref: str) -> Predicate:
+        uri, _, fragment = urljoin(self.base, ref).partition("#")
+        key = f"{uri}#{fragment}"
+        if key in self.refs:
+            return self.refs[key]
+        if fragment and not fragment.startswith("/"):
+            raise _Unsupported(ref)  # anchors
+        compiler = self
+        if uri != self.base:
+            if self.resolve is None:
+                raise _Unsupported(ref)
+            try:
+                document = self.resolve(uri)
+            except Exception as exc:
+                raise _Unsupported(ref) from exc
+            compiler = _Compiler(document, self.resolve, self.refs)
+        target: Any = compiler.root
+        for part in filter(None, fragment.split("/")):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or part not in target:
+                raise _Unsupported(ref)
+            target = target[part]
+        compiled: List[Predicate] = []
+        self.refs[key] = lambda x: compiled[0](x)  # allows recursive refs
+        compiled.append(compiler.compile(target))
+        self.refs[key] = compiled[0]
+        return compiled[0]
+
+    def compile(self, schema: Any) -> Predicate:
+        if schema is True or schema == {}:
+            return lambda x: True
+        if schema is False:
+            return lambda x: False
+        if not isinstance(schema, dict):
+            raise _Unsupported(schema)
+
+        checks: List[Predicate] = []
+        for keyword in schema:
+            if keyword in _ANNOTATIONS:
+                continue
+            builder = getattr(self, "_kw_" + keyword.lstrip("$"), None)
+            if builder is None:
+                raise _Unsupported(keyword)
+            check = builder(schema[keyword], schema)
+            if check is not None:
+                checks.append(check)
+
+        if not checks:
+            return lambda x: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda x: all(check(x) for check in checks)
+
+    # ---------------------------------------------------------- keywords
+    def _kw_ref(self, value: str, schema: Dict[str, Any]) -> Predicate:
+        return self.ref(value)
+
+    def _kw_type(self, value: Any, schema: Dict[str, Any]) -> Predicate:
+        names = [value] if isinstance(value, str) else list(value)
+        if any(name not in _TYPES for name in names):
+            raise _Unsupported(value)
+        preds = [_TYPES[name] for name in names]
+        if len(preds) == 1:
+            return preds[0]
+        return lambda x: any(pred(x) for pred in preds)
+
+    def _kw_const(self, value: Any, schema: Dict[str, Any]) -> Predicate:
+        if type(value) is not str:
+            raise _Unsupported(value)
+        return lambda x: type(x) is str and x == value
+
+    def _kw_enum(self, value: Any, schema: Dict[str, Any]) -> Predicate:
+        if not all(type(item) is str for item in value):
+            raise _Unsupported(value)
+        allowed = frozenset(value)
+        return lambda x: type(x) is str and x in allowed
+
+    def _kw_minLength(self, value: int, schema: Dict[str, Any]) -> Predicate:
+        return lambda x: type(x) is not str or len(x) >= value
+
+    def _kw_pattern(self, value: str, schema: Dict[str, Any]) -> Predicate:
+        regex = re.compile(value)
+        return lambda x: type(x) is not str or regex.search(x) is not None
+
+    def _kw_minimum(self, value: Any, schema: Dict[str, Any]) -> Predicate:
+        return lambda x: not _TYPES["number"](x) or x >= value
+
+    def _kw_minItems(self, value: int, schema: Dict[str, Any]) -> Predicate:
+        return lambda x: type(x) is not list or len(x) >= value
+
+    def _kw_uniqueItems(
+        self, value: bool, schema: Dict[str, Any]
+    ) -> Optional[Predicate]:
+        if not value:
+            return None
+
+        def unique(x: Any) -> bool:
+            if type(x) is not list:
+                return True
+            # Strings only; anything else is left to jsonschema's equality.
+            return all(type(item) is str for item in x) and len(set(x)) == len(x)
+
+        return unique
+
+    def _kw_items(self, value: Any, schema: Dict[str, Any]) -> Predicate:
+        item = self.compile(value)
+        return lambda x: type(x) is not list or all(map(item, x))
+
+    def _kw_oneOf(self, value: List[Any], schema: Dict[str, Any]) -> Predicate:
+        # Counting matches is only sound when no branch can wrongly reject
+        # and no instance can match two branches: every branch must use
+        # exact keywords and declare a type, with the type sets disjoint.
+        seen: Set[str] = set()
+        for branch in value:
+            if not isinstance(branch, dict) or "type" not in branch:
+                raise _Unsupported(branch)
+            if any(k not in _EXACT and k not in _ANNOTATIONS for k in branch):
+                raise _Unsupported(branch)
+            kind = branch["type"]
+            names = {kind} if isinstance(kind, str) else set(kind)
+            if "integer" in names or names & seen:
+                raise _Unsupported(branch)
+            seen |= names
+        branches = [self.compile(branch) for branch in value]
+        return lambda x: any(branch(x) for branch in branches)
+
+    def _kw_required(self, value: List[str], schema: Dict[str, Any]) -> Predicate:
+        names = tuple(value)
+        return lambda x: type(x) is not dict or all(name in x for name in names)
+
+    def _kw_properties(
+        self, value: Dict[str, Any], schema: Dict[str, Any]
+    ) -> Predicate:
+        # properties/patternProperties/additionalProperties are evaluated
+        # together by the object check built in ``_object``.
+        return self._object(schema)
+
+    def _kw_patternProperties(
+        self, value: Dict[str, Any], schema: Dict[str, Any]
+    ) -> Optional[Predicate]:
+        return None if "properties" in schema else self._object(schema)
+
+    def _kw_additionalProperties(
+        self, value: Any, schema: Dict[str, Any]
+    ) -> Optional[Predicate]:
+        if "properties" in schema or "patternProperties" in schema:
+            return None
+        return self._object(schema)
+
+    def _object(self, schema: Dict[str, Any]) -> Predicate:
+        props = {
+            name: self.compile(sub)
+            for name, sub in schema.get("properties", {}).items()
+        }
+        patterns = [
+            (_key_matcher(pattern), self.compile(sub))
+            for pattern, sub in schema.get("patternProperties", {}).items()
+        ]
+        extra_schema = schema.get("additionalProperties", True)
+        extra = None if extra_schema is True else self.compile(extra_schema)
+
+        if not props and len(patterns) == 1 and extra_schema is False:
+            # Label-keyed maps (``qdim``, ``fusion_rules``, ...).
+            ((matches, sub),) = patterns
+            return lambda x: type(x) is not dict or all(
+                matches(key) and sub(val) for key, val in x.items()
+            )
+
+        def check(x: Any) -> bool:
+            if type(x) is not dict:
+                return True
+            for key, val in x.items():
+                seen = False
+                if key in props:
+                    if not props[key](val):
+                        return False
+                    seen = True
+                for matches, sub in patterns:
+                    if matches(key):
+                        if not sub(val):
+                            return False
+                        seen = True
+                if not seen and extra is not None and not extra(val):
+                    return False
+            return True
+
+        return check
+
+
+def compile_schema(
+    schema: Any,
+    root: Optional[Dict[str, Any]] = None,
+    resolve: Optional[Resolver] = None,
+) -> Optional[Predicate]:
+    """Return a conservative validity predicate for *schema*, or ``None``.
+
+    *root* is the document local ``$ref`` pointers resolve against when
+    *schema* is a fragment of it (default: *schema* itself). *resolve* maps
+    the absolute URI of another schema document to its contents; without it
+    ``$ref`` to other documents makes the schema uncompilable.
+    """
+
+    try:
+        return _Compiler(schema if root is None else root, resolve).compile(schema)
+    except (_Unsupported, re.error, TypeError, AttributeError):
+        return None
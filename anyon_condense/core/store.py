@@ -0,0 +1,239 @@
+"""Persistent, content-addressed artifact store.
+
+Artifacts live at ``root/<kind>/<hh>/<hex>.json`` (``.json.gz`` when
+compressed), where ``<kind>:sha256:<hex>`` is the address returned by
+:func:`~anyon_condense.core.hashing.content_address`. Writes go to a
+temporary file in the shard directory and are moved into place with
+``os.replace``, so concurrent readers and writers never see partial
+artifacts. With ``max_bytes`` the store evicts least-recently-used
+artifacts after each write. Recency is the modification time (refreshed on
+every hit): the directory is scanned once, on first use, into an in-memory
+LRU index that gets, puts and evictions then keep current.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import pathlib
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, List, Optional, Tuple
+
+from . import jsoncodec
+from .exceptions import DataIOError
+from .hashing import content_address
+from .logging import get_logger
+
+__all__ = ["ArtifactStore"]
+
+logger = get_logger(__name__)
+
+_SUFFIXES = (".json", ".json.gz")
+_MISSING = object()
+# ``kind`` becomes a directory name: no separators, no ``.``/``..``.
+_KIND = re.compile(r"[A-Za-z0-9._-]+")
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+class ArtifactStore:
+    """Sharded directory of JSON artifacts addressed by ``content_address``.
+
+    ``compress=True`` gzips new artifacts (reads accept both encodings).
+    ``max_bytes=None`` disables eviction.
+    """
+
+    def __init__(
+        self,
+        root: str | pathlib.Path,
+        *,
+        max_bytes: Optional[int] = None,
+        compress: bool = False,
+        compresslevel: int = 6,
+    ) -> None:
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0.")
+        self.root = pathlib.Path(root)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+        # path -> size in bytes, least recently used first; built on first use.
+        self._index: Optional["OrderedDict[pathlib.Path, int]"] = None
+        self._size = 0
+
+    # --------------------------------------------------------------- layout
+    def _base(self, address: str) -> pathlib.Path:
+        kind, sep, digest = address.partition(":sha256:")
+        if (
+            not sep
+            or not _DIGEST.fullmatch(digest)
+            or not _KIND.fullmatch(kind)
+            or kind in (".", "..")
+        ):
+            raise ValueError(f"Not a content address: {address!r}")
+        base = self.root / kind / digest[:2] / digest
+        root = self.root.resolve()
+        if not base.resolve().is_relative_to(root):  # e.g. a symlinked kind
+            raise ValueError(f"Address {address!r} resolves outside the store")
+        return base
+
+    def path_for(self, address: str) -> Optional[pathlib.Path]:
+        """File holding *address*, or ``None`` when it is not stored."""
+
+        base = self._base(address)
+        for suffix in _SUFFIXES:
+            path = base.with_name(base.name + suffix)
+            if path.exists():
+                return path
+        return None
+
+    def __contains__(self, address: str) -> bool:
+        return self.path_for(address) is not None
+
+    def _files(self) -> Iterator[pathlib.Path]:
+        if self.root.exists():
+            for suffix in _SUFFIXES:
+                yield from self.root.glob(f"*/??/*{suffix}")
+
+    # ----------------------------------------------------------------- read
+    def get(self, address: str, default: Any = _MISSING) -> Any:
+        """Return the stored value; ``KeyError`` (or *default*) when missing."""
+
+        path = self.path_for(address)
+        if path is not None:
+            try:
+                data = path.read_bytes()
+                if path.suffix == ".gz":
+                    data = gzip.decompress(data)
+                value = jsoncodec.loads(data)
+            except FileNotFoundError:  # evicted concurrently
+                path = None
+            except (OSError, ValueError) as exc:
+                logger.error("[ACSTORE01] read_error address=%s exc=%s", address, exc)
+                raise DataIOError(f"[ACSTORE01] read_error address={address}") from exc
+            else:
+                try:
+                    os.utime(path)  # LRU: a hit counts as a use
+                except OSError:  # pragma: no cover - evicted concurrently
+                    pass
+                self._touch(path, len(data) if path.suffix != ".gz" else None)
+                return value
+        if default is _MISSING:
+            raise KeyError(address)
+        return default
+
+    # ---------------------------------------------------------------- write
+    def put(self, value: Any, kind: str, *, address: Optional[str] = None) -> str:
+        """Store *value* and return its address.
+
+        By default the address is ``content_address(value, kind)``; callers
+        that index by something else (e.g. the bytes a payload was parsed
+        from) pass *address* explicitly. Existing artifacts are only touched.
+        """
+
+        address = address or content_address(value, kind)
+        existing = self.path_for(address)
+        if existing is not None:
+            try:
+                os.utime(existing)
+                self._touch(existing, None)
+                return address
+            except FileNotFoundError:  # evicted concurrently; write it again
+                pass
+
+        data = jsoncodec.dumps(value)
+        suffix = ".json"
+        if self.compress:
+            data = gzip.compress(data, compresslevel=self.compresslevel, mtime=0)
+            suffix = ".json.gz"
+        base = self._base(address)
+        target = base.with_name(base.name + suffix)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp, target)
+            except BaseException:
+                pathlib.Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.error("[ACSTORE02] write_error address=%s exc=%s", address, exc)
+            raise DataIOError(f"[ACSTORE02] write_error address={address}") from exc
+
+        self._touch(target, len(data))
+        if self.max_bytes is not None:
+            self.evict(keep=address)
+        return address
+
+    # ------------------------------------------------------------- eviction
+    def _load_index(self) -> "OrderedDict[pathlib.Path, int]":
+        # Caller holds the lock.
+        if self._index is None:
+            entries = sorted((_stat(path), path) for path in self._files())
+            self._index = OrderedDict((path, size) for (_, size), path in entries)
+            self._size = sum(self._index.values())
+        return self._index
+
+    def _touch(self, path: pathlib.Path, size: Optional[int]) -> None:
+        """Mark *path* most recently used; *size* ``None`` keeps the known size."""
+
+        with self._lock:
+            index = self._load_index()
+            old = index.pop(path, None)
+            if size is None:
+                size = _stat(path)[1] if old is None else old
+            index[path] = size
+            self._size += size - (old or 0)
+
+    def size_bytes(self) -> int:
+        """Total size of stored artifacts (scanned once, then tracked)."""
+
+        with self._lock:
+            self._load_index()
+            return self._size
+
+    def evict(self, *, keep: Optional[str] = None) -> List[str]:
+        """Delete least-recently-used artifacts until under ``max_bytes``."""
+
+        if self.max_bytes is None:
+            return []
+        keep_path = self.path_for(keep) if keep else None
+        removed: List[str] = []
+        with self._lock:
+            index = self._load_index()
+            while self._size > self.max_bytes and index:
+                path = next(iter(index))
+                if path == keep_path:  # the newest entry: nothing else is left
+                    break
+                path.unlink(missing_ok=True)
+                self._size -= index.pop(path)
+                removed.append(_address_of(path))
+            total = self._size
+        if removed:
+            logger.debug("store.evict count=%d size=%d", len(removed), total)
+        return removed
+
+    def clear(self) -> None:
+        for path in list(self._files()):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._index = OrderedDict()
+            self._size = 0
+
+
+def _stat(path: pathlib.Path) -> Tuple[float, int]:
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        return 0.0, 0
+    return info.st_mtime, info.st_size
+
+
+def _address_of(path: pathlib.Path) -> str:
+    digest = path.name.split(".", 1)[0]
+    return f"{path.parent.parent.name}:sha256:{digest}"
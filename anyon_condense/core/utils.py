@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import json
 import math
-from typing import Any, Dict, List, Tuple, TypeGuard, Union
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Tuple, TypeGuard, Union
 
 from .exceptions import CanonicalizationError
 
@@ -34,6 +36,17 @@ def _all_scalars(seq: List[JSONType]) -> TypeGuard[List[JSONScalar]]:
     return all(_is_scalar(item) for item in seq)
 
 
+def _scalar_sort_key(item: JSONScalar) -> Tuple[int, Tuple[Any, ...]]:
+    rank = _type_rank(item)
+    if isinstance(item, float):
+        return rank, (item,)
+    if isinstance(item, (int, bool)) or item is None:
+        return rank, (item,)
+    if isinstance(item, str):
+        return rank, (item,)
+    return 99, (str(item),)
+
+
 def _normalize_float(value: float, path: str) -> float:
     if not math.isfinite(value):
         raise CanonicalizationError(f"Non-finite float at {path}: {value}")
@@ -60,18 +73,7 @@ def _normalize_node(node: Any, path: str, *, reorder_arrays: bool) -> JSONType:
             for index, value in enumerate(node)
         ]
         if reorder_arrays and _all_scalars(normalized_items):
-
-            def key_fn(item: JSONScalar) -> Tuple[int, Tuple[Any, ...]]:
-                rank = _type_rank(item)
-                if isinstance(item, float):
-                    return rank, (item,)
-                if isinstance(item, (int, bool)) or item is None:
-                    return rank, (item,)
-                if isinstance(item, str):
-                    return rank, (item,)
-                return 99, (str(item),)
-
-            normalized_items.sort(key=key_fn)
+            normalized_items.sort(key=_scalar_sort_key)
         return normalized_items
 
     if node is None or isinstance(node, bool) or isinstance(node, str):
@@ -106,4 +108,184 @@ def canonical_json_dump(
         raise CanonicalizationError(f"JSON serialization error: {exc}") from exc
 
 
-__all__ = ["canonical_json_dump"]
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class _StreamFailure(Exception):
+    """Internal: carries the failing location up the recursion lazily."""
+
+    def __init__(self, describe: Callable[[str], str]) -> None:
+        super().__init__()
+        self.describe = describe
+        self.segments: List[str] = []
+
+    def path(self) -> str:
+        return "$" + "".join(reversed(self.segments))
+
+
+def _sink_writer(sink: Any) -> Callable[[str], Any]:
+    """Adapt *sink* (hash object, binary or text file) to a ``str`` consumer."""
+
+    update = getattr(sink, "update", None)
+    if callable(update):
+        return lambda chunk: update(chunk.encode("utf-8"))
+    if isinstance(sink, io.TextIOBase):
+        return sink.write
+    write = getattr(sink, "write", None)
+    if callable(write):
+        return lambda chunk: write(chunk.encode("utf-8"))
+    raise CanonicalizationError(
+        f"Unsupported sink type: {type(sink).__name__} (needs update() or write())"
+    )
+
+
+class _CanonicalStreamEncoder:
+    """Single-pass canonical encoder emitting chunks of roughly ``chunk_size``.
+
+    Produces exactly the text of :func:`canonical_json_dump` without building a
+    normalized copy of the payload or the full JSON string. Values are visited
+    in sorted key order, so with several invalid values the first one found
+    may differ from the dump's (insertion order); :func:`canonical_json_stream`
+    re-derives the dump's error in that case.
+    """
+
+    def __init__(
+        self, emit: Callable[[str], Any], *, reorder_arrays: bool, chunk_size: int
+    ) -> None:
+        self._emit = emit
+        self._reorder = reorder_arrays
+        self._chunk_size = max(1, chunk_size)
+        self._parts: List[str] = []
+        self._size = 0
+
+    def _put(self, piece: str) -> None:
+        self._parts.append(piece)
+        self._size += len(piece)
+        if self._size >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self._emit("".join(self._parts))
+            self._parts = []
+            self._size = 0
+
+    def encode(self, node: Any) -> None:
+        if isinstance(node, str):
+            self._put(encode_basestring(node))
+        elif node is None:
+            self._put("null")
+        elif node is True:
+            self._put("true")
+        elif node is False:
+            self._put("false")
+        elif isinstance(node, int):
+            self._put(int.__repr__(node))
+        elif isinstance(node, float):
+            self._put(float.__repr__(self._float(node)))
+        elif isinstance(node, dict):
+            self._encode_dict(node)
+        elif isinstance(node, list):
+            self._encode_list(node)
+        else:
+            type_name = type(node).__name__
+            raise _StreamFailure(
+                lambda path: f"Unsupported type at {path}: {type_name}"
+            )
+
+    @staticmethod
+    def _float(value: float) -> float:
+        if not math.isfinite(value):
+            raise _StreamFailure(lambda path: f"Non-finite float at {path}: {value}")
+        if value == 0.0:
+            return 0.0
+        return value
+
+    def _encode_dict(self, node: Dict[Any, Any]) -> None:
+        for key in node:
+            if not isinstance(key, str):
+                raise _StreamFailure(lambda path: f"Non-string key at {path}: {key!r}")
+        if not node:
+            self._put("{}")
+            return
+        separator = "{"
+        for key in sorted(node):
+            self._put(separator + encode_basestring(key) + ":")
+            separator = ","
+            try:
+                self.encode(node[key])
+            except _StreamFailure as failure:
+                failure.segments.append(f".{key}")
+                raise
+        self._put("}")
+
+    def _encode_list(self, node: List[Any]) -> None:
+        items: List[Any] = node
+        if self._reorder and _all_scalars(node):
+            items = []
+            for index, value in enumerate(node):
+                if isinstance(value, float):
+                    try:
+                        value = self._float(value)
+                    except _StreamFailure as failure:
+                        failure.segments.append(f"[{index}]")
+                        raise
+                items.append(value)
+            items.sort(key=_scalar_sort_key)
+        if not items:
+            self._put("[]")
+            return
+        if all(type(value) is float for value in items) and all(
+            map(math.isfinite, items)
+        ):
+            # Matrix rows: one join instead of a _put per element (-0.0 or 0.0 -> 0.0).
+            self._put("[" + ",".join([float.__repr__(v or 0.0) for v in items]) + "]")
+            return
+        separator = "["
+        for index, value in enumerate(items):
+            self._put(separator)
+            separator = ","
+            try:
+                self.encode(value)
+            except _StreamFailure as failure:
+                failure.segments.append(f"[{index}]")
+                raise
+        self._put("]")
+
+
+def canonical_json_stream(
+    payload: Dict[str, Any],
+    sink: Any,
+    *,
+    reorder_arrays: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Stream the canonical JSON of *payload* into *sink* chunk by chunk.
+
+    *sink* may be a hash object (anything with ``update(bytes)``, e.g.
+    ``hashlib.sha256()``), a text file (receives ``str``) or a binary file
+    (receives UTF-8 ``bytes``). The emitted bytes are identical to
+    ``canonical_json_dump(payload).encode("utf-8")``, and errors carry the
+    same message (the first invalid value in insertion order). On error,
+    chunks written before the failing value have already reached the sink.
+    """
+
+    if not isinstance(payload, dict):
+        raise CanonicalizationError("Top-level must be a JSON object (dict).")
+
+    encoder = _CanonicalStreamEncoder(
+        _sink_writer(sink), reorder_arrays=reorder_arrays, chunk_size=chunk_size
+    )
+    try:
+        encoder.encode(payload)
+    except _StreamFailure as failure:
+        # The stream walks keys in sorted order; the dump reports the first
+        # error in insertion order. Only failing payloads pay for this pass.
+        _normalize_node(payload, path="$", reorder_arrays=reorder_arrays)
+        raise CanonicalizationError(failure.describe(failure.path())) from None
+    except ValueError as exc:  # pragma: no cover - e.g. int digit limits
+        raise CanonicalizationError(f"JSON serialization error: {exc}") from exc
+    encoder.flush()
+
+
+__all__ = ["canonical_json_dump", "canonical_json_stream"]
@@ -1 +1,13 @@
-# Pipelines subpackage (placeholder)
+"""Reproducible pipelines: stage DAGs with content-addressed caching."""
+
+from .dag import Pipeline, PipelineRun, Stage, StageCache
+from .umtc import DEFAULT_CHECKS, umtc_pipeline
+
+__all__ = [
+    "DEFAULT_CHECKS",
+    "Pipeline",
+    "PipelineRun",
+    "Stage",
+    "StageCache",
+    "umtc_pipeline",
+]
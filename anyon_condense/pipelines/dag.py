@@ -0,0 +1,226 @@
+"""DAG executor whose stage results are cached on disk by content address.
+
+A stage's cache key is ``content_address`` of its name, a fingerprint of its
+function (source text unless ``version`` is given), its parameters, the
+content addresses of its inputs' *values* and the ``NumericPolicy``
+snapshot. Editing one stage therefore changes its key and, once its output
+differs, the keys of everything downstream; untouched branches are served
+from the cache. Ready stages run concurrently on a thread pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import pathlib
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from anyon_condense.core.exceptions import DataIOError, PipelineError
+from anyon_condense.core.hashing import content_address
+from anyon_condense.core.logging import get_logger
+from anyon_condense.core.store import ArtifactStore
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+__all__ = ["Pipeline", "PipelineRun", "Stage", "StageCache"]
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+def _fingerprint(func: Callable[..., Any]) -> str:
+    try:
+        text = inspect.getsource(func)
+    except (OSError, TypeError):
+        text = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node: ``func(policy, *inputs, **params)`` with ``inputs`` = ``deps``.
+
+    ``kind`` prefixes the content address (default: the stage name).
+    ``cache=False`` always runs the stage (loaders reading files, writers);
+    its output is still addressed so downstream keys follow the content.
+    Stage outputs must be JSON-compatible.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    params: Mapping[str, Any] = field(default_factory=dict)
+    kind: Optional[str] = None
+    cache: bool = True
+    version: Optional[str] = None
+
+    def key(self, input_addresses: Sequence[str], policy: NumericPolicy) -> str:
+        return content_address(
+            {
+                "stage": self.name,
+                "code": self.version or _fingerprint(self.func),
+                "params": dict(self.params),
+                "inputs": list(input_addresses),
+                "policy": policy.snapshot(),
+            },
+            f"stage-{self.kind or self.name}",
+        )
+
+
+class StageCache:
+    """Stage results kept in an :class:`ArtifactStore` under their stage key.
+
+    Entries live at ``root/<kind>/<hh>/<hex>.json`` (gzipped with
+    ``compress=True``) and are written atomically; ``max_bytes`` bounds the
+    cache with least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        root: str | pathlib.Path,
+        *,
+        max_bytes: Optional[int] = None,
+        compress: bool = False,
+    ) -> None:
+        self.store = ArtifactStore(root, max_bytes=max_bytes, compress=compress)
+        self.root = self.store.root
+
+    def get(self, key: str) -> Any:
+        """Return ``(value, output_address)`` or ``_MISSING``."""
+
+        try:
+            entry = self.store.get(key, None)
+        except DataIOError:
+            return _MISSING
+        if entry is None:
+            return _MISSING
+        return entry["value"], entry["address"]
+
+    def put(self, key: str, value: Any, address: str) -> None:
+        entry = {"key": key, "address": address, "value": value}
+        self.store.put(entry, "stage", address=key)
+
+
+@dataclass
+class PipelineRun:
+    """Outcome of :meth:`Pipeline.run`: values and addresses per stage."""
+
+    values: Dict[str, Any]
+    addresses: Dict[str, str]
+    keys: Dict[str, str]
+    computed: List[str]
+    cached: List[str]
+    seconds: Dict[str, float]
+
+
+class Pipeline:
+    """A validated DAG of :class:`Stage` objects."""
+
+    def __init__(self, stages: Sequence[Stage]) -> None:
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise PipelineError(f"duplicate stage {stage.name!r}")
+            self.stages[stage.name] = stage
+        for stage in stages:
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise PipelineError(
+                        f"stage {stage.name!r} depends on unknown {dep!r}"
+                    )
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        indegree = {name: len(stage.deps) for name, stage in self.stages.items()}
+        ready = [name for name, count in indegree.items() if count == 0]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other, stage in self.stages.items():
+                if name in stage.deps:
+                    indegree[other] -= 1
+                    if indegree[other] == 0:
+                        ready.append(other)
+        if len(order) != len(self.stages):
+            raise PipelineError("pipeline graph has a cycle")
+        return order
+
+    def replace(self, stage: Stage) -> "Pipeline":
+        """Copy of this pipeline with one stage swapped for *stage*."""
+
+        if stage.name not in self.stages:
+            raise PipelineError(f"unknown stage {stage.name!r}")
+        return Pipeline(
+            [stage if s.name == stage.name else s for s in self.stages.values()]
+        )
+
+    def run(
+        self,
+        policy: Optional[NumericPolicy] = None,
+        *,
+        cache: Optional[StageCache] = None,
+        max_workers: Optional[int] = None,
+    ) -> PipelineRun:
+        """Execute all stages; cached results are reused when *cache* is given.
+
+        Stages whose inputs are ready run concurrently on up to
+        ``max_workers`` threads (``1`` runs them one by one in order).
+        Raises :class:`PipelineError` wrapping the first failing stage.
+        """
+
+        policy = policy or NumericPolicy()
+        result = PipelineRun({}, {}, {}, [], [], {})
+        waiting = {name: set(self.stages[name].deps) for name in self.order}
+
+        def execute(name: str) -> Tuple[Any, str, str, bool, float]:
+            stage = self.stages[name]
+            start = time.perf_counter()
+            key = stage.key([result.addresses[d] for d in stage.deps], policy)
+            if stage.cache and cache is not None:
+                hit = cache.get(key)
+                if hit is not _MISSING:
+                    value, address = hit
+                    return value, address, key, True, time.perf_counter() - start
+            inputs = [result.values[d] for d in stage.deps]
+            try:
+                value = stage.func(policy, *inputs, **stage.params)
+            except Exception as exc:
+                raise PipelineError(f"stage {name!r} failed: {exc}") from exc
+            address = content_address(value, stage.kind or name)
+            if stage.cache and cache is not None:
+                cache.put(key, value, address)
+            return value, address, key, False, time.perf_counter() - start
+
+        def record(name: str, outcome: Tuple[Any, str, str, bool, float]) -> None:
+            value, address, key, hit, seconds = outcome
+            result.values[name] = value
+            result.addresses[name] = address
+            result.keys[name] = key
+            result.seconds[name] = seconds
+            (result.cached if hit else result.computed).append(name)
+            logger.debug(
+                "pipeline.stage name=%s cached=%s secs=%.4f", name, hit, seconds
+            )
+            for other, deps in waiting.items():
+                deps.discard(name)
+
+        if max_workers == 1:
+            for name in self.order:
+                record(name, execute(name))
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running: Dict[Future, str] = {}
+            pending = list(self.order)
+            while pending or running:
+                for name in [n for n in pending if not waiting[n]]:
+                    pending.remove(name)
+                    running[pool.submit(execute, name)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(running.pop(future), future.result())
+        return result
@@ -0,0 +1,107 @@
+"""The standard ``load → normalize → compute → check → write`` UMTC pipeline."""
+
+from __future__ import annotations
+
+import copy
+import pathlib
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from anyon_condense.core.consistency.modular import check_modular_relations
+from anyon_condense.core.io import load_umtc_input, write_umtc_output
+from anyon_condense.core.numdump import normalize_payload_numbers
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+from .dag import Pipeline, Stage
+
+__all__ = ["DEFAULT_CHECKS", "umtc_pipeline"]
+
+Compute = Callable[[NumericPolicy, Dict[str, Any]], Dict[str, Any]]
+Check = Callable[[NumericPolicy, Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+
+
+def load_stage(policy: NumericPolicy, *, path: str) -> Dict[str, Any]:
+    return load_umtc_input(path)
+
+
+def normalize_stage(policy: NumericPolicy, payload: Dict[str, Any]) -> Dict[str, Any]:
+    return normalize_payload_numbers(payload, policy)
+
+
+def modular_check(
+    policy: NumericPolicy, output: Dict[str, Any], fusion_input: Dict[str, Any]
+) -> Dict[str, Any]:
+    return check_modular_relations(output["S"], output["T"], policy)
+
+
+def verlinde_check(
+    policy: NumericPolicy, output: Dict[str, Any], fusion_input: Dict[str, Any]
+) -> Dict[str, Any]:
+    from anyon_condense.algorithms.verlinde import check_verlinde_payload
+
+    return check_verlinde_payload(output, fusion_input, policy)
+
+
+DEFAULT_CHECKS: Dict[str, Check] = {
+    "modular": modular_check,
+    "verlinde": verlinde_check,
+}
+
+
+def write_stage(
+    policy: NumericPolicy,
+    output: Dict[str, Any],
+    *reports: Dict[str, Any],
+    path: str,
+    sources: List[str],
+    checks: List[str],
+) -> Dict[str, Any]:
+    payload = copy.deepcopy(output)
+    payload.setdefault("checks", {}).update(zip(checks, reports))
+    payload.setdefault("hashes", {})
+    payload["_sources"] = sources
+    write_umtc_output(path, payload)
+    return {"path": path, "hashes": payload["hashes"]}
+
+
+def umtc_pipeline(
+    input_path: str | pathlib.Path,
+    output_path: str | pathlib.Path,
+    compute: Compute,
+    *,
+    checks: Optional[Mapping[str, Check]] = None,
+) -> Pipeline:
+    """Build the standard pipeline for one input file.
+
+    ``compute(policy, normalized_input)`` returns the ``ac-umtc`` output
+    fields (objects, qdim, global_dim, twist, S, T, ...). Each entry of
+    *checks* (default: modular relations and Verlinde) becomes its own
+    stage ``check:<name>`` depending on compute and normalize, so the checks
+    run concurrently; their reports land in ``checks`` of the written file.
+    Loading and writing always run; the rest is served from the stage cache
+    while inputs, code and policy are unchanged.
+    """
+
+    checks = dict(DEFAULT_CHECKS if checks is None else checks)
+    stages = [
+        Stage("load", load_stage, params={"path": str(input_path)}, cache=False),
+        Stage("normalize", normalize_stage, deps=("load",)),
+        Stage("compute", compute, deps=("normalize",), kind="umtc-output"),
+    ]
+    stages.extend(
+        Stage(f"check:{name}", check, deps=("compute", "normalize"))
+        for name, check in checks.items()
+    )
+    stages.append(
+        Stage(
+            "write",
+            write_stage,
+            deps=("compute", *(f"check:{name}" for name in checks)),
+            params={
+                "path": str(output_path),
+                "sources": [str(input_path)],
+                "checks": list(checks),
+            },
+            cache=False,
+        )
+    )
+    return Pipeline(stages)
@@ -15,6 +15,12 @@ from .numeric_policy import (
     policy_from_env,
     reorder_scalar_array,
 )
+from .quant_cache import (
+    QuantCacheInfo,
+    clear_quant_cache,
+    configure_quant_cache,
+    quant_cache_info,
+)
 
 __all__ = [
     "is_finite",
@@ -28,4 +34,8 @@ __all__ = [
     "format_float",
     "reorder_scalar_array",
     "policy_from_env",
+    "QuantCacheInfo",
+    "clear_quant_cache",
+    "configure_quant_cache",
+    "quant_cache_info",
 ]
@@ -7,6 +7,7 @@ from typing import Any, List, Mapping, Optional, Sequence, Union
 
 from anyon_condense.core.exceptions import NumericFieldError
 from anyon_condense.scalars.float_backend import is_finite, normalize_float
+from anyon_condense.scalars.quant_cache import QUANT_CACHE
 
 Number = Union[int, float]
 
@@ -150,7 +151,19 @@ def _auto_fixed(x: float, dp: int, rounding_key: str) -> str:
     return f"{y:.{dp}f}"
 
 
+def _clip_small_memo(x: float, policy: NumericPolicy) -> float:
+    if type(x) is float:
+        return QUANT_CACHE.lookup("clip", x, policy, clip_small)
+    return clip_small(x, policy)
+
+
 def format_float(x: float, policy: NumericPolicy) -> str:
+    if type(x) is float:
+        return QUANT_CACHE.lookup("format", x, policy, _format_float)
+    return _format_float(x, policy)
+
+
+def _format_float(x: float, policy: NumericPolicy) -> str:
     x = clip_small(x, policy)
 
     if policy.fmt == "scientific":
@@ -177,11 +190,11 @@ def reorder_scalar_array(arr: Sequence[Number], policy: NumericPolicy) -> List[N
             result: List[Number] = []
             for original in arr:
                 if isinstance(original, float):
-                    result.append(clip_small(original, policy))
+                    result.append(_clip_small_memo(original, policy))
                 else:
                     result.append(original)
             return result
-        processed.append(clip_small(float(item), policy))
+        processed.append(_clip_small_memo(float(item), policy))
 
     if not policy.array_reorder:
         return processed
@@ -0,0 +1,127 @@
+"""Bounded LRU memo shared by numeric quantization and formatting helpers."""
+
+from __future__ import annotations
+
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+__all__ = [
+    "QuantCache",
+    "QuantCacheInfo",
+    "QUANT_CACHE",
+    "clear_quant_cache",
+    "configure_quant_cache",
+    "quant_cache_info",
+]
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 4096
+
+_DOUBLE = struct.Struct("<d")
+
+
+@dataclass(frozen=True)
+class QuantCacheInfo:
+    """Counters snapshot, mirroring ``functools.lru_cache().cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class QuantCache:
+    """LRU cache keyed by ``(kind, IEEE-754 bits, policy)``.
+
+    Keys use the raw bits of the float rather than its value so ``-0.0`` and
+    ``+0.0`` never share an entry. ``kind`` separates the helpers sharing the
+    cache (e.g. ``"quantize"``, ``"format"``, ``"clip"``). Exceptions raised by
+    the compute function are never cached. ``maxsize=0`` disables storage.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Tuple[str, bytes, Hashable], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(
+        self,
+        kind: str,
+        x: float,
+        policy: Hashable,
+        compute: Callable[[float, Any], T],
+    ) -> T:
+        """Return ``compute(x, policy)``, memoized under ``kind``."""
+
+        key = (kind, _DOUBLE.pack(x), policy)
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+
+        value = compute(x, policy)
+        if self._maxsize:
+            with self._lock:
+                self._data[key] = value
+                if len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+        return value
+
+    def info(self) -> QuantCacheInfo:
+        with self._lock:
+            return QuantCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0.")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+
+QUANT_CACHE = QuantCache()
+
+
+def quant_cache_info() -> QuantCacheInfo:
+    """Return hit/miss counters of the process-wide quantization cache."""
+
+    return QUANT_CACHE.info()
+
+
+def clear_quant_cache() -> None:
+    """Clear the process-wide quantization cache (useful for tests)."""
+
+    QUANT_CACHE.clear()
+
+
+def configure_quant_cache(maxsize: int) -> None:
+    """Change the bound of the process-wide cache; ``0`` disables memoization."""
+
+    QUANT_CACHE.resize(maxsize)
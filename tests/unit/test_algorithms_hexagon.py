@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import check_hexagon_payload, hexagon_equation_chunks
+from anyon_condense.algorithms._fusion import FusionTable
+from anyon_condense.core.consistency import check_hexagon_arrays
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def ising_payload():
+    return json.loads((EXAMPLES / "ising_umtc_input.json").read_text())
+
+
+def brute_force_count(payload):
+    N = FusionTable.from_payload(payload).ring.N
+    n = N.shape[0]
+    return sum(
+        1
+        for a, b, c, d, e, g in itertools.product(range(n), repeat=6)
+        if N[a, c, e] and N[e, b, d] and N[c, b, g] and N[a, g, d]
+    )
+
+
+def test_ising_hexagons_hold():
+    payload = ising_payload()
+    out = check_hexagon_payload(payload, NumericPolicy())
+    assert out["status"] is True
+    assert set(out["families"]) == {"R", "R_inverse"}
+    per_family = brute_force_count(payload)
+    assert all(fam["total"] == per_family for fam in out["families"].values())
+    assert out["total"] == 2 * per_family
+    assert out["max_abs_err"] < 1e-12
+
+
+def test_chunks_feed_core_hexagon_checker():
+    payload = ising_payload()
+    chunks = list(hexagon_equation_chunks(payload, "R_inverse", chunk_size=4))
+    lhs = np.concatenate([chunk.lhs for chunk in chunks])
+    rhs = np.concatenate([chunk.rhs for chunk in chunks])
+    assert check_hexagon_arrays(lhs, rhs, NumericPolicy())["status"] is True
+    with pytest.raises(ValueError, match="family"):
+        next(hexagon_equation_chunks(payload, "clockwise"))
+
+
+def test_complex_conjugated_r_breaks_hexagons():
+    payload = copy.deepcopy(ising_payload())
+    re, im = payload["R_symbols"]["(sigma,sigma;1)"]
+    payload["R_symbols"]["(sigma,sigma;1)"] = [re, -im]
+    out = check_hexagon_payload(payload, NumericPolicy(), worst=2)
+    assert out["status"] is False
+    for family in out["families"].values():
+        assert family["failed"] > 0
+        assert len(family["worst_equations"]) == 2
+        assert all(set(eq) == set("abcdeg") for eq in family["worst_equations"])
+
+
+def test_process_pool_matches_serial():
+    payload = copy.deepcopy(ising_payload())
+    payload["R_symbols"]["(psi,sigma;sigma)"] = [0.0, 1.0]
+    serial = check_hexagon_payload(payload, NumericPolicy(), chunk_size=7)
+    pooled = check_hexagon_payload(
+        payload,
+        NumericPolicy(),
+        chunk_size=7,
+        parallel=True,
+        max_workers=2,
+        process_threshold=1,
+    )
+    assert pooled == serial
+
+
+def test_missing_r_symbol_is_rejected():
+    payload = copy.deepcopy(ising_payload())
+    del payload["R_symbols"]["(psi,psi;1)"]
+    with pytest.raises(ValueError, match=r"R_symbols\[\(psi,psi;1\)\]"):
+        check_hexagon_payload(payload, NumericPolicy())
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import (
+    check_pentagon_payload,
+    f_symbol_table,
+    pentagon_equation_chunks,
+)
+from anyon_condense.algorithms._fusion import FusionTable
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def ising_payload():
+    return json.loads((EXAMPLES / "ising_umtc_input.json").read_text())
+
+
+def brute_force_count(payload):
+    N = FusionTable.from_payload(payload).ring.N
+    n = N.shape[0]
+    return sum(
+        1
+        for a, b, c, d, e, f, g, k, l_ in itertools.product(range(n), repeat=9)
+        if N[a, b, f]
+        and N[f, c, g]
+        and N[g, d, e]
+        and N[c, d, l_]
+        and N[b, l_, k]
+        and N[a, k, e]
+    )
+
+
+def test_ising_pentagon_holds_and_covers_all_tuples():
+    payload = ising_payload()
+    out = check_pentagon_payload(payload, NumericPolicy())
+    assert out["status"] is True
+    assert out["total"] == brute_force_count(payload) == 136
+    assert out["max_abs_err"] < 1e-12
+
+
+def cat(chunks, field):
+    return np.concatenate([getattr(chunk, field) for chunk in chunks])
+
+
+def test_chunking_and_sparse_table_do_not_change_results():
+    payload = ising_payload()
+    fusion = FusionTable.from_payload(payload)
+    dense = list(pentagon_equation_chunks(payload, fusion=fusion))
+    sparse = list(
+        pentagon_equation_chunks(
+            payload,
+            chunk_size=5,
+            fusion=fusion,
+            F=f_symbol_table(payload, fusion, dense_limit=0),
+        )
+    )
+    assert max(len(chunk.lhs) for chunk in sparse) < 136
+    order_d = np.lexsort(cat(dense, "indices").T)
+    order_s = np.lexsort(cat(sparse, "indices").T)
+    for field in ("indices", "lhs", "rhs"):
+        assert np.allclose(cat(dense, field)[order_d], cat(sparse, field)[order_s])
+
+
+def test_wrong_f_symbol_is_reported_with_labels():
+    payload = ising_payload()
+    broken = copy.deepcopy(payload)
+    broken["F_symbols"]["(sigma,sigma,sigma,sigma;psi,psi)"] = [0.5, 0.5]
+    out = check_pentagon_payload(broken, NumericPolicy(), worst=3)
+    assert out["status"] is False and out["failed"] > 0
+    assert len(out["worst_equations"]) == 3
+    assert all(set(eq) == set("abcdefgkl") for eq in out["worst_equations"])
+
+
+def test_invalid_f_symbols_are_rejected():
+    payload = ising_payload()
+    bad = copy.deepcopy(payload)
+    bad["F_symbols"]["(psi,psi,psi,psi;psi,psi)"] = 1.0
+    with pytest.raises(ValueError, match="not admissible"):
+        check_pentagon_payload(bad, NumericPolicy())
+    missing = dict(payload, F_symbols=None)
+    with pytest.raises(ValueError, match="F_symbols"):
+        check_pentagon_payload(missing, NumericPolicy())
+    multi = copy.deepcopy(payload)
+    multi["fusion_rules"]["(sigma,sigma)"]["1"] = 2
+    with pytest.raises(ValueError, match="multiplicity-free"):
+        check_pentagon_payload(multi, NumericPolicy())
+
+
+def test_fusion_table_admissibility_is_sparse():
+    payload = ising_payload()
+    fusion = FusionTable.from_payload(payload)
+    out = check_pentagon_payload(payload, NumericPolicy())
+    assert out["status"] is True
+    list(pentagon_equation_chunks(payload, fusion=fusion))
+    assert fusion.ring._dense is None  # no rank**3 tensor was built
+
+    n = fusion.rank
+    a, b, c = np.indices((n, n, n)).reshape(3, -1)
+    assert (fusion.admissible(a, b, c) == (fusion.ring.N[a, b, c] > 0)).all()
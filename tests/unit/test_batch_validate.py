@@ -0,0 +1,107 @@
+import json
+import pathlib
+
+import pytest
+
+from anyon_condense.cli import main
+from anyon_condense.core.batch import (
+    BatchSummary,
+    collect_paths,
+    schema_for,
+    validate_files,
+)
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+EXAMPLES_DIR = ROOT / "tests" / "examples"
+
+EXPECTED_INVALID = {
+    "bad_mfusion_bad_key.json",
+    "bad_mfusion_missing_dual.json",
+    "bad_umtc_output_extra_topkey.json",
+    "bad_umtc_output_missing_provenance.json",
+}
+
+
+def test_collect_paths_dir_glob_and_file() -> None:
+    from_dir = collect_paths(EXAMPLES_DIR)
+    assert from_dir == sorted(from_dir) and len(from_dir) >= 10
+    assert collect_paths(str(EXAMPLES_DIR / "bad_*.json")) == [
+        p for p in from_dir if pathlib.Path(p).name.startswith("bad_")
+    ]
+    single = EXAMPLES_DIR / "Vec_Z2_mfusion.json"
+    assert collect_paths(single) == [str(single)]
+
+
+def test_schema_for() -> None:
+    assert schema_for({"format": "ac-mfusion"}) == "mfusion_input.schema.json"
+    assert schema_for({"format": "ac-umtc", "simple_objects": []}) == (
+        "umtc_input.schema.json"
+    )
+    assert schema_for({"format": "ac-umtc", "S": []}) == "umtc_output.schema.json"
+    assert schema_for([]) is None
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_validate_files_in_order(processes: int) -> None:
+    paths = collect_paths(EXAMPLES_DIR)
+    results = list(validate_files(paths, processes=processes, chunksize=3))
+
+    assert [r.path for r in results] == paths
+    invalid = {pathlib.Path(r.path).name for r in results if not r.ok}
+    assert invalid == EXPECTED_INVALID
+    assert all(r.error for r in results if not r.ok)
+    assert all(r.bytes > 0 for r in results)
+
+
+def test_unreadable_and_unknown_files(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    (tmp_path / "other.json").write_text('{"format": "x"}', encoding="utf-8")
+    paths = [str(tmp_path / n) for n in ("broken.json", "missing.json", "other.json")]
+
+    results = list(validate_files(paths, processes=0))
+    assert [r.ok for r in results] == [False, False, False]
+    assert results[0].error.startswith("json_decode_error")
+    assert results[1].error.startswith("read_error")
+    assert results[2].error.startswith("unknown_schema")
+
+
+def test_forced_schema_name() -> None:
+    path = str(EXAMPLES_DIR / "Vec_Z2_mfusion.json")
+    (result,) = validate_files([path], schema="umtc_input.schema.json", processes=0)
+    assert not result.ok and result.schema == "umtc_input.schema.json"
+    (result,) = validate_files([path], schema="nope.schema.json", processes=0)
+    assert result.error.startswith("schema_error")
+
+
+def test_summary_counts() -> None:
+    summary = BatchSummary()
+    for result in validate_files(collect_paths(EXAMPLES_DIR), processes=0):
+        summary.add(result)
+    stats = summary.to_dict()
+    assert stats["invalid"] == len(EXPECTED_INVALID)
+    assert stats["files"] == stats["valid"] + stats["invalid"]
+    assert stats["files_per_second"] > 0
+
+
+def test_cli_validate_streams_jsonl(capsys: pytest.CaptureFixture[str]) -> None:
+    code = main(["validate", str(EXAMPLES_DIR), "--jobs", "0"])
+    captured = capsys.readouterr()
+    lines = [json.loads(line) for line in captured.out.splitlines()]
+
+    assert code == 1
+    assert {pathlib.Path(r["path"]).name for r in lines if not r["ok"]} == (
+        EXPECTED_INVALID
+    )
+    assert "[ac:validate] files=" in captured.err
+
+
+def test_cli_validate_exit_codes(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    good = str(EXAMPLES_DIR / "ising_umtc_input.json")
+    out = tmp_path / "results.jsonl"
+    assert main(["validate", good, "--jobs", "0", "--out", str(out)]) == 0
+    assert json.loads(out.read_text(encoding="utf-8"))["ok"] is True
+
+    assert main(["validate", str(tmp_path / "none-*.json")]) == 2
+    capsys.readouterr()
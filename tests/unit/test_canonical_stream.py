@@ -0,0 +1,71 @@
+import hashlib
+import io
+
+import pytest
+
+from anyon_condense.core.exceptions import CanonicalizationError
+from anyon_condense.core.utils import canonical_json_dump, canonical_json_stream
+
+PAYLOAD = {
+    "S": [[0.5, -0.5], [-0.0, 1e-300]],
+    "objects": ["1", "σ", "ψ"],
+    "twist": {"ψ": -1.0, "1": 1, "σ": "exp(2πi/16)"},
+    "misc": [None, True, False, 3, [], {}, 'a\n"b"'],
+    "empty": {},
+}
+
+
+def _expected(payload, **kwargs) -> bytes:
+    return canonical_json_dump(payload, **kwargs).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_stream_bytes_match_canonical_dump(chunk_size):
+    binary = io.BytesIO()
+    canonical_json_stream(PAYLOAD, binary, chunk_size=chunk_size)
+    assert binary.getvalue() == _expected(PAYLOAD)
+
+    text = io.StringIO()
+    canonical_json_stream(PAYLOAD, text, chunk_size=chunk_size)
+    assert text.getvalue() == canonical_json_dump(PAYLOAD)
+
+
+def test_stream_into_hash_object():
+    digest = hashlib.sha256()
+    canonical_json_stream(PAYLOAD, digest, chunk_size=5)
+    assert digest.hexdigest() == hashlib.sha256(_expected(PAYLOAD)).hexdigest()
+
+
+def test_stream_reorder_arrays_matches():
+    payload = {"a": [3, 1.5, -0.0, "s", None, True, 2], "b": [[2, 1], 3]}
+    out = io.StringIO()
+    canonical_json_stream(payload, out, reorder_arrays=True)
+    assert out.getvalue() == canonical_json_dump(payload, reorder_arrays=True)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"a": {"b": [1.0, float("nan")]}},
+        {"a": [{1: 2}]},
+        {"a": {"b": (1,)}},
+        # Several errors: the first in insertion order is reported, although
+        # the stream reaches "a" before "b".
+        {"b": float("nan"), "a": {1}},
+        {"z": [float("inf")], 1: "x", "a": (1,)},
+        {"m": {"y": [1, {2: 3}], "x": float("nan")}, "k": {"q": None, 0: 1}},
+    ],
+)
+def test_stream_errors_match_canonical_dump(payload):
+    with pytest.raises(CanonicalizationError) as expected:
+        canonical_json_dump(payload)
+    with pytest.raises(CanonicalizationError) as actual:
+        canonical_json_stream(payload, io.StringIO())
+    assert str(actual.value) == str(expected.value)
+
+
+def test_stream_rejects_non_dict_and_bad_sink():
+    with pytest.raises(CanonicalizationError):
+        canonical_json_stream([1, 2], io.StringIO())  # type: ignore[arg-type]
+    with pytest.raises(CanonicalizationError):
+        canonical_json_stream({"a": 1}, object())
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import cmath
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import (
+    FusionRing,
+    condensable_candidates_payload,
+    find_condensable_candidates,
+    iter_condensable_candidates,
+)
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def load(name):
+    return json.loads((EXAMPLES / name).read_text())
+
+
+def abelian_double(orders):
+    """Z(Vec_G) for abelian G = Π Z_n: anyons (g, χ), θ = χ(g)."""
+
+    pieces = [list(itertools.product(range(n), repeat=2)) for n in orders]
+    labels = list(itertools.product(*pieces))
+    index = {label: i for i, label in enumerate(labels)}
+
+    def add(x, y):
+        return tuple(
+            ((a + c) % n, (b + d) % n) for (a, b), (c, d), n in zip(x, y, orders)
+        )
+
+    triples = [
+        (index[x], index[y], index[add(x, y)], 1) for x in labels for y in labels
+    ]
+    dual = [
+        index[tuple(((-a) % n, (-b) % n) for (a, b), n in zip(x, orders))]
+        for x in labels
+    ]
+    twists = [
+        cmath.exp(2j * cmath.pi * sum(a * b / n for (a, b), n in zip(x, orders)))
+        for x in labels
+    ]
+    return FusionRing([str(x) for x in labels], triples, dual), twists
+
+
+def test_toric_code_has_two_lagrangian_algebras():
+    found = list(
+        condensable_candidates_payload(
+            load("umtc_output.min.json"), load("toric_umtc_input.min.json")
+        )
+    )
+    assert sorted(found, key=sorted) == [{"1": 1, "e": 1}, {"1": 1, "m": 1}]
+
+
+@pytest.mark.parametrize(
+    "orders, total, lagrangian",
+    [((2, 2), 15, 6), ((4,), 6, 3), ((3, 3), 24, 8), ((2, 2, 2), 170, 30)],
+)
+def test_abelian_doubles_match_isotropic_subgroup_counts(orders, total, lagrangian):
+    ring, twists = abelian_double(orders)
+    found = find_condensable_candidates(ring, twists)
+    assert len(found) == total
+    assert sum(candidate.lagrangian for candidate in found) == lagrangian
+    assert all(candidate.multiplicities[ring.unit] == 1 for candidate in found)
+
+
+def test_parallel_search_streams_the_same_candidates():
+    ring, twists = abelian_double((2, 2))
+    serial = find_condensable_candidates(ring, twists, include_trivial=True)
+    stream = iter_condensable_candidates(
+        ring, twists, include_trivial=True, parallel=True, max_workers=2
+    )
+    assert sorted(stream, key=lambda c: (c.dim, c.multiplicities)) == serial
+    assert serial[0].dim == 1.0
+
+
+def test_ising_has_no_nontrivial_candidates():
+    ring = FusionRing.from_payload(load("ising_umtc_input.json"))
+    twists = [1.0, -1.0, cmath.exp(1j * cmath.pi / 8)]
+    assert find_condensable_candidates(ring, twists) == []
+    with pytest.raises(ValueError, match="twists"):
+        find_condensable_candidates(ring, twists[:2])
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from anyon_condense.algorithms import (
+    CondensationEngine,
+    FiniteGroup,
+    drinfeld_center_payload,
+    verlinde_fusion_ring,
+)
+from anyon_condense.algorithms.condensed import (
+    clear_induction_cache,
+    factor_gram,
+    induction_cache_info,
+)
+from anyon_condense.core.consistency.modular import check_modular_relations
+from anyon_condense.core.io import load_umtc_input, write_umtc_output
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+S3 = [[1, 0, 2], [1, 2, 0]]
+KLEIN = [[1, 0, 2, 3], [0, 1, 3, 2]]
+S4 = [[1, 2, 3, 0], [1, 0, 2, 3]]
+
+
+def parent(group):
+    output = drinfeld_center_payload(group)
+    ring = verlinde_fusion_ring(output["S"], output["objects"])
+    fusion_input = {
+        "format": "ac-umtc",
+        "version": "0.1",
+        "encoding": "float",
+        "number_field": output["number_field"],
+        "category_type": "umtc",
+        "simple_objects": list(ring.labels),
+        "dual": {x: ring.labels[d] for x, d in zip(ring.labels, ring.dual)},
+        "fusion_rules": ring.fusion_rules(),
+    }
+    return output, fusion_input
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_induction_cache()
+    yield
+    clear_induction_cache()
+
+
+def assert_modular(phase):
+    report = check_modular_relations(
+        phase.S, phase.T, NumericPolicy(), check_unitary=True
+    )
+    assert report["status"] is True
+
+
+def test_toric_code_condenses_to_vacuum():
+    engine = CondensationEngine(*parent(FiniteGroup.cyclic(2)))
+    phase = engine.condense({"C0.0": 1, "C0.1": 1})
+    assert phase.labels == ("C0.0",)
+    assert np.allclose(phase.S, [[1.0]])
+    assert phase.global_dim == pytest.approx(1.0)
+    tables = engine.tables({"C0.0": 1, "C0.1": 1})
+    assert tables.modules == 2 and tables.local.tolist() == [True, False]
+    assert tables.restrict(1) == {"C1.0": 1, "C1.1": 1}
+    assert tables.induce("C1.1") == {1: 1}
+
+
+def test_klein_double_condenses_to_toric_code():
+    engine = CondensationEngine(*parent(FiniteGroup.from_permutations(KLEIN)))
+    phase = engine.condense({"C0.0": 1, "C0.1": 1})
+    assert len(phase.labels) == 4 and not phase.split
+    assert np.allclose(phase.qdim, 1.0)
+    assert phase.global_dim == pytest.approx(4.0)
+    assert sorted(np.round(phase.twist.real, 9)) == [-1, 1, 1, 1]
+    assert_modular(phase)
+
+
+def test_s3_double_condenses_to_rank_four_phase():
+    engine = CondensationEngine(*parent(FiniteGroup.from_permutations(S3)))
+    phase = engine.condense({"C0.0": 1, "C0.2": 1})
+    assert len(phase.labels) == 4
+    assert phase.global_dim == pytest.approx(36 / 9)
+    assert phase.ring is not None and phase.ring.unit == 0
+    assert_modular(phase)
+
+
+def test_tables_are_cached_by_content():
+    output, fusion_input = parent(FiniteGroup.from_permutations(S3))
+    algebra = {"C0.0": 1, "C0.2": 1}
+    CondensationEngine(output, fusion_input).condense(algebra)
+    first = induction_cache_info()
+    engine = CondensationEngine(dict(output), dict(fusion_input))
+    engine.condense(algebra)
+    engine.condense([1, 0, 1, 0, 0, 0, 0, 0])
+    info = induction_cache_info()
+    assert info["misses"] == first["misses"] == 1
+    assert info["hits"] == first["hits"] + 2
+
+
+def test_split_modules_are_flagged():
+    engine = CondensationEngine(*parent(FiniteGroup.from_permutations(S3)))
+    phase = engine.condense({"C0.0": 1, "C0.1": 1})
+    assert len(phase.labels) == 9 and phase.split
+    assert phase.ring is None
+    with pytest.raises(ValueError, match="split"):
+        engine.condensed_payloads({"C0.0": 1, "C0.1": 1})
+
+
+def test_condensed_payloads_round_trip(tmp_path):
+    engine = CondensationEngine(*parent(FiniteGroup.from_permutations(KLEIN)))
+    output, fusion_input = engine.condensed_payloads({"C0.0": 1, "C0.1": 1})
+    write_umtc_output(tmp_path / "out.json", output)
+    (tmp_path / "in.json").write_text(json.dumps(fusion_input))
+    loaded = load_umtc_input(tmp_path / "in.json")
+    assert loaded["simple_objects"] == output["objects"]
+    assert output["_meta"]["algebra"] == {"C0.0": 1, "C0.1": 1}
+
+
+def test_invalid_algebras_rejected():
+    engine = CondensationEngine(*parent(FiniteGroup.cyclic(2)))
+    with pytest.raises(ValueError):
+        engine.condense({"C0.1": 1})
+    with pytest.raises(ValueError):
+        engine.condense({"nope": 1, "C0.0": 1})
+
+
+def test_factor_gram():
+    W = factor_gram(np.array([[2, 1], [1, 1]]), [0, 1])
+    assert (W @ W.T).tolist() == [[2, 1], [1, 1]]
+    with pytest.raises(ValueError):
+        factor_gram(np.array([[1, 2], [2, 1]]), [0, 1])
+
+
+def test_module_search_is_bounded():
+    # A find_condensable_candidates result for Z(Vec_S4) whose free-module
+    # Gram matrix used to send the decomposition search off for minutes.
+    engine = CondensationEngine(*parent(FiniteGroup.from_permutations(S4)))
+    algebra = {"C0.0": 1, "C0.2": 1, "C0.3": 1, "C0.4": 1}
+    algebra.update({"C3.0": 1, "C3.1": 1, "C3.2": 1, "C3.3": 2})
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="node limit"):
+        engine.condense(algebra)
+    assert time.perf_counter() - start < 60
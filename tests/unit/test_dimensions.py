@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import FusionRing, fill_dimensions, quantum_dimensions
+from anyon_condense.core.io import load_umtc_input, write_umtc_output
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def su2_level(k: int) -> FusionRing:
+    labels = [str(j) for j in range(k + 1)]
+    triples = [
+        (a, b, c, 1)
+        for a in range(k + 1)
+        for b in range(k + 1)
+        for c in range(abs(a - b), min(a + b, 2 * k - a - b) + 1, 2)
+    ]
+    return FusionRing(labels, triples, list(range(k + 1)))
+
+
+@pytest.mark.parametrize("engine", ["auto", "power", "eig"])
+def test_ising_dimensions(engine):
+    ring = FusionRing.from_payload(load_umtc_input(EXAMPLES / "ising_umtc_input.json"))
+    dims = quantum_dimensions(ring, engine=engine)
+    assert dims.as_dict() == pytest.approx(
+        {"1": 1.0, "psi": 1.0, "sigma": math.sqrt(2)}
+    )
+    assert dims.global_dim == pytest.approx(4.0, rel=1e-14)
+    assert dims.qdim[ring.unit] == 1.0
+
+
+def test_su2_level_k_matches_closed_form():
+    k = 60
+    dims = quantum_dimensions(su2_level(k), engine="power")
+    q = math.pi / (k + 2)
+    exact = np.array([math.sin((j + 1) * q) / math.sin(q) for j in range(k + 1)])
+    assert np.allclose(dims.qdim, exact, rtol=1e-12, atol=0)
+    assert dims.global_dim == pytest.approx((k + 2) / (2 * math.sin(q) ** 2), rel=1e-12)
+    d = dims.qdim
+    ring = su2_level(k)
+    assert np.allclose(np.outer(d, d), np.einsum("abc,c->ab", ring.N, d))
+
+
+def test_large_abelian_ring_uses_power_iteration():
+    n = 600
+    triples = [(a, b, (a + b) % n, 1) for a in range(n) for b in range(n)]
+    ring = FusionRing(
+        [f"g{a}" for a in range(n)], triples, [(-a) % n for a in range(n)]
+    )
+    dims = quantum_dimensions(ring)
+    assert dims.engine == "power" and dims.iterations <= 3
+    assert np.array_equal(dims.qdim, np.ones(n)) and dims.global_dim == n
+
+
+def test_fill_dimensions_writes_valid_output(tmp_path):
+    payload = json.loads((EXAMPLES / "umtc_output.min.json").read_text())
+    ising = load_umtc_input(EXAMPLES / "ising_umtc_input.json")
+    ring = FusionRing.from_payload(ising)
+    del payload["qdim"], payload["global_dim"], payload["objects"]
+    fill_dimensions(payload, ring)
+    assert payload["objects"] == ["1", "psi", "sigma"]
+    write_umtc_output(tmp_path / "out.json", payload)
+    written = json.loads((tmp_path / "out.json").read_text())
+    assert written["qdim"]["sigma"] == pytest.approx(math.sqrt(2))
+
+
+def test_errors():
+    ring = FusionRing(["x", "y"], [(0, 0, 1, 1), (1, 1, 0, 1)], [0, 1])
+    with pytest.raises(ValueError, match="unit"):
+        quantum_dimensions(ring)
+    fib = FusionRing(
+        ["1", "t"],
+        [(0, 0, 0, 1), (0, 1, 1, 1), (1, 0, 1, 1), (1, 1, 0, 1), (1, 1, 1, 1)],
+        [0, 1],
+    )
+    with pytest.raises(ValueError, match="engine"):
+        quantum_dimensions(fib, engine="lanczos")
+    with pytest.raises(ValueError, match="did not converge"):
+        quantum_dimensions(fib, engine="power", max_iter=2)
+    assert quantum_dimensions(fib, max_iter=2).engine == "eig"
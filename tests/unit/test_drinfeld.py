@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import (
+    FiniteGroup,
+    FusionRing,
+    check_verlinde,
+    drinfeld_center,
+    drinfeld_center_payload,
+    find_condensable_candidates,
+    write_drinfeld_center,
+)
+from anyon_condense.core.consistency.modular import check_modular_relations
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+S3 = [[1, 0, 2], [1, 2, 0]]
+D8 = [[1, 2, 3, 0], [3, 2, 1, 0]]
+S5 = [[1, 0, 2, 3, 4], [1, 2, 3, 4, 0]]
+
+
+def verlinde_ring(center):
+    S = center.S
+    N = np.einsum("ax,bx,cx->abc", S, S, S.conj() / S[0]).real
+    counts = np.rint(N).astype(int)
+    assert np.abs(N - counts).max() < 1e-9
+    n = len(center.labels)
+    triples = [(a, b, c, int(counts[a, b, c])) for a, b, c in zip(*np.nonzero(counts))]
+    dual = [int(np.flatnonzero(counts[a, :, 0])[0]) for a in range(n)]
+    return FusionRing(center.labels, triples, dual)
+
+
+def test_permutation_group_closure_and_classes():
+    group = FiniteGroup.from_permutations(S3)
+    assert group.order == 6 and not group.is_abelian
+    assert group.exponent == 6
+    _, reps, sizes = group.classes()
+    assert reps[0] == group.identity
+    assert sorted(sizes.tolist()) == [1, 2, 3]
+    assert FiniteGroup.cyclic(12).is_abelian
+
+
+def test_invalid_table_rejected():
+    with pytest.raises(ValueError):
+        FiniteGroup([[0, 1], [0, 1]])
+
+
+def test_z2_matches_toric_code_example():
+    expected = json.loads((EXAMPLES / "umtc_output.min.json").read_text())
+    payload = drinfeld_center_payload(FiniteGroup.cyclic(2))
+    assert np.allclose(payload["S"], expected["S"])
+    assert list(payload["twist"].values()) == [1.0, 1.0, 1.0, -1.0]
+    assert payload["global_dim"] == expected["global_dim"]
+    assert payload["number_field"] == "cyclotomic(2)"
+
+
+@pytest.mark.parametrize(
+    "generators, rank",
+    [(S3, 8), (D8, 22), (S5, 39)],
+)
+def test_modular_data_of_nonabelian_doubles(generators, rank):
+    group = FiniteGroup.from_permutations(generators)
+    center = drinfeld_center(group)
+    assert len(center.labels) == rank
+    assert center.labels[0] == "C0.0"
+    assert np.isclose((center.qdim**2).sum(), group.order**2)
+    assert np.allclose(center.S[0], center.qdim / group.order)
+    report = check_modular_relations(
+        center.S, np.diag(center.twist), NumericPolicy(), check_unitary=True
+    )
+    assert report["status"] is True
+
+
+def test_s3_dimensions_twists_and_condensable_algebras():
+    center = drinfeld_center(FiniteGroup.from_permutations(S3))
+    assert center.qdim.tolist() == [1, 1, 2, 3, 3, 2, 2, 2]
+    assert sorted(np.round(np.angle(center.twist) / (2 * np.pi), 9) % 1) == [
+        0,
+        0,
+        0,
+        0,
+        0,
+        pytest.approx(1 / 3),
+        0.5,
+        pytest.approx(2 / 3),
+    ]
+    ring = verlinde_ring(center)
+    lagrangian = [
+        cand
+        for cand in find_condensable_candidates(
+            ring,
+            center.twist.tolist(),
+            qdim=center.qdim.tolist(),
+            global_dim=center.global_dim,
+        )
+        if cand.lagrangian
+    ]
+    assert len(lagrangian) == 4  # subgroups of S3 up to conjugacy
+
+
+def test_abelian_fast_path_agrees_with_verlinde():
+    center = drinfeld_center(FiniteGroup.cyclic(6))
+    assert len(center.labels) == 36
+    ring = verlinde_ring(center)
+    report = check_verlinde(center.S, ring, NumericPolicy())
+    assert report["status"] is True
+    assert ring.multiplicity_free
+
+
+def test_write_through_umtc_output(tmp_path):
+    target = tmp_path / "z_s3.json"
+    group = FiniteGroup.from_permutations(S3)
+    write_drinfeld_center(target, group, sources=["S3 permutations"])
+    written = json.loads(target.read_text())
+    assert written["objects"][0] == "C0.0"
+    assert written["number_field"] == "cyclotomic(6)"
+    assert written["provenance"]["sources"] == ["S3 permutations"]
+    assert written["hashes"]
+    twist = written["twist"]["C2.1"]
+    assert isinstance(twist, str) and complex(twist) == pytest.approx(
+        complex(-0.5, 3**0.5 / 2)
+    )
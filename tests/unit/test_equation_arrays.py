@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import array
+import random
+
+import pytest
+
+from anyon_condense.core.consistency.hexagon import (
+    check_hexagon_arrays,
+    check_hexagon_equations,
+)
+from anyon_condense.core.consistency.numcheck import EquationTally
+from anyon_condense.core.consistency.pentagon import (
+    check_pentagon_arrays,
+    check_pentagon_equations,
+)
+from anyon_condense.core.exceptions import NumericFieldError
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+
+def _pairs(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    lhs, rhs = [], []
+    for _ in range(n):
+        z = complex(rng.uniform(-2, 2), rng.uniform(-2, 2))
+        kind = rng.random()
+        if kind < 0.6:
+            w = z + complex(rng.uniform(-1e-12, 1e-12), 0.0)
+        elif kind < 0.8:
+            w = z + complex(0.0, rng.uniform(-1e-3, 1e-3))
+        else:
+            w = z + rng.uniform(-0.5, 0.5)
+        lhs.append(z)
+        rhs.append(w)
+    return lhs, rhs
+
+
+@pytest.mark.parametrize(
+    "arrays_fn, tuple_fn",
+    [
+        (check_pentagon_arrays, check_pentagon_equations),
+        (check_hexagon_arrays, check_hexagon_equations),
+    ],
+)
+def test_array_checks_match_tuple_checks(arrays_fn, tuple_fn):
+    policy = NumericPolicy(tol_abs=1e-10, tol_rel=1e-9)
+    lhs, rhs = _pairs(2000)
+    ref = tuple_fn(list(zip(lhs, rhs)), policy)
+
+    out = arrays_fn(np.array(lhs), np.array(rhs), policy, chunk_size=333)
+    assert (out["status"], out["failed"], out["total"]) == (
+        ref["status"],
+        ref["failed"],
+        ref["total"],
+    )
+    err = np.abs(np.array(lhs) - np.array(rhs))
+    assert out["max_abs_err"] == pytest.approx(float(err.max()))
+
+
+def test_worst_indices_are_largest_failures_across_chunks():
+    policy = NumericPolicy(tol_abs=1e-10, tol_rel=1e-9)
+    lhs = np.zeros(1000, dtype=complex)
+    rhs = np.zeros(1000, dtype=complex)
+    rhs[[3, 250, 640, 999]] = [0.1, 0.4, 0.3j, 0.2]
+
+    out = check_pentagon_arrays(lhs, rhs, policy, worst=3, chunk_size=128)
+    assert out["failed"] == 4
+    assert out["worst_indices"] == [250, 640, 999]
+    assert out["max_abs_err"] == pytest.approx(0.4)
+
+    chunked = check_pentagon_arrays(lhs, rhs, policy, worst=3, chunk_size=10**6)
+    assert chunked == out
+
+
+def test_buffers_and_empty_input():
+    policy = NumericPolicy()
+    lhs = array.array("d", [1.0, 2.0, 3.0])
+    rhs = memoryview(array.array("d", [1.0, 2.0, 3.5]))
+    out = check_hexagon_arrays(lhs, rhs, policy)
+    assert out["failed"] == 1 and out["worst_indices"] == [2]
+
+    empty = check_hexagon_arrays([], [], policy)
+    assert empty == {
+        "status": True,
+        "failed": 0,
+        "total": 0,
+        "max_abs_err": 0.0,
+        "worst_indices": [],
+    }
+
+
+def test_tally_rejects_bad_input():
+    policy = NumericPolicy()
+    tally = EquationTally(policy)
+    with pytest.raises(ValueError):
+        tally.add(np.zeros(3), np.zeros(4))
+    with pytest.raises(NumericFieldError):
+        check_pentagon_arrays(np.array([np.nan]), np.array([0.0]), policy)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import FusionRing
+from anyon_condense.core.io import load_mfusion_input, load_umtc_input
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def test_ring_from_loaded_mfusion_payload():
+    ring = FusionRing.from_payload(load_mfusion_input(EXAMPLES / "rep_d8_mfusion.json"))
+    assert ring.rank == 5 and ring.labels[0] == "1" and ring.unit == 0
+    assert ring.N.dtype == np.int32 and ring.N.shape == (5, 5, 5)
+    assert ring.multiplicity_free and ring.nnz == 25
+    b, c, d = (ring.index[x] for x in "bcd")
+    assert ring.channels(b, c) == {d: 1}
+    assert ring.dual.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_dense_and_csr_agree_with_payload():
+    payload = load_umtc_input(EXAMPLES / "ising_umtc_input.json")
+    ring = FusionRing.from_payload(payload)
+    for key, products in payload["fusion_rules"].items():
+        a, b = (ring.index[x] for x in key[1:-1].split(","))
+        expected = {ring.index[c]: m for c, m in products.items()}
+        assert ring.channels(a, b) == expected
+        assert {int(c): int(ring.N[a, b, c]) for c in np.flatnonzero(ring.N[a, b])} == (
+            expected
+        )
+    a, b, c, m = ring.triples()
+    assert (ring.N[a, b, c] == m).all() and int(ring.N.sum()) == int(m.sum())
+
+
+def test_fuse_is_array_product():
+    payload = load_umtc_input(EXAMPLES / "ising_umtc_input.json")
+    ring = FusionRing.from_payload(payload)
+    one, psi, sigma = (ring.basis(ring.index[x]) for x in ("1", "psi", "sigma"))
+    assert ring.fuse(sigma, sigma).tolist() == (one + psi).tolist()
+    assert ring.fuse(sigma, sigma + psi).tolist() == (one + psi + sigma).tolist()
+    assert ring.fuse(2 * psi, psi).tolist() == (2 * one).tolist()
+    x = np.array([0.5, 0.0, 1.0])
+    assert np.allclose(ring.fuse(x, x), np.einsum("a,b,abc->c", x, x, ring.N))
+    assert np.array_equal(ring.fusion_matrix(ring.index["sigma"]), ring.N[2])
+
+
+def test_invalid_rings_are_rejected():
+    payload = load_mfusion_input(EXAMPLES / "Vec_Z2_mfusion.json")
+    bad_dual = dict(payload, dual={"1": "1", "g": "1"})
+    with pytest.raises(ValueError, match="permutation"):
+        FusionRing.from_payload(bad_dual)
+    bad_label = dict(payload, fusion_rules={"(g,h)": {"1": 1}})
+    with pytest.raises(ValueError, match="Unknown label 'h'"):
+        FusionRing.from_payload(bad_label)
+    no_unit = FusionRing(["x", "y"], [(0, 0, 1, 1), (1, 1, 0, 1)], [0, 1])
+    assert no_unit.unit is None
+    assert no_unit.N.tolist() == [[[0, 1], [0, 0]], [[0, 0], [1, 0]]]
@@ -57,3 +57,22 @@ def test_content_address_unsupported_type():
 
     with pytest.raises(HashingError):
         content_address(X(), "custom")
+
+
+def test_streamed_digests_match_canonical_dump_bytes():
+    import hashlib
+
+    from anyon_condense.core.hashing import hash_json_value
+    from anyon_condense.core.utils import canonical_json_dump
+
+    def reference(payload):
+        data = canonical_json_dump(payload).encode("utf-8")
+        return "sha256:" + hashlib.sha256(data).hexdigest()
+
+    rows = [[0.5 * i - j for j in range(300)] for i in range(300)]
+    payload = {"S": rows, "objects": ["1", "σ"], "twist": {"σ": -0.0}}
+    assert sha256_of_payload(payload) == reference(payload)
+    assert hash_json_value(rows) == reference({"_": rows})
+    assert hash_matrix(rows) == reference({"matrix": rows})
+    assert hash_matrix(tuple(tuple(r) for r in rows)) == hash_matrix(rows)
+    assert content_address(payload, "umtc") == "umtc:" + reference(payload)
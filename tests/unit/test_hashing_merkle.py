@@ -0,0 +1,88 @@
+import copy
+
+import pytest
+
+from anyon_condense.core.exceptions import HashingError
+from anyon_condense.core.hashing import (
+    MERKLE_PREFIX,
+    MerkleTree,
+    attach_hashes_inplace,
+    hash_json_value,
+    merkle_root_of_payload,
+    sha256_of_payload,
+)
+
+
+def _payload(n: int = 6) -> dict:
+    return {
+        "objects": [str(i) for i in range(n)],
+        "qdim": {str(i): 1.0 for i in range(n)},
+        "global_dim": float(n),
+        "S": [[(i * j) % 3 - 1.0 for j in range(n)] for i in range(n)],
+        "T": [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)],
+        "meta": {"nested": [{"a": 1}, {"b": [1, 2]}]},
+    }
+
+
+def test_root_is_separate_scheme_and_key_order_independent():
+    a = _payload()
+    b = dict(reversed(list(copy.deepcopy(a).items())))
+    root = merkle_root_of_payload(a)
+    assert root.startswith(MERKLE_PREFIX)
+    assert root == merkle_root_of_payload(b)
+    assert root.split(":", 1)[1] != sha256_of_payload(a).split(":", 1)[1]
+
+
+def test_leaf_digest_matches_flat_value_hash():
+    tree = MerkleTree(_payload())
+    row = tree.digest(("S", 2))
+    assert (
+        row.split(":", 1)[1] == hash_json_value(tree.payload["S"][2]).split(":", 1)[1]
+    )
+
+
+def test_set_rehashes_only_the_path_and_matches_fresh_tree():
+    tree = MerkleTree(_payload())
+    before = tree.root()
+    hashed = tree.nodes_hashed
+
+    after = tree.set(("S", 3, 4), 0.25)
+    assert after != before
+    assert tree.nodes_hashed - hashed == 3  # row leaf, S, root
+    assert after == MerkleTree(copy.deepcopy(tree.payload)).root()
+
+
+def test_invalidate_after_in_place_edits():
+    tree = MerkleTree(_payload())
+    tree.root()
+
+    tree.payload["meta"]["nested"][1]["b"].append(3)
+    tree.invalidate(("meta", "nested", 1, "b"))
+    assert tree.root() == merkle_root_of_payload(copy.deepcopy(tree.payload))
+
+    tree.payload["extra"] = {"x": [1]}
+    tree.invalidate(("extra",))
+    del tree.payload["T"]
+    tree.invalidate(("T",))
+    assert tree.root() == merkle_root_of_payload(copy.deepcopy(tree.payload))
+
+
+def test_attach_hashes_from_tree():
+    payload = _payload()
+    tree = MerkleTree(payload)
+    hashes = attach_hashes_inplace(payload, tree=tree)
+    assert hashes["S"] == tree.digest(("S",))
+    assert all(value.startswith(MERKLE_PREFIX) for value in hashes.values())
+    assert tree.root() == merkle_root_of_payload(copy.deepcopy(payload))
+
+    with pytest.raises(HashingError):
+        attach_hashes_inplace(_payload(), tree=tree)
+
+
+def test_merkle_rejects_bad_input():
+    with pytest.raises(HashingError):
+        MerkleTree([1, 2])  # type: ignore[arg-type]
+    with pytest.raises(HashingError):
+        merkle_root_of_payload({"x": [float("nan")]})
+    with pytest.raises(HashingError):
+        MerkleTree({"x": {1: 2}})
@@ -0,0 +1,98 @@
+import copy
+import json
+import math
+import pathlib
+
+import pytest
+
+from anyon_condense.core import jsoncodec
+from anyon_condense.core.io import load_umtc_input, write_umtc_output
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+EXAMPLES_DIR = ROOT / "tests" / "examples"
+
+CODECS = jsoncodec.available_codecs()
+
+
+@pytest.fixture(params=CODECS)
+def codec(request: pytest.FixtureRequest):
+    yield jsoncodec.set_codec(request.param)
+    jsoncodec.set_codec()
+
+
+def test_stdlib_is_always_available() -> None:
+    assert CODECS[-1] == "stdlib"
+    with pytest.raises(ValueError):
+        jsoncodec.set_codec("simdjson-not-installed")
+
+
+def test_env_selects_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AC_JSON_BACKEND", "stdlib")
+    try:
+        assert jsoncodec.set_codec().name == "stdlib"
+    finally:
+        monkeypatch.delenv("AC_JSON_BACKEND")
+        jsoncodec.set_codec()
+
+
+@pytest.mark.parametrize("path", sorted(EXAMPLES_DIR.glob("*.json")))
+def test_examples_decode_like_stdlib(codec, path: pathlib.Path) -> None:
+    data = path.read_bytes()
+    expected = json.loads(data.decode("utf-8"))
+    assert codec.loads(data) == expected
+    assert codec.loads(codec.dumps(expected, indent=True)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["123456789012345678901234567890", "[-9223372036854775809, 1.5]", '{"a": NaN}'],
+)
+def test_edge_cases_decode_like_stdlib(codec, text: str) -> None:
+    expected = json.loads(text)
+    assert repr(codec.loads(text.encode("utf-8"))) == repr(expected)
+
+
+def test_large_ints_stay_ints(codec) -> None:
+    value = codec.loads(str(2**70).encode())
+    assert value == 2**70 and isinstance(value, int)
+
+
+def test_encode_edge_cases(codec) -> None:
+    assert json.loads(codec.dumps({1: "x"})) == {"1": "x"}
+    assert json.loads(codec.dumps([2**70])) == [2**70]
+    assert b"NaN" in codec.dumps([math.nan, None])
+    assert codec.dumps({"b": 1, "a": "τ"}, sort_keys=True) == json.dumps(
+        {"a": "τ", "b": 1}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_decode_errors_are_stdlib_errors(codec) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{")
+
+
+def test_io_roundtrip_is_codec_independent(tmp_path: pathlib.Path) -> None:
+    payload = json.loads(
+        (EXAMPLES_DIR / "umtc_output.min.json").read_text(encoding="utf-8")
+    )
+    written = {}
+    for name in CODECS:
+        jsoncodec.set_codec(name)
+        try:
+            for indent in (True, False):
+                path = tmp_path / f"{name}-{indent}.json"
+                write_umtc_output(path, copy.deepcopy(payload), indent=indent)
+                written[name, indent] = json.loads(path.read_text(encoding="utf-8"))
+        finally:
+            jsoncodec.set_codec()
+    first = next(iter(written.values()))
+    for doc in written.values():
+        doc["provenance"].pop("date")
+    assert all(doc == first for doc in written.values())
+
+
+def test_loader_reads_bytes_with_active_codec(codec) -> None:
+    doc = load_umtc_input(EXAMPLES_DIR / "ising_umtc_input.json")
+    assert doc == json.loads(
+        (EXAMPLES_DIR / "ising_umtc_input.json").read_text(encoding="utf-8")
+    )
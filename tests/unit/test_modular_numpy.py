@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import cmath
+import math
+import random
+
+import pytest
+
+from anyon_condense.core.consistency.modular import check_modular_relations
+from anyon_condense.core.consistency.numcheck import (
+    approx_equal_mask,
+    approx_equal_number,
+)
+from anyon_condense.core.exceptions import NumericFieldError
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+
+def toric_st():
+    s = [
+        [0.5, 0.5, 0.5, 0.5],
+        [0.5, 0.5, -0.5, -0.5],
+        [0.5, -0.5, 0.5, -0.5],
+        [0.5, -0.5, -0.5, 0.5],
+    ]
+    t = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+    t[3][3] = -1.0
+    return s, t
+
+
+def zn_st(n: int):
+    """Z_n anyons (n odd) with theta_a = exp(2 pi i a^2 / n)."""
+
+    s = [
+        [cmath.exp(-4j * math.pi * a * b / n) / math.sqrt(n) for b in range(n)]
+        for a in range(n)
+    ]
+    t = [
+        [cmath.exp(2j * math.pi * a * a / n) if a == b else 0 for b in range(n)]
+        for a in range(n)
+    ]
+    return s, t
+
+
+def _assert_same_report(s, t, policy):
+    python = check_modular_relations(s, t, policy, engine="python")
+    vectorized = check_modular_relations(s, t, policy, engine="numpy")
+    assert vectorized["status"] is python["status"]
+    assert vectorized["policy_snapshot"] == python["policy_snapshot"]
+    assert vectorized["metrics"].keys() == python["metrics"].keys()
+    for key, value in python["metrics"].items():
+        assert vectorized["metrics"][key] == pytest.approx(value, rel=1e-6, abs=1e-13)
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 1e-12, 1e-6])
+def test_numpy_engine_matches_python_on_toric(epsilon):
+    s, t = toric_st()
+    noisy = [
+        [v + (epsilon if (i + j) % 2 else -epsilon) for j, v in enumerate(row)]
+        for i, row in enumerate(s)
+    ]
+    _assert_same_report(noisy, t, NumericPolicy())
+
+
+def test_numpy_engine_matches_python_on_complex_and_strings():
+    s, t = zn_st(9)
+    _assert_same_report(s, t, NumericPolicy(tol_abs=1e-9, tol_rel=1e-9))
+    s_text = [[str(v) for v in row] for row in s]
+    _assert_same_report(s_text, t, NumericPolicy(tol_abs=1e-9, tol_rel=1e-9))
+
+
+def test_numpy_engine_passes_for_larger_rank():
+    s, t = zn_st(41)
+    report = check_modular_relations(s, t, NumericPolicy(tol_abs=1e-9, tol_rel=1e-9))
+    assert report["status"] is True
+    assert report["metrics"]["max_err_s4_i"] < 1e-9
+
+
+def test_approx_equal_mask_matches_scalar_path():
+    rng = random.Random(3)
+    policy = NumericPolicy(tol_abs=1e-10, tol_rel=1e-8, precision=6)
+    a = [
+        complex(rng.uniform(-1, 1), rng.choice([0.0, 1e-8, rng.uniform(-1, 1)]))
+        for _ in range(500)
+    ]
+    b = [x + complex(rng.choice([0.0, 1e-11, 1e-9, 1e-6]), 0.0) for x in a]
+    mask = approx_equal_mask(np.array(a), np.array(b), policy)
+    assert mask.tolist() == [approx_equal_number(x, y, policy) for x, y in zip(a, b)]
+
+    with pytest.raises(NumericFieldError):
+        approx_equal_mask(np.array([math.nan]), np.array([0.0]), policy)
+
+
+def test_unknown_engine_rejected():
+    s, t = toric_st()
+    with pytest.raises(ValueError):
+        check_modular_relations(s, t, NumericPolicy(), engine="gpu")
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+
+from anyon_condense.core.consistency.modular import (
+    _is_diagonal,
+    _matmul,
+    _times_diagonal,
+    check_modular_relations,
+)
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+
+def toric_st():
+    s = [
+        [0.5, 0.5, 0.5, 0.5],
+        [0.5, 0.5, -0.5, -0.5],
+        [0.5, -0.5, 0.5, -0.5],
+        [0.5, -0.5, -0.5, 0.5],
+    ]
+    t = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+    t[3][3] = -1.0
+    return s, t
+
+
+def _engine_or_skip(engine: str) -> str:
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    return engine
+
+
+def test_diagonal_scaling_equals_dense_product():
+    s, t = toric_st()
+    s_c = [[complex(v) for v in row] for row in s]
+    t_c = [[complex(v) for v in row] for row in t]
+    assert _is_diagonal(t_c)
+    assert not _is_diagonal(s_c)
+    diag = [t_c[i][i] for i in range(4)]
+    assert _times_diagonal(s_c, diag) == _matmul(s_c, t_c)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_unitary_precheck_passes_and_adds_metric(engine):
+    s, t = toric_st()
+    report = check_modular_relations(
+        s, t, NumericPolicy(), engine=_engine_or_skip(engine), check_unitary=True
+    )
+    assert report["status"] is True
+    assert set(report["metrics"]) == {
+        "max_err_ssdag_i",
+        "max_err_st3_s2",
+        "max_err_s4_i",
+    }
+    assert "notes" not in report
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_unitary_precheck_exits_early(engine):
+    s, t = toric_st()
+    scaled = [[2.0 * v for v in row] for row in s]
+    report = check_modular_relations(
+        scaled, t, NumericPolicy(), engine=_engine_or_skip(engine), check_unitary=True
+    )
+    assert report["status"] is False
+    assert set(report["metrics"]) == {"max_err_ssdag_i"}
+    assert report["metrics"]["max_err_ssdag_i"] == pytest.approx(3.0)
+    assert "unitary" in report["notes"]
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_non_diagonal_t_uses_dense_product(engine):
+    s, _ = toric_st()
+    swap = [
+        [0.0, 1.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+    report = check_modular_relations(
+        s, swap, NumericPolicy(), engine=_engine_or_skip(engine)
+    )
+    baseline = check_modular_relations(s, swap, NumericPolicy(), engine="python")
+    assert report["status"] is baseline["status"] is False
+    assert report["metrics"]["max_err_st3_s2"] == pytest.approx(
+        baseline["metrics"]["max_err_st3_s2"]
+    )
+
+
+def test_modular_data_needs_two_products(monkeypatch):
+    import anyon_condense.core.consistency.modular as modular
+
+    calls = []
+    real = modular._matmul
+
+    def spy(a, b):
+        calls.append(len(a))
+        return real(a, b)
+
+    monkeypatch.setattr(modular, "_matmul", spy)
+    s, t = toric_st()
+    report = check_modular_relations(s, t, NumericPolicy(), engine="python")
+    assert report["status"] is True
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_reduced_identities_track_dense_residuals(engine):
+    s, t = toric_st()
+    noisy = [
+        [v + (1e-6 if (i + j) % 2 else -1e-6) for j, v in enumerate(row)]
+        for i, row in enumerate(s)
+    ]
+    report = check_modular_relations(
+        noisy, t, NumericPolicy(), engine=_engine_or_skip(engine)
+    )
+    s_c = [[complex(v) for v in row] for row in noisy]
+    st = _matmul(s_c, [[complex(v) for v in row] for row in t])
+    s2 = _matmul(s_c, s_c)
+    dense_st3 = max(
+        abs(x - y)
+        for r1, r2 in zip(_matmul(_matmul(st, st), st), s2)
+        for x, y in zip(r1, r2)
+    )
+    dense_s4 = max(
+        abs(x - (1.0 if i == j else 0.0))
+        for i, row in enumerate(_matmul(s2, s2))
+        for j, x in enumerate(row)
+    )
+    metrics = report["metrics"]
+    assert report["status"] is False
+    assert metrics["max_err_s4_i"] == pytest.approx(dense_s4, rel=1e-3)
+    assert 0.25 * dense_st3 <= metrics["max_err_st3_s2"] <= 4.0 * dense_st3
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_s_squared_not_a_permutation_falls_back(engine):
+    # S = diag(i, i): S^2 = -I is no permutation, S^4 = I still holds.
+    s = [[1j, 0], [0, 1j]]
+    t = [[1, 0], [0, 1]]
+    report = check_modular_relations(
+        s, t, NumericPolicy(), engine=_engine_or_skip(engine)
+    )
+    assert report["metrics"]["max_err_s4_i"] == pytest.approx(0.0)
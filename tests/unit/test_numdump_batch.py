@@ -0,0 +1,91 @@
+import math
+import random
+import struct
+import warnings
+
+import pytest
+
+from anyon_condense.core.exceptions import NumericFieldError
+from anyon_condense.core.numdump import normalize_payload_numbers
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+
+def _bits(values):
+    return [struct.pack("<d", v) if isinstance(v, float) else v for v in values]
+
+
+def _sample_floats(count: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    special = [0.0, -0.0, 1.0, -1.0, 0.5, 2**-0.5, 1e-4, 1e6, 0.125, 2.5, 1e22]
+    values: list[float] = []
+    for _ in range(count):
+        pick = rng.random()
+        if pick < 0.3:
+            values.append(rng.uniform(-1.0, 1.0))
+        elif pick < 0.5:
+            values.append(rng.choice(special))
+        elif pick < 0.75:
+            values.append(math.copysign(10 ** rng.uniform(-18, 21), pick - 0.6))
+        else:
+            values.append(round(rng.uniform(-100, 100), rng.randint(0, 6)))
+    return values
+
+
+@pytest.mark.parametrize("fmt", ["auto", "fixed", "scientific"])
+@pytest.mark.parametrize("precision", [1, 3, 6, 12])
+@pytest.mark.parametrize("round_half", ["even", "away"])
+def test_numpy_engine_bit_identical_to_decimal(fmt, precision, round_half):
+    policy = NumericPolicy(fmt=fmt, precision=precision, round_half=round_half)
+    values = [v for v in _sample_floats(2000) if fmt != "fixed" or abs(v) < 1e6]
+    payload = {"v": values}
+
+    expected = normalize_payload_numbers(payload, policy, engine="decimal")
+    actual = normalize_payload_numbers(payload, policy, engine="numpy")
+    assert _bits(actual["v"]) == _bits(expected["v"])
+
+
+def test_numpy_engine_preserves_structure_and_reorder():
+    policy = NumericPolicy(fmt="fixed", precision=2, array_reorder=True)
+    payload = {
+        "S": [[0.70710678, -0.70710678], [-0.0, 1.0]],
+        "twist": {"a": 1.0, "b": -1.00001},
+        "nums": (3.14159, -2.5, 1e-9),
+        "label": "x",
+        "n": 3,
+    }
+    expected = normalize_payload_numbers(payload, policy, engine="decimal")
+    actual = normalize_payload_numbers(payload, policy, engine="numpy")
+    assert actual == expected
+    assert isinstance(actual["nums"], tuple)
+    assert math.copysign(1.0, actual["S"][1][0]) == 1.0
+
+
+def test_numpy_engine_errors_match_decimal_path():
+    policy = NumericPolicy()
+    payload = {"v": [0.5] * 100 + [math.nan]}
+    with pytest.raises(NumericFieldError):
+        normalize_payload_numbers(payload, policy, engine="numpy")
+
+
+@pytest.mark.parametrize("fmt", ["auto", "fixed", "scientific"])
+def test_numpy_engine_is_silent_on_huge_magnitudes(fmt):
+    policy = NumericPolicy(fmt=fmt, precision=12)
+    payload = {"v": [1e300, -1.7e308, 1e200, 1e-300, 0.5] * 20}
+
+    def run(engine):
+        try:
+            return normalize_payload_numbers(payload, policy, engine=engine)
+        except ArithmeticError as exc:  # fixed: too wide for Decimal
+            return type(exc)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        actual = run("numpy")
+    assert actual == run("decimal")
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        normalize_payload_numbers({"x": 1.0}, NumericPolicy(), engine="fast")
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.core.exceptions import PipelineError
+from anyon_condense.pipelines import Pipeline, Stage, StageCache, umtc_pipeline
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+calls: list = []
+
+
+def source(policy, *, value):
+    calls.append("a")
+    return {"value": value}
+
+
+def double(policy, a):
+    calls.append("b")
+    return a["value"] * 2
+
+
+def square(policy, a):
+    calls.append("c")
+    return a["value"] ** 2
+
+
+def square_again(policy, a):
+    calls.append("c2")
+    return a["value"] * a["value"]
+
+
+def cube(policy, a):
+    calls.append("c3")
+    return a["value"] ** 3
+
+
+def total(policy, b, c):
+    calls.append("d")
+    return b + c
+
+
+def diamond(value=3, c=square):
+    return Pipeline(
+        [
+            Stage("a", source, params={"value": value}),
+            Stage("b", double, deps=("a",)),
+            Stage("c", c, deps=("a",)),
+            Stage("d", total, deps=("b", "c")),
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_rerun_is_served_from_cache(tmp_path):
+    cache = StageCache(tmp_path)
+    first = diamond().run(cache=cache)
+    assert first.values["d"] == 15 and sorted(first.computed) == ["a", "b", "c", "d"]
+    calls.clear()
+    second = diamond().run(cache=cache)
+    assert calls == [] and second.values["d"] == 15
+    assert second.addresses == first.addresses
+
+
+def test_changed_stage_recomputes_only_downstream(tmp_path):
+    cache = StageCache(tmp_path)
+    diamond().run(cache=cache)
+    calls.clear()
+    run = diamond(c=cube).run(cache=cache)
+    assert sorted(run.computed) == ["c", "d"] and run.values["d"] == 33
+    calls.clear()
+    # Same output from new code: downstream keys follow content and stay cached.
+    run = diamond(c=square_again).run(cache=cache)
+    assert run.computed == ["c"] and "d" in run.cached
+
+
+def test_policy_is_part_of_the_key(tmp_path):
+    cache = StageCache(tmp_path)
+    diamond().run(cache=cache)
+    run = diamond().run(NumericPolicy(tol_abs=1e-6), cache=cache)
+    assert sorted(run.computed) == ["a", "b", "c", "d"]
+
+
+def test_independent_branches_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def left(policy, a):
+        barrier.wait()
+        return 1
+
+    def right(policy, a):
+        barrier.wait()
+        return 2
+
+    pipeline = Pipeline(
+        [
+            Stage("a", source, params={"value": 1}),
+            Stage("b", left, deps=("a",)),
+            Stage("c", right, deps=("a",)),
+            Stage("d", total, deps=("b", "c")),
+        ]
+    )
+    assert pipeline.run(max_workers=2).values["d"] == 3
+
+
+def test_graph_errors():
+    with pytest.raises(PipelineError, match="unknown"):
+        Pipeline([Stage("b", double, deps=("a",))])
+    with pytest.raises(PipelineError, match="cycle"):
+        Pipeline([Stage("a", double, deps=("b",)), Stage("b", double, deps=("a",))])
+    with pytest.raises(PipelineError, match="stage 'b' failed"):
+        Pipeline(
+            [Stage("a", source, params={"value": "x"}), Stage("b", square, deps=("a",))]
+        ).run(max_workers=1)
+
+
+def toric_output(policy, fusion_input):
+    calls.append("compute")
+    expected = json.loads((EXAMPLES / "umtc_output.min.json").read_text())
+    fields = ("objects", "qdim", "global_dim", "twist", "S", "T")
+    output = {key: expected[key] for key in fields}
+    output.update(
+        format="ac-umtc",
+        version="0.1",
+        encoding="float",
+        number_field=fusion_input["number_field"],
+        category_type="umtc",
+        checks={},
+    )
+    return output
+
+
+def test_umtc_pipeline_end_to_end(tmp_path):
+    pytest.importorskip("numpy")
+    cache = StageCache(tmp_path / "cache")
+    target = tmp_path / "out" / "toric.json"
+    pipeline = umtc_pipeline(
+        EXAMPLES / "toric_umtc_input.min.json", target, toric_output
+    )
+    run = pipeline.run(cache=cache)
+    written = json.loads(target.read_text())
+    assert written["checks"]["modular"]["status"] is True
+    assert written["checks"]["verlinde"]["status"] is True
+    assert written["provenance"]["sources"][0].endswith("toric_umtc_input.min.json")
+    assert run.values["write"]["hashes"] == written["hashes"]
+
+    calls.clear()
+    again = pipeline.run(cache=cache)
+    assert calls == [] and {"compute", "check:modular"} <= set(again.cached)
+    assert sorted(again.computed) == ["load", "write"]
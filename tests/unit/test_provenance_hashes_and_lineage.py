@@ -81,3 +81,37 @@ def test_hash_error_on_nan_bubbles_as_dataioerror(tmp_path: pathlib.Path) -> Non
 
     with pytest.raises(DataIOError):
         write_umtc_output(out_bad, payload)
+
+
+def test_parallel_hashes_match_serial_and_report_timings() -> None:
+    from anyon_condense.core.hashing import attach_hashes_inplace
+
+    serial = _payload_without_prov_and_hash()
+    parallel = _payload_without_prov_and_hash()
+    serial_hashes = attach_hashes_inplace(serial)
+
+    timings: dict = {}
+    parallel_hashes = attach_hashes_inplace(
+        parallel, parallel=True, max_workers=2, process_threshold=16, timings=timings
+    )
+
+    assert parallel_hashes == serial_hashes
+    assert list(parallel_hashes) == list(serial_hashes)
+    assert set(timings) == {"objects", "qdim", "global_dim", "twist", "S", "T"}
+    assert all(seconds >= 0.0 for seconds in timings.values())
+
+    again: dict = {}
+    attach_hashes_inplace(parallel, parallel=True, timings=again)
+    assert again == {}
+
+
+def test_write_with_parallel_hashes(tmp_path: pathlib.Path) -> None:
+    out_serial = tmp_path / "serial.json"
+    out_parallel = tmp_path / "parallel.json"
+    write_umtc_output(out_serial, _payload_without_prov_and_hash())
+    write_umtc_output(
+        out_parallel, _payload_without_prov_and_hash(), parallel_hashes=True
+    )
+    serial = json.loads(out_serial.read_text(encoding="utf-8"))["hashes"]
+    parallel = json.loads(out_parallel.read_text(encoding="utf-8"))["hashes"]
+    assert serial == parallel
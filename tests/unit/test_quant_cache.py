@@ -0,0 +1,90 @@
+import math
+
+import pytest
+
+from anyon_condense.core.exceptions import NumericFieldError
+from anyon_condense.core.numdump import normalize_payload_numbers
+from anyon_condense.scalars import (
+    clear_quant_cache,
+    configure_quant_cache,
+    quant_cache_info,
+)
+from anyon_condense.scalars.numeric_policy import (
+    NumericPolicy,
+    format_float,
+    reorder_scalar_array,
+)
+from anyon_condense.scalars.quant_cache import DEFAULT_MAXSIZE, QuantCache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_quant_cache()
+    yield
+    configure_quant_cache(DEFAULT_MAXSIZE)
+    clear_quant_cache()
+
+
+def test_repeated_values_hit_the_cache():
+    policy = NumericPolicy(fmt="fixed", precision=4)
+    payload = {"S": [[0.5, -0.5], [0.5, -0.5]], "twist": {"a": 0.5, "b": 1.0}}
+
+    out = normalize_payload_numbers(payload, policy, engine="decimal")
+    assert out["S"] == [[0.5, -0.5], [0.5, -0.5]]
+
+    info = quant_cache_info()
+    assert info.misses == 3
+    assert info.hits == 3
+    assert info.currsize == 3
+
+
+def test_cache_shared_by_format_and_reorder():
+    policy = NumericPolicy(array_reorder=True)
+    assert format_float(0.25, policy) == format_float(0.25, policy) == "0.250000000000"
+    assert reorder_scalar_array([1.0, -0.0, 1.0], policy) == [0.0, 1.0, 1.0]
+
+    info = quant_cache_info()
+    assert info.hits == 2
+    assert info.misses == 3
+
+
+def test_keys_use_raw_bits_and_policy():
+    cache = QuantCache(maxsize=8)
+    seen = []
+
+    def compute(x, policy):
+        seen.append((math.copysign(1.0, x), policy))
+        return x
+
+    policy_a = NumericPolicy(precision=3)
+    policy_b = NumericPolicy(precision=4)
+    cache.lookup("k", 0.0, policy_a, compute)
+    cache.lookup("k", -0.0, policy_a, compute)
+    cache.lookup("k", 0.0, policy_b, compute)
+    cache.lookup("k", 0.0, NumericPolicy(precision=3), compute)
+    assert len(seen) == 3
+    assert cache.info().hits == 1
+
+
+def test_lru_bound_and_disable():
+    cache = QuantCache(maxsize=2)
+    policy = NumericPolicy()
+    for value in (1.0, 2.0, 1.0, 3.0):
+        cache.lookup("k", value, policy, lambda x, _p: x)
+    assert cache.info().currsize == 2
+    cache.lookup("k", 2.0, policy, lambda x, _p: x)
+    assert cache.info().hits == 1 and cache.info().misses == 4
+
+    configure_quant_cache(0)
+    format_float(0.5, policy)
+    format_float(0.5, policy)
+    assert quant_cache_info().currsize == 0
+    assert quant_cache_info().hits == 0
+
+
+def test_errors_are_not_cached():
+    policy = NumericPolicy()
+    for _ in range(2):
+        with pytest.raises(NumericFieldError):
+            normalize_payload_numbers({"x": math.inf}, policy, engine="decimal")
+    assert quant_cache_info().currsize == 0
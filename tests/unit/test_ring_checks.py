@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import (
+    FusionRing,
+    check_fusion_payload,
+    check_fusion_ring,
+)
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def load(name):
+    return json.loads((EXAMPLES / name).read_text())
+
+
+def s3_ring():
+    perms = list(itertools.permutations(range(3)))
+    index = {p: i for i, p in enumerate(perms)}
+    triples = [
+        (index[p], index[q], index[tuple(p[q[i]] for i in range(3))], 1)
+        for p in perms
+        for q in perms
+    ]
+    dual = [index[tuple(sorted(range(3), key=p.__getitem__))] for p in perms]
+    return FusionRing([str(p) for p in perms], triples, dual)
+
+
+def su2(k, drop=None):
+    levels = range(k + 1)
+    triples = [
+        (a, b, c, 1)
+        for a in levels
+        for b in levels
+        for c in range(abs(a - b), min(a + b, 2 * k - a - b) + 1, 2)
+        if (a, b, c) != drop
+    ]
+    return FusionRing([str(j) for j in levels], triples, list(levels))
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["ising_umtc_input.json", "toric_umtc_input.min.json", "Vec_Z2_mfusion.json"],
+)
+def test_examples_are_consistent(name):
+    report = check_fusion_payload(load(name), NumericPolicy())
+    assert report["status"] is True, report.get("notes")
+    assert report["metrics"] == {
+        "assoc_violations": 0.0,
+        "max_err_assoc": 0.0,
+        "comm_violations": 0.0,
+        "dual_violations": 0.0,
+    }
+
+
+def test_broken_ising_is_not_associative():
+    payload = load("ising_umtc_input.json")
+    payload["fusion_rules"]["(sigma,sigma)"] = {"1": 1}
+    report = check_fusion_payload(payload, NumericPolicy())
+    assert report["status"] is False
+    assert report["metrics"]["assoc_violations"] > 0
+    assert "not associative" in report["notes"]
+
+
+def test_commutativity_only_required_when_asked():
+    ring = s3_ring()
+    relaxed = check_fusion_ring(ring, NumericPolicy())
+    assert relaxed["status"] is True and relaxed["metrics"]["comm_violations"] > 0
+    strict = check_fusion_ring(ring, NumericPolicy(), require_commutative=True)
+    assert strict["status"] is False and "not commutative" in strict["notes"]
+
+
+def test_dual_violations():
+    payload = load("toric_umtc_input.min.json")
+    bad = copy.deepcopy(payload)
+    bad["dual"] = {"1": "1", "e": "m", "m": "e", "em": "em"}
+    report = check_fusion_payload(bad, NumericPolicy())
+    assert report["status"] is False and report["metrics"]["dual_violations"] > 0
+    assert "delta(b, dual(a))" in report["notes"]
+
+
+def test_probe_engine_matches_exact_engine():
+    policy = NumericPolicy()
+    good = su2(20)
+    probe = check_fusion_ring(good, policy, engine="probe")
+    assert probe["status"] is True
+    assert probe["notes"] == "associativity screened with random probes"
+
+    broken = su2(20, drop=(5, 7, 4))
+    exact = check_fusion_ring(broken, policy, engine="exact")
+    screened = check_fusion_ring(broken, policy, engine="probe")
+    assert exact["metrics"] == screened["metrics"]
+    assert exact["metrics"]["assoc_violations"] > 0
+    with pytest.raises(ValueError, match="engine"):
+        check_fusion_ring(good, policy, engine="blas")
@@ -0,0 +1,174 @@
+import copy
+import json
+import pathlib
+
+import pytest
+from jsonschema import Draft202012Validator
+
+import anyon_condense.core.schema as schema_mod
+from anyon_condense.core.exceptions import SchemaError
+from anyon_condense.core.schema import load_schema, validate
+from anyon_condense.core.schema_fast import compile_schema
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+EXAMPLES_DIR = ROOT / "tests" / "examples"
+
+CASES = [
+    ("mfusion_input.schema.json", "Vec_Z2_mfusion.json"),
+    ("mfusion_input.schema.json", "rep_d8_mfusion.json"),
+    ("mfusion_input.schema.json", "bad_mfusion_missing_dual.json"),
+    ("mfusion_input.schema.json", "bad_mfusion_bad_key.json"),
+    ("umtc_input.schema.json", "toric_umtc_input.min.json"),
+    ("umtc_input.schema.json", "ising_umtc_input.json"),
+    ("umtc_output.schema.json", "umtc_output.min.json"),
+    ("umtc_output.schema.json", "bad_umtc_output_missing_provenance.json"),
+    ("umtc_output.schema.json", "bad_umtc_output_extra_topkey.json"),
+]
+
+
+def _load(name: str) -> dict:
+    return json.loads((EXAMPLES_DIR / name).read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("schema_name, example", CASES)
+def test_fast_path_matches_jsonschema_on_examples(
+    schema_name: str, example: str
+) -> None:
+    schema = load_schema(schema_name)
+    check = compile_schema(schema)
+    assert check is not None
+    payload = _load(example)
+    assert check(payload) == Draft202012Validator(schema).is_valid(payload)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda p: p["S"][0].append(True),
+        lambda p: p["S"].append([]),
+        lambda p: p["qdim"].update({"": 1}),
+        lambda p: p["twist"].update({"x": ""}),
+        lambda p: p["provenance"].pop("sources"),
+        lambda p: p.update({"number_field": "cyclotomic(0)"}),
+        lambda p: p.update({"objects": ["a", "a"]}),
+    ],
+)
+def test_fast_path_rejects_invalid_output(mutate) -> None:
+    schema = load_schema("umtc_output.schema.json")
+    check = compile_schema(schema)
+    assert check is not None
+    payload = copy.deepcopy(_load("umtc_output.min.json"))
+    mutate(payload)
+    assert not check(payload)
+    assert not Draft202012Validator(schema).is_valid(payload)
+
+
+def test_fast_path_is_conservative() -> None:
+    # Integral floats are integers to jsonschema; the fast path defers.
+    check = compile_schema({"type": "integer"})
+    assert check is not None and not check(1.0)
+    validate(_load("Vec_Z2_mfusion.json"), "mfusion_input.schema.json")
+
+
+def test_unsupported_keywords_do_not_compile() -> None:
+    assert compile_schema({"type": "object", "dependentRequired": {}}) is None
+    assert compile_schema({"$ref": "other.schema.json#/x"}) is None
+
+
+def test_one_of_requires_disjoint_exact_branches() -> None:
+    # jsonschema matches 1.0 against both branches, the fast "integer"
+    # check against one only; overlapping or inexact branches must not
+    # compile, or the match count would wrongly accept it.
+    schema = {"oneOf": [{"type": "integer"}, {"type": "number"}]}
+    assert not Draft202012Validator(schema).is_valid(1.0)
+    assert compile_schema(schema) is None
+    assert compile_schema({"oneOf": [{"type": "number"}, {"minimum": 0}]}) is None
+    check = compile_schema({"oneOf": [{"type": "number"}, {"type": "string"}]})
+    assert check is not None
+    assert check(1.0) and check("x") and not check(None)
+
+
+def test_validate_selects_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = _load("umtc_output.min.json")
+    calls = []
+    real = schema_mod.SchemaRegistry.validator
+
+    def spy(self, name):
+        calls.append(name)
+        return real(self, name)
+
+    monkeypatch.setattr(schema_mod.SchemaRegistry, "validator", spy)
+    validate(payload, "umtc_output.schema.json")
+    assert calls == []
+    validate(payload, "umtc_output.schema.json", fast=False)
+    assert calls == ["umtc_output.schema.json"]
+
+
+def test_fast_rejection_reports_jsonschema_error() -> None:
+    payload = _load("bad_umtc_output_extra_topkey.json")
+    with pytest.raises(SchemaError, match="Schema validation error"):
+        validate(payload, "umtc_output.schema.json")
+
+
+def test_incremental_revalidates_only_changed_subtrees(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    schema_mod.clear_caches()
+    payload = _load("umtc_output.min.json")
+    validate(payload, "umtc_output.schema.json", incremental=True)
+
+    seen = []
+    real = schema_mod._check
+
+    def spy(value, *args, **kwargs):
+        prefix = args[4] if len(args) > 4 else kwargs.get("prefix", ())
+        seen.append(prefix)
+        return real(value, *args, **kwargs)
+
+    monkeypatch.setattr(schema_mod, "_check", spy)
+    changed = copy.deepcopy(payload)
+    changed["checks"] = {"modular": {"status": "ok"}}
+    validate(changed, "umtc_output.schema.json", incremental=True)
+    assert seen == [(), ("checks",)]
+
+
+def test_incremental_still_rejects() -> None:
+    schema_mod.clear_caches()
+    payload = _load("umtc_output.min.json")
+    validate(payload, "umtc_output.schema.json", incremental=True)
+
+    bad = copy.deepcopy(payload)
+    bad["S"][0][0] = None
+    with pytest.raises(SchemaError, match=r"at S → 0 → 0"):
+        validate(bad, "umtc_output.schema.json", incremental=True)
+
+    missing = copy.deepcopy(payload)
+    del missing["provenance"]
+    with pytest.raises(SchemaError, match="provenance"):
+        validate(missing, "umtc_output.schema.json", incremental=True)
+
+    extra = _load("bad_umtc_output_extra_topkey.json")
+    with pytest.raises(SchemaError):
+        validate(extra, "umtc_output.schema.json", incremental=True)
+
+
+def test_incremental_never_accepts_what_full_validation_rejects() -> None:
+    # Canonical JSON cannot tell a tuple from a list; the tuple must not hit
+    # the cache entry of the list it dumps like.
+    schema_mod.clear_caches()
+    payload = _load("ising_umtc_input.json")
+    validate(payload, "umtc_input.schema.json", incremental=True)
+
+    changed = copy.deepcopy(payload)
+    changed["simple_objects"] = tuple(changed["simple_objects"])
+    with pytest.raises(SchemaError, match="is not of type 'array'"):
+        validate(changed, "umtc_input.schema.json", fast=False)
+    with pytest.raises(SchemaError, match="is not of type 'array'"):
+        validate(changed, "umtc_input.schema.json", incremental=True)
+
+
+def test_fingerprint_skips_non_json_containers() -> None:
+    assert schema_mod._subtree_fingerprint({"a": [1, "x", None]}) is not None
+    assert schema_mod._subtree_fingerprint(("a",)) is None
+    assert schema_mod._subtree_fingerprint({1: "x"}) is None
+    assert schema_mod._subtree_fingerprint([{"a": ("b",)}]) is None
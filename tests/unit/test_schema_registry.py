@@ -0,0 +1,90 @@
+import json
+import pathlib
+
+import pytest
+
+from anyon_condense.core import schema as sc
+from anyon_condense.core.exceptions import SchemaError
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+EXAMPLES_DIR = ROOT / "tests" / "examples"
+
+DRAFT = "https://json-schema.org/draft/2020-12/schema"
+
+
+def _write(directory: pathlib.Path, name: str, schema: dict) -> None:
+    (directory / name).write_text(json.dumps(schema), encoding="utf-8")
+
+
+@pytest.fixture
+def linked_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    _write(
+        tmp_path,
+        "base.schema.json",
+        {
+            "$id": "https://example.org/schemas/base.schema.json",
+            "$schema": DRAFT,
+            "$defs": {"positive": {"type": "integer", "minimum": 1}},
+        },
+    )
+    _write(
+        tmp_path,
+        "top.schema.json",
+        {
+            "$id": "https://example.org/schemas/top.schema.json",
+            "$schema": DRAFT,
+            "type": "object",
+            "required": ["n"],
+            "properties": {"n": {"$ref": "base.schema.json#/$defs/positive"}},
+        },
+    )
+    return tmp_path
+
+
+def test_registry_is_process_wide_and_indexed_by_id() -> None:
+    sc.clear_caches()
+    registry = sc.get_registry()
+    assert sc.get_registry() is registry
+    schema = registry.schema("umtc_output.schema.json")
+    assert registry.by_id(schema["$id"]) is schema
+
+
+def test_warm_up_compiles_everything() -> None:
+    sc.clear_caches()
+    names = sc.warm_up()
+    assert {"mfusion_input.schema.json", "umtc_output.schema.json"} <= set(names)
+    registry = sc.get_registry()
+    for name in names:
+        assert registry.fast(name) is not None
+
+
+def test_validate_does_not_stat_after_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    sc.clear_caches()
+    sc.warm_up()
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("filesystem access on the hot path")
+
+    monkeypatch.setattr(pathlib.Path, "is_dir", forbidden)
+    monkeypatch.setattr(pathlib.Path, "is_file", forbidden)
+    monkeypatch.setattr(pathlib.Path, "resolve", forbidden)
+    payload = json.loads((EXAMPLES_DIR / "Vec_Z2_mfusion.json").read_text("utf-8"))
+    sc.validate(payload, "mfusion_input.schema.json")
+    bad = json.loads(
+        (EXAMPLES_DIR / "bad_mfusion_missing_dual.json").read_text("utf-8")
+    )
+    with pytest.raises(SchemaError):
+        sc.validate(bad, "mfusion_input.schema.json")
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_cross_file_ref(linked_dir: pathlib.Path, fast: bool) -> None:
+    sc.validate({"n": 3}, "top.schema.json", linked_dir, fast=fast)
+    with pytest.raises(SchemaError, match="minimum"):
+        sc.validate({"n": 0}, "top.schema.json", linked_dir, fast=fast)
+
+
+def test_cross_file_ref_compiles(linked_dir: pathlib.Path) -> None:
+    check = sc.get_registry(linked_dir).fast("top.schema.json")
+    assert check is not None
+    assert check({"n": 2}) and not check({"n": 0})
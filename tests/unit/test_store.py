@@ -0,0 +1,182 @@
+import copy
+import gzip
+import json
+import os
+import pathlib
+import shutil
+
+import pytest
+
+import anyon_condense.core.io as io_mod
+import anyon_condense.core.provenance as provenance_mod
+from anyon_condense.core.hashing import content_address
+from anyon_condense.core.io import load_umtc_input, write_umtc_output
+from anyon_condense.core.store import ArtifactStore
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+EXAMPLES_DIR = ROOT / "tests" / "examples"
+
+
+def test_put_get_roundtrip_and_layout(tmp_path: pathlib.Path) -> None:
+    store = ArtifactStore(tmp_path)
+    value = {"S": [[1, 0], [0, 1]], "label": "τ"}
+    address = store.put(value, "demo")
+
+    assert address == content_address(value, "demo")
+    assert address in store
+    digest = address.split(":")[-1]
+    assert store.path_for(address) == tmp_path / "demo" / digest[:2] / f"{digest}.json"
+    assert store.get(address) == value
+    assert not list(tmp_path.rglob(".tmp-*"))
+
+
+def test_missing_address(tmp_path: pathlib.Path) -> None:
+    store = ArtifactStore(tmp_path)
+    missing = content_address({"x": 1}, "demo")
+    assert store.get(missing, None) is None
+    with pytest.raises(KeyError):
+        store.get(missing)
+    with pytest.raises(ValueError):
+        store.path_for("not-an-address")
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "../../escape:sha256:" + "a" * 64,
+        "..:sha256:" + "a" * 64,
+        "demo:sha256:" + "../" * 21 + "a",
+        "demo/../..:sha256:" + "a" * 64,
+    ],
+)
+def test_addresses_cannot_escape_root(tmp_path: pathlib.Path, address: str) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    with pytest.raises(ValueError):
+        store.path_for(address)
+    with pytest.raises(ValueError):
+        store.get(address)
+    with pytest.raises(ValueError):
+        store.put({"x": 1}, "../../escape")
+    assert not (tmp_path / "escape").exists()
+
+
+def test_compressed_payloads(tmp_path: pathlib.Path) -> None:
+    plain = ArtifactStore(tmp_path)
+    packed = ArtifactStore(tmp_path, compress=True)
+    value = {"data": list(range(200))}
+    address = packed.put(value, "demo")
+
+    path = packed.path_for(address)
+    assert path is not None and path.name.endswith(".json.gz")
+    assert json.loads(gzip.decompress(path.read_bytes())) == value
+    assert plain.get(address) == value
+
+
+def test_lru_eviction(tmp_path: pathlib.Path) -> None:
+    store = ArtifactStore(tmp_path)
+    first = store.put({"n": 0, "pad": "x" * 100}, "demo")
+    second = store.put({"n": 1, "pad": "x" * 100}, "demo")
+    for i, address in enumerate([first, second]):
+        path = store.path_for(address)
+        assert path is not None
+        os.utime(path, (1000 + i, 1000 + i))
+    store.get(first)  # refreshes first; second is now the oldest
+
+    size = store.size_bytes()
+    bounded = ArtifactStore(tmp_path, max_bytes=size)
+    third = bounded.put({"n": 2, "pad": "x" * 100}, "demo")
+
+    assert second not in bounded
+    assert first in bounded and third in bounded
+    assert bounded.size_bytes() <= size
+
+
+def test_load_uses_store_without_validating(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    path = EXAMPLES_DIR / "toric_umtc_input.min.json"
+    first = load_umtc_input(path, store=store)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("validator called on a cache hit")
+
+    monkeypatch.setattr(io_mod, "_validate_or_raise", fail)
+    assert load_umtc_input(path, store=store) == first
+
+
+def test_load_misses_when_schema_changes(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    path = EXAMPLES_DIR / "toric_umtc_input.min.json"
+    load_umtc_input(path, store=store)
+
+    schemas = tmp_path / "schemas"
+    shutil.copytree(ROOT / "schemas", schemas)
+    schema_path = schemas / "umtc_input.schema.json"
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    schema["$comment"] = "edited"
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    monkeypatch.setenv("AC_SCHEMA_DIR", str(schemas))
+
+    calls = []
+    monkeypatch.setattr(
+        io_mod, "_validate_or_raise", lambda *args, **kwargs: calls.append(args)
+    )
+    load_umtc_input(path, store=store)
+    assert len(calls) == 1
+
+
+def test_write_uses_store(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    payload = json.loads(
+        (EXAMPLES_DIR / "umtc_output.min.json").read_text(encoding="utf-8")
+    )
+    payload.pop("provenance", None)
+    payload.pop("hashes", None)
+    payload["_sources"] = [str(EXAMPLES_DIR / "toric_umtc_input.min.json")]
+    again = copy.deepcopy(payload)
+
+    monkeypatch.setattr(provenance_mod, "_iso_utc_now", lambda: "2024-01-01T00:00:00Z")
+    write_umtc_output(tmp_path / "a.json", payload, store=store)
+
+    monkeypatch.setattr(provenance_mod, "_iso_utc_now", lambda: "2024-06-01T00:00:00Z")
+    monkeypatch.setattr(io_mod, "_validate_or_raise", None)
+    monkeypatch.setattr(io_mod, "attach_hashes_inplace", None)
+    write_umtc_output(tmp_path / "b.json", again, store=store)
+
+    # The hit reuses hashes and validation but stamps fresh provenance.
+    assert again["provenance"]["date"] == "2024-06-01T00:00:00Z"
+    assert again["provenance"]["sources"] == payload["provenance"]["sources"]
+    assert "_sources" not in again
+    again.pop("provenance")
+    payload.pop("provenance")
+    assert again == payload
+    written = json.loads((tmp_path / "b.json").read_bytes())
+    assert written["provenance"]["date"] == "2024-06-01T00:00:00Z"
+
+
+def test_eviction_uses_index_not_rescans(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path, max_bytes=10_000)
+    first = store.put({"n": 0}, "demo")
+    assert store.size_bytes() > 0
+
+    def fail(self: ArtifactStore) -> None:
+        raise AssertionError("store rescanned after first use")
+
+    monkeypatch.setattr(ArtifactStore, "_files", fail)
+    hot = store.put({"hot": True}, "demo")
+    addresses = []
+    for i in range(30):
+        addresses.append(store.put({"n": i, "pad": "x" * 1000}, "demo"))
+        store.get(hot)  # kept recent, so never evicted
+
+    assert first not in store and addresses[0] not in store
+    assert hot in store and addresses[-1] in store
+    assert store.size_bytes() <= 10_000
+    assert store.size_bytes() == sum(p.stat().st_size for p in tmp_path.rglob("*.json"))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from anyon_condense.algorithms import FusionRing, check_verlinde, check_verlinde_payload
+from anyon_condense.scalars.numeric_policy import NumericPolicy
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def load(name):
+    return json.loads((EXAMPLES / name).read_text())
+
+
+def su2(k):
+    levels = range(k + 1)
+    triples = [
+        (a, b, c, 1)
+        for a in levels
+        for b in levels
+        for c in range(abs(a - b), min(a + b, 2 * k - a - b) + 1, 2)
+    ]
+    ring = FusionRing([str(j) for j in levels], triples, list(levels))
+    q = math.pi / (k + 2)
+    s = np.array(
+        [
+            [math.sqrt(2 / (k + 2)) * math.sin((i + 1) * (j + 1) * q) for j in levels]
+            for i in levels
+        ]
+    )
+    return ring, s
+
+
+def test_toric_output_matches_input_fusion_rules():
+    report = check_verlinde_payload(
+        load("umtc_output.min.json"), load("toric_umtc_input.min.json"), NumericPolicy()
+    )
+    assert report["status"] is True
+    assert report["metrics"]["total_triples"] == 64.0
+    assert report["metrics"]["max_err_verlinde"] < 1e-12
+    assert "policy_snapshot" in report and "notes" not in report
+
+
+def test_chunking_over_c_does_not_change_result():
+    ring, s = su2(12)
+    whole = check_verlinde(s, ring, NumericPolicy())
+    for chunk in (1, 13 * 13 * 3, 10**9):
+        assert check_verlinde(s, ring, NumericPolicy(), chunk_elements=chunk) == whole
+    assert whole["status"] is True and whole["metrics"]["total_triples"] == 13.0**3
+
+
+def test_permuted_objects_and_broken_s():
+    ring = FusionRing.from_payload(load("ising_umtc_input.json"))
+    r = math.sqrt(2) / 2
+    # Rows/columns given in the order sigma, 1, psi.
+    s = [[0.0, r, -r], [r, 0.5, 0.5], [-r, 0.5, 0.5]]
+    objects = ["sigma", "1", "psi"]
+    assert check_verlinde(s, ring, NumericPolicy(), objects=objects)["status"] is True
+    assert check_verlinde(s, ring, NumericPolicy())["status"] is False
+
+    s[0][0] = 0.1
+    report = check_verlinde(s, ring, NumericPolicy(), objects=objects, worst=2)
+    assert report["status"] is False
+    assert report["metrics"]["failed_triples"] > 0
+    assert report["notes"].startswith("Verlinde mismatch, worst (a,b;c): (")
+
+
+def test_invalid_s_is_reported_not_raised():
+    ring = FusionRing.from_payload(load("ising_umtc_input.json"))
+    assert "3x3" in check_verlinde([[1.0]], ring, NumericPolicy())["notes"]
+    zero_unit_row = [[0.0, 0.5, 0.5], [0.5, 0.5, 0.5], [0.5, 0.5, 0.5]]
+    report = check_verlinde(zero_unit_row, ring, NumericPolicy())
+    assert report["status"] is False and "unit row" in report["notes"]
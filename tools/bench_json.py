@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Read/write throughput of the JSON codecs on a large UMTC output."""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys as _sys
+import tempfile
+import time
+from typing import Callable
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in _sys.path:
+    _sys.path.insert(0, str(_ROOT))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="bench_json",
+        description="Compare core.jsoncodec backends on a synthetic ac-umtc output.",
+    )
+    parser.add_argument("--rank", type=int, default=256, help="objects in the output")
+    parser.add_argument("--repeat", type=int, default=5, help="timed iterations")
+    return parser.parse_args(argv)
+
+
+def bench(func: Callable[[], object], repeat: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: list[str] | None = None) -> int:
+    from bench_schema import umtc_output
+
+    from anyon_condense.core import jsoncodec
+
+    args = parse_args(argv)
+    payload = umtc_output(args.rank)
+    reference = jsoncodec.set_codec("stdlib").dumps(payload, indent=True)
+    print(f"payload: rank {args.rank}, {len(reference) / 1e6:.2f} MB indented")
+    print(
+        f"{'codec':<8} {'read MB/s':>10} {'write MB/s':>11} {'write (compact)':>16} "
+        f"{'size':>9} {'same':>5}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "out.json"
+        for name in jsoncodec.available_codecs():
+            codec = jsoncodec.set_codec(name)
+            data = codec.dumps(payload, indent=True)
+            path.write_bytes(data)
+            read = bench(lambda: codec.loads(path.read_bytes()), args.repeat)
+            write = bench(
+                lambda: path.write_bytes(codec.dumps(payload, indent=True)),
+                args.repeat,
+            )
+            compact = bench(lambda: codec.dumps(payload), args.repeat)
+            size = len(codec.dumps(payload))
+            same = codec.loads(data) == payload
+            print(
+                f"{name:<8} {len(data) / read / 1e6:>10.1f} "
+                f"{len(data) / write / 1e6:>11.1f} {size / compact / 1e6:>16.1f} "
+                f"{size / 1e6:>7.2f}MB {str(same):>5}"
+            )
+    jsoncodec.set_codec()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
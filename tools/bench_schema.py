@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Compare the compiled fast-path validator with plain jsonschema."""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys as _sys
+import time
+from typing import Any, Callable, Dict
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in _sys.path:
+    _sys.path.insert(0, str(_ROOT))
+
+EXAMPLES_DIR = _ROOT / "tests" / "examples"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="bench_schema",
+        description="Time core.schema.validate: jsonschema, fast path, incremental.",
+    )
+    parser.add_argument("--rank", type=int, default=64, help="objects in the output")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations")
+    return parser.parse_args(argv)
+
+
+def umtc_output(rank: int) -> Dict[str, Any]:
+    """Synthetic ac-umtc output with string and float scalars."""
+
+    labels = [f"a{i}" for i in range(rank)]
+    return {
+        "format": "ac-umtc",
+        "version": "0.1",
+        "encoding": "float",
+        "number_field": "cyclotomic(8)",
+        "category_type": "umtc",
+        "objects": labels,
+        "qdim": {label: 1.0 for label in labels},
+        "global_dim": float(rank),
+        "twist": {label: f"{i / rank:.6f}+0.5j" for i, label in enumerate(labels)},
+        "S": [[(i * j % 7) / rank for j in range(rank)] for i in range(rank)],
+        "T": [[("1" if i == j else 0) for j in range(rank)] for i in range(rank)],
+        "checks": {},
+        "hashes": {},
+        "provenance": {
+            "generated_by": "bench",
+            "date": "2024-01-01T00:00:00Z",
+            "sources": ["bench"],
+        },
+    }
+
+
+def bench(func: Callable[[], None], repeat: int) -> float:
+    func()  # warm caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: list[str] | None = None) -> int:
+    from anyon_condense.core import jsoncodec
+    from anyon_condense.core.schema import validate
+
+    args = parse_args(argv)
+    cases = [
+        ("mfusion_input.schema.json", "rep_d8_mfusion.json"),
+        ("umtc_input.schema.json", "ising_umtc_input.json"),
+    ]
+    payloads = [
+        (schema, name, jsoncodec.loads((EXAMPLES_DIR / name).read_bytes()))
+        for schema, name in cases
+    ]
+    payloads.append(
+        (
+            "umtc_output.schema.json",
+            f"synthetic rank {args.rank}",
+            umtc_output(args.rank),
+        )
+    )
+
+    print(
+        f"{'schema':<26} {'payload':<24} {'jsonschema':>12} {'fast':>12} {'speedup':>8}"
+    )
+    for schema, name, payload in payloads:
+        slow = bench(lambda: validate(payload, schema, fast=False), args.repeat)
+        fast = bench(lambda: validate(payload, schema, fast=True), args.repeat)
+        print(
+            f"{schema:<26} {name:<24} {slow * 1e3:>10.3f}ms {fast * 1e3:>10.3f}ms "
+            f"{slow / fast:>7.1f}x"
+        )
+
+    # Checkpoint writes: only ``checks`` differs between successive payloads.
+    output = payloads[-1][2]
+    counter = iter(range(1 << 30))
+
+    def checkpoint(**mode: Any) -> None:
+        output["checks"] = {"step": next(counter)}
+        validate(output, "umtc_output.schema.json", **mode)
+
+    full = bench(lambda: checkpoint(), args.repeat)
+    delta = bench(lambda: checkpoint(incremental=True), args.repeat)
+    print(
+        f"{'checkpoint (checks only)':<51} {full * 1e3:>10.3f}ms "
+        f"{delta * 1e3:>10.3f}ms {full / delta:>7.1f}x  (fast vs incremental)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict
 
+from anyon_condense.core import jsoncodec
 from anyon_condense.core.exceptions import CanonicalizationError, NumericFieldError
 from anyon_condense.core.hashing import sha256_of_payload
 from anyon_condense.core.numdump import normalize_payload_numbers
@@ -39,8 +40,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def _read_json(path: Path) -> Any:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return jsoncodec.loads(path.read_bytes())
     except FileNotFoundError:
         print(f"[demo] File not found: {path}", file=sys.stderr)
         raise SystemExit(2)
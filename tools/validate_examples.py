@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import json
 import pathlib
 import sys as _sys
 
@@ -22,6 +21,7 @@ CASES = [
     ("mfusion_input.schema.json", "bad_mfusion_bad_key.json", True),
     ("umtc_input.schema.json", "toric_umtc_input.min.json", False),
     ("umtc_input.schema.json", "ising_umtc_input.min.json", False),
+    ("umtc_input.schema.json", "ising_umtc_input.json", False),
     ("umtc_output.schema.json", "umtc_output.min.json", False),
     ("umtc_output.schema.json", "bad_umtc_output_missing_provenance.json", True),
     ("umtc_output.schema.json", "bad_umtc_output_extra_topkey.json", True),
@@ -29,7 +29,9 @@ CASES = [
 
 
 def load_json(example_name: str) -> dict:
-    return json.loads((EXAMPLES_DIR / example_name).read_text(encoding="utf-8"))
+    from anyon_condense.core import jsoncodec  # noqa: WPS433
+
+    return jsoncodec.loads((EXAMPLES_DIR / example_name).read_bytes())
 
 
 def _get_ac_api():